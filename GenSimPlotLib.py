@@ -1,2168 +1,3130 @@
-# -*- coding: utf-8 -*-
-"""
-Package:   GenSimPlot
-File:      GenSimPlotLib.py
-Version:   2.1
-Author:    Milan Koren
-Year:      2024
-URL:       https://github.com/milan-koren/GenSimPlot
-License:   EUPL v1.2 (European Union Public License), https://eupl.eu/
-
-The implementation of various classes for creating different types of simulation plots, 
-such as squares, circles, rectangles, and ellipses based on different criteria.
-"""
-
-from cmath import rect
-import math
-import random
-from qgis.core import *
-from PyQt5.QtCore import QVariant
-from osgeo import gdal
-
-from GenSimPlotUtilities import GProgressDialog
-from GenSimPlotUtilities import GenSimPlotUtilities
-
-
-#############################################################################
-#   SIMULATION PLOTS
-#############################################################################
-
-class PolygonPlot:
-    """
-    The PolygonPlot class provides foundational functionality for creating and manipulating
-    various types of simulation plots based on polygons.
-
-    This class includes methods to set up the centroid, bounding box, and mean coordinates of a polygon,
-    and supports generating different simulation plot geometries, including squares, circles, rectangles, and ellipses.
-
-    Subclasses of PolygonPlot implement specific behaviors for creating each type of simulation plot
-    through the following virtual methods:
-        - createPlot(self, polygon: QgsGeometry): Initializes the plot based on the input polygon geometry.
-        - createGeometry(self): Defines the geometry of the simulation plot.
-        - clone(self): Creates a copy of the current plot instance.
-        - resize(self, perc: float) Adjusts the size of the plot by a specified percentage.
-
-    Attributes:
-        sideRatioMax (float):        The maximum allowable ratio between the long and short sides of the bounding rectangle.
-        ellipseNumPoints (int):      The number of points used to approximate an ellipse.
-        originalPosition (QgsPoint): The initial position of the simulation plot.
-        polygonArea (float):         The area of the polygon associated with the plot.
-        polygonPerimeter (float):    The perimeter of the associated polygon.
-        translatedPosition (QgsPoint): The current position of the simulation plot after translation.
-        a (float):                   The length of the plot's long side.
-        b (float):                   The length of the plot's short side.
-        geom (QgsGeometry):          The geometry of the current simulation plot.
-        tx (float):                  The translation distance in the x-direction.
-        ty (float):                  The translation distance in the y-direction.
-        alpha (float):               The rotation angle of the plot in degrees.
-    """
-
-    sideRatioMax = 4.0
-    ellipseNumPoints = 100
-
-    def __init__(self):
-        self.gname = "geometry"
-        self.gposition = "unknown"
-        self.originalPosition = QgsPoint(0.0, 0.0)
-        self.polygonArea = 0.0
-        self.polygonPerimeter = 0.0
-        self.translatedPosition = QgsPoint(0.0, 0.0)
-        self.a = 0.0
-        self.b = 0.0
-        self.geom = None
-        self.tx = 0.0
-        self.ty = 0.0
-        self.alpha = 0.0
-
-    def setupCentroid(self, polygon: QgsGeometry):
-        """
-        Set the initial position of simulation plot to the centroid of the polygon.
-
-        Parameters:
-            polygon (QgsGeometry): The polygon for which the centroid is calculated.
-        """
-        self.originalPosition = polygon.centroid().asPoint()
-        self.polygonArea = polygon.area()
-        self.polygonPerimeter = polygon.length()
-        self.translatedPosition = QgsPointXY(self.originalPosition)
-
-    def setupBBox(self, polygon: QgsGeometry):
-        """
-        Set up the initial position of plot to centroid of the bounding box of the polygon.
-
-        Parameters:
-            polygon (QgsGeometry): The polygon for which the bounding box is calculated.
-        """
-        self.originalPosition = polygon.boundingBox().center()
-        self.polygonArea = polygon.area()
-        self.polygonPerimeter = polygon.length()
-        self.translatedPosition = QgsPointXY(self.originalPosition)
-
-    def setupMeanXY(self, polygon: QgsGeometry):
-        """
-        Set up the initial position of plot to the mean coordinates of the polygon.
-
-        Parameters:
-            polygon (QgsGeometry): The polygon for which the mean coordinates are calculated.
-        """
-        self.originalPosition = self.meanXY(polygon)
-        self.polygonArea = polygon.area()
-        self.polygonPerimeter = polygon.length()
-        self.translatedPosition = QgsPointXY(self.originalPosition)
-
-    def setupSquare(self):
-        """
-        Calculates the side length of a square simulation plot that has an area equal to the given polygon.
-        This function ensures the simulation plot has equal long and short sides, resulting in a square plot.
-        """
-        self.a = math.sqrt(self.polygonArea)
-        self.b = self.a
-
-    def createSquare(self):
-        """
-        Creates a square simulation plot with predefined side length.
-        """
-        cx = self.originalPosition.x()
-        cy = self.originalPosition.y()
-        a2 = self.a / 2
-        self.geom = QgsGeometry.fromRect(
-            QgsRectangle(cx - a2, cy - a2, cx + a2, cy + a2)
-        )
-
-    def setupCircle(self):
-        """
-        Calculates the radius of a circular simulation plot with an area equal to the specified polygon.
-        Set up the long and short sides of the simulation plot to be equal.
-        """
-        r = math.sqrt(self.polygonArea / math.pi)
-        self.a = 2 * r
-        self.b = self.a
-
-    def createCircle(self):
-        """
-        Creates a circular simulation plot with predefined diameter and center.
-        """
-        c = QgsPoint(self.originalPosition.x(), self.originalPosition.y())
-        r = self.a / 2.0
-        self.geom = QgsGeometry(QgsCircle(c, r, 0.0).toPolygon())
-
-    def setupRectangle(self):
-        """
-        Calculates the dimensions of a rectangular simulation plot with an area equal to that of the specified polygon.
-        Determines the length of both the longer and shorter sides to achieve the specified area.
-        """
-        d = self.polygonPerimeter * self.polygonPerimeter - 16 * self.polygonArea
-        if 0 < d:
-            d = math.sqrt(d)
-        else:
-            d = 0
-        self.a = (self.polygonPerimeter + d) / 4
-        self.b = (self.polygonPerimeter - d) / 4
-        if self.sideRatioMax is not None:
-            if self.sideRatioMax < self.a / self.b:
-                self.b = math.sqrt(self.polygonArea / self.sideRatioMax)
-                self.a = self.polygonArea / self.b
-
-    def createRectangle(self):
-        """
-        Creates a rectangular simulation plot with predefined dimensions.
-        """
-        cx = self.originalPosition.x()
-        cy = self.originalPosition.y()
-        a2 = self.a / 2
-        b2 = self.b / 2
-        self.geom = QgsGeometry.fromRect(
-            QgsRectangle(cx - a2, cy - b2, cx + a2, cy + b2)
-        )
-
-    def setupEllipse(self):
-        """
-        Calculates the major and minor axis of the ellipse simulation plot of equal area of polygon.
-        """
-        d = self.polygonPerimeter * self.polygonPerimeter - 16 * self.polygonArea
-        if 0 < d:
-            d = math.sqrt(d)
-        else:
-            d = 0
-        r = (self.polygonPerimeter + d) / (self.polygonPerimeter - d)
-        a = math.sqrt(r * self.polygonArea / math.pi)
-        b = a / r
-        if self.sideRatioMax is not None:
-            if self.sideRatioMax < a / b:
-                a = math.sqrt(self.sideRatioMax * self.polygonArea / math.pi)
-                b = a / self.sideRatioMax
-        self.a = 2 * a
-        self.b = 2 * b
-
-    def createEllipse(self):
-        """
-        Creates an elliptical simulation plot with predefined major and minor axes.
-        """
-        cx = self.originalPosition.x()
-        cy = self.originalPosition.y()
-        semiMajor = self.a / 2
-        semiMinor = self.b / 2
-        points = []
-        for i in range(self.ellipseNumPoints):
-            angle = (2 * math.pi * i) / self.ellipseNumPoints
-            x = semiMajor * math.cos(angle)
-            y = semiMinor * math.sin(angle)
-            p = QgsPointXY(cx + x, cy + y)
-            points.append(p)
-        points.append(points[0])
-        self.geom = QgsGeometry(QgsPolygon(QgsLineString(points)))
-
-    def setupFromPlot(self, plot):
-        """
-        Sets the parameters of the simulation plot based on an existing plot.
-        """
-        self.originalPosition = QgsPointXY(plot.originalPosition)
-        self.polygonArea = plot.polygonArea
-        self.polygonPerimeter = plot.polygonPerimeter
-        self.translatedPosition = QgsPointXY(plot.translatedPosition)
-        self.a = plot.a
-        self.b = plot.b
-        self.geom = QgsGeometry(plot.geom)
-        self.tx = plot.tx
-        self.ty = plot.ty
-        self.alpha = plot.alpha
-
-    def translate(self, dx, dy):
-        """
-        Translates the simulation plot by a given distance along the x and y axes.
-
-        Parameters:
-            dx (float): The distance to move the plot along the x-axix.
-            dy (float): The distance to move the plot along the y-axis.
-
-        Returns:
-            A new simulation plot with the translated geometry.
-        """
-        nplot = self.clone()
-        nplot.geom.translate(dx, dy)
-        nplot.translatedPosition = QgsPointXY(
-            nplot.translatedPosition.x() + dx, nplot.translatedPosition.y() + dy
-        )
-        nplot.tx += dx
-        nplot.ty += dy
-        return nplot
-
-    def rotate(self, angle):
-        """
-        Rotates the simulation plot by a specified angle.
-
-        Parameters:
-            angle (float): The angle of rotation in degrees.
-
-        Returns:
-            A new simulation plot with the rotated geometry.
-        """
-        nplot = self.clone()
-        nplot.geom.rotate(angle, nplot.translatedPosition)
-        nplot.alpha += angle
-        return nplot
-
-    def randomTranslate(self, maxPerc):
-        """
-        Randomly translates the simulation plot within a specified percentage of its longest side length.
-
-        The plot is shifted by a random distance along both the x and y axes, where the maximum shift is
-        determined as a percentage of the plot's longest side.
-
-        Parameters:
-            maxPerc (float): The maximum percentage of the longest side length to translate the plot.
-
-        Returns:
-            A new simulation plot with the translated geometry.
-        """
-        dx = self.a * math.sin(math.radians(self.alpha)) + self.b * math.cos(
-            math.radians(self.alpha)
-        )
-        dy = self.a * math.cos(math.radians(self.alpha)) + self.b * math.sin(
-            math.radians(self.alpha)
-        )
-        tx = maxPerc * dx * (2.0 * random.random() - 1.0)
-        ty = maxPerc * dy * (2.0 * random.random() - 1.0)
-        return self.translate(tx, ty)
-
-    def randomRotate(self, maxAngle):
-        """
-        Randomly rotates the simulation plot within a specified angle range.
-
-        Parameters:
-            maxAngle (float): The maximum angle, in degrees, by which the plot can be randomly rotated.
-
-        Returns:
-            A new simulation plot with rotated geometry.
-        """
-        angle = maxAngle * (2.0 * random.random() - 1.0)
-        return self.rotate(angle)
-
-    def resizeRectangle(self, perc):
-        """
-        Resizes the simulation plot by a given percentage.
-
-        Parameters:
-            perc (float): the percentage to scale the simulation plot by.
-        """
-        a = self.a * (1 + perc)
-        b = self.b / (1 + perc)
-        if a < b:
-            c = b
-            b = a
-            a = c
-        if self.sideRatioMax is not None:
-            if a / b <= self.sideRatioMax:
-                self.a = a
-                self.b = b
-
-    def resize(self, perc: float):
-        """
-        Resizes the simulation plot by a specified percentage.
-
-        Parameters:
-            perc (float): The percentage by which to resize the simulation plot.
-
-        Returns:
-            A new instance of the simulation plot with the adjusted geometry.
-        """
-        plot = self.clone()
-        plot.resizeRectangle(perc)
-        plot.createGeometry()
-        plot.geom.translate(plot.tx, plot.ty)
-        plot.geom.rotate(plot.alpha, plot.translatedPosition)
-        return plot
-
-    def randomResize(self, maxResizePerc: float):
-        """
-        Randomly resizes the simulation plot by a specified maximum percentage.
-
-        Parameters:
-            maxResizePerc (float): The maximum percentage variation to apply when randomly resizing the plot.
-
-        Returns:
-            A new instance of the simulation plot with randomly adjusted geometry.
-        """
-        perc = maxResizePerc * (2.0 * random.random() - 1.0)
-        return self.resize(perc)
-
-    def meanXY(self, polygon: QgsGeometry):
-        """
-        Calculate the mean coordinates of a polygon.
-
-        Parameters:
-            polygon (QgsGeometry): The polygon geometry for which the mean coordinates are calculated.
-
-        Returns:
-            QgsPoint: A point with the mean x and y coordinates of the polygon.
-        """
-        x = 0.0
-        y = 0.0
-        v = polygon.vertices()
-        m = 0
-        while v.hasNext():
-            p = v.next()
-            x += p.x()
-            y += p.y()
-            m += 1
-        if 0 < m:
-            x = x / m
-            y = y / m
-            return QgsPointXY(x, y)
-        else:
-            return None
-
-
-class SquareByCentroid(PolygonPlot):
-    """
-    This class represents a square simulation plot based on the centroid of a polygon.
-    """
-
-    def __init__(self):
-        super().__init__()
-        self.gname = "square"
-        self.gposition = "centroid"
-
-    def createPlot(self, polygon: QgsGeometry):
-        plot = SquareByCentroid()
-        plot.setupCentroid(polygon)
-        plot.setupSquare()
-        plot.createSquare()
-        return plot
-
-    def createGeometry(self):
-        plot.createSquare()
-
-    def clone(self):
-        plot = SquareByCentroid()
-        plot.setupFromPlot(self)
-        return plot
-
-    def resize(self, perc: float):
-        return self.clone()
-
-
-class SquareByBBox(PolygonPlot):
-    """
-    This class represents a square simulation plot based on the bounding box of a polygon.
-    """
-
-    def __init__(self):
-        super().__init__()
-        self.gname = "square"
-        self.gposition = "bbox"
-
-    def createPlot(self, polygon: QgsGeometry):
-        plot = SquareByBBox()
-        plot.setupBBox(polygon)
-        plot.setupSquare()
-        plot.createSquare()
-        return plot
-
-    def createGeometry(self):
-        plot.createSquare()
-
-    def clone(self):
-        plot = SquareByBBox()
-        plot.setupFromPlot(self)
-        return plot
-
-    def resize(self, perc: float):
-        return self.clone()
-
-
-class SquareByMeanXY(PolygonPlot):
-    """
-    This class represents a square simulation plot based on the mean coordinates of a polygon.
-    """
-
-    def __init__(self):
-        super().__init__()
-        self.gname = "square"
-        self.gposition = "meanxy"
-
-    def createPlot(self, polygon: QgsGeometry):
-        plot = SquareByMeanXY()
-        plot.setupMeanXY(polygon)
-        plot.setupSquare()
-        plot.createSquare()
-        return plot
-
-    def createGeometry(self):
-        plot.createSquare()
-
-    def clone(self):
-        plot = SquareByMeanXY()
-        plot.setupFromPlot(self)
-        return plot
-
-    def resize(self, perc: float):
-        return self.clone()
-
-
-class CircleByCentroid(PolygonPlot):
-    """
-    This class represents a circular simulation plot based on the centroid of a polygon.
-    """
-
-    def __init__(self):
-        super().__init__()
-        self.gname = "circle"
-        self.gposition = "centroid"
-
-    def createPlot(self, polygon: QgsGeometry):
-        plot = CircleByCentroid()
-        plot.setupCentroid(polygon)
-        plot.setupCircle()
-        plot.createCircle()
-        return plot
-
-    def createGeometry(self):
-        plot.createCircle()
-
-    def clone(self):
-        plot = CircleByCentroid()
-        plot.setupFromPlot(self)
-        return plot
-
-    def resize(self, perc: float):
-        return self.clone()
-
-    def rotate(self, angle):
-        return self.clone()
-
-
-class CircleByBBox(PolygonPlot):
-    """
-    This class represents a circular simulation plot based on the bounding box.
-    """
-
-    def __init__(self):
-        super().__init__()
-        self.gname = "circle"
-        self.gposition = "bbox"
-
-    def createPlot(self, polygon: QgsGeometry):
-        plot = CircleByBBox()
-        plot.setupBBox(polygon)
-        plot.setupCircle()
-        plot.createCircle()
-        return plot
-
-    def createGeometry(self):
-        plot.createCircle()
-
-    def clone(self):
-        plot = CircleByBBox()
-        plot.setupFromPlot(self)
-        return plot
-
-    def resize(self, perc: float):
-        return self.clone()
-
-    def rotate(self, angle):
-        return self.clone()
-
-
-class CircleByMeanXY(PolygonPlot):
-    """
-    This class represents a circular simulation plot based on the mean coordinates of a polygon.
-    """
-
-    def __init__(self):
-        super().__init__()
-        self.gname = "circle"
-        self.gposition = "meanxy"
-
-    def createPlot(self, polygon: QgsGeometry):
-        plot = CircleByMeanXY()
-        plot.setupMeanXY(polygon)
-        plot.setupCircle()
-        plot.createCircle()
-        return plot
-
-    def createGeometry(self):
-        plot.createCircle()
-
-    def clone(self):
-        plot = CircleByMeanXY()
-        plot.setupFromPlot(self)
-        return plot
-
-    def resize(self, perc: float):
-        return self.clone()
-
-    def rotate(self, angle):
-        return self.clone()
-
-
-class RectangleByCentroid(PolygonPlot):
-    """
-    This class represents a rectangular simulation plot based on the centroid of a polygon.
-    """
-
-    def __init__(self):
-        super().__init__()
-        self.gname = "rectangle"
-        self.gposition = "centroid"
-
-    def createPlot(self, polygon: QgsGeometry):
-        plot = RectangleByCentroid()
-        plot.setupCentroid(polygon)
-        plot.setupRectangle()
-        plot.createRectangle()
-        return plot
-
-    def createGeometry(self):
-        self.createRectangle()
-
-    def clone(self):
-        plot = RectangleByCentroid()
-        plot.setupFromPlot(self)
-        return plot
-
-
-class RectangleByBBox(PolygonPlot):
-    """
-    This class represents a rectangular simulation plot based on the bounding box.
-    """
-
-    def __init__(self):
-        super().__init__()
-        self.gname = "rectangle"
-        self.gposition = "bbox"
-
-    def createPlot(self, polygon: QgsGeometry):
-        plot = RectangleByBBox()
-        plot.setupBBox(polygon)
-        plot.setupRectangle()
-        plot.createRectangle()
-        return plot
-
-    def createGeometry(self):
-        self.createRectangle()
-
-    def clone(self):
-        plot = RectangleByBBox()
-        plot.setupFromPlot(self)
-        return plot
-
-
-class RectangleByMeanXY(PolygonPlot):
-    """
-    This class represents a rectangular simulation plot based on the mean coordinates.
-    """
-
-    def __init__(self):
-        super().__init__()
-        self.gname = "rectangle"
-        self.gposition = "meanxy"
-
-    def createPlot(self, polygon: QgsGeometry):
-        plot = RectangleByMeanXY()
-        plot.setupMeanXY(polygon)
-        plot.setupRectangle()
-        plot.createRectangle()
-        return plot
-
-    def createGeometry(self):
-        self.createRectangle()
-
-    def clone(self):
-        plot = RectangleByMeanXY()
-        plot.setupFromPlot(self)
-        return plot
-
-
-class EllipseByCentroid(PolygonPlot):
-    """
-    This class represents an elliptical simulation plot based on the centroid of a polygon.
-    """
-
-    def __init__(self):
-        super().__init__()
-        self.gname = "ellipse"
-        self.gposition = "centroid"
-
-    def createPlot(self, polygon: QgsGeometry):
-        plot = EllipseByCentroid()
-        plot.setupCentroid(polygon)
-        plot.setupEllipse()
-        plot.createEllipse()
-        return plot
-
-    def createGeometry(self):
-        self.createEllipse()
-
-    def clone(self):
-        plot = EllipseByCentroid()
-        plot.setupFromPlot(self)
-        return plot
-
-
-class EllipseByBBox(PolygonPlot):
-    """
-    This class represents an elliptical simulation plot based on the bounding box.
-    """
-
-    def __init__(self):
-        super().__init__()
-        self.gname = "ellipse"
-        self.gposition = "bbox"
-
-    def createPlot(self, polygon: QgsGeometry):
-        plot = EllipseByBBox()
-        plot.setupBBox(polygon)
-        plot.setupEllipse()
-        plot.createEllipse()
-        return plot
-
-    def createGeometry(self):
-        self.createEllipse()
-
-    def clone(self):
-        plot = EllipseByBBox()
-        plot.setupFromPlot(self)
-        return plot
-
-
-class EllipseByMeanXY(PolygonPlot):
-    """
-    This class represents an elliptical simulation plot based on the mean coordinates.
-    """
-
-    def __init__(self):
-        super().__init__()
-        self.gname = "ellipse"
-        self.gposition = "meanxy"
-
-    def createPlot(self, polygon: QgsGeometry):
-        plot = EllipseByMeanXY()
-        plot.setupMeanXY(polygon)
-        plot.setupEllipse()
-        plot.createEllipse()
-        return plot
-
-    def createGeometry(self):
-        self.createEllipse()
-
-    def clone(self):
-        plot = EllipseByMeanXY()
-        plot.setupFromPlot(self)
-        return plot
-
-
-
-#############################################################################
-#   PLOT GENERATOR
-#############################################################################
-
-class PlotGenerator:
-    """
-    The PlotGenerator class facilitates the generation of simulation plots from input polygon geometries.
-
-    This class provides methods to create various simulation plot shapes, including squares, circles, rectangles,
-    and ellipses, with flexible positioning options based on attributes such as bounding box, centroid, and mean
-    coordinates of the polygon. Additionally, the class supports random transformations - translations, rotations,
-    and reshaping - to maximize overlap with source polygons.
-
-    Attributes:
-        randomIterations (int): Specifies the number of random iterations for each simulation plot generation.
-        percTranslate (float):  Defines the maximum percentage for random translations in the x and y directions.
-        maxAlpha (float):       Sets the maximum allowable rotation angle, in degrees, for random plot rotations.
-        sideRatioMax (float):   Limits the maximum ratio between the long and short sides of a rectangular plot.
-        maxResizePerc (float):  Determines the maximum percentage by which a plot's size can be altered.
-    """
-
-    def __init__(self):
-        """
-        Initializes the PlotGenerator class with default values for the simulation plot generation parameters.
-        """
-        self.setup()
-
-    def setup(
-        self,
-        randomIterations: int = 250,
-        percTranslate: float = 0.05,
-        maxAlpha: float = 5.00,
-        sideRatioMax: float = 4.00,
-        maxResizePerc: float = 0.10,
-    ):
-        """
-        Configures the parameters for the simulation plot generation process.
-
-        This method allows customization of the key parameters influencing how simulation plots are generated, including
-        the number of random iterations, maximum translation, rotation angle, aspect ratio limits, and reshaping percentage.
-
-        Parameters:
-            randomIterations (int): The number of random generation attempts to apply when creating each simulation plot.
-                                    Higher values can improve accuracy but may increase computation time. Default is 250.
-            percTranslate (float):  The maximum allowable percentage for random translation in both x and y directions
-                                    relative to plot size. Default is 0.05.
-            maxAlpha (float):       The maximum rotation angle, in degrees, for random plot rotations to enhance positional
-                                    variation. Default is 5.0 degrees.
-            sideRatioMax (float):   The maximum allowable ratio between the longer and shorter sides of a rectangular plot,
-                                    which constrains plot shape. Default is 4.0.
-            maxResizePerc (float):  The maximum percentage by which the plot size can be altered for reshaping, aiding
-                                    flexibility in adapting plot geometry to source data. Default is 0.10.
-        """
-        self.randomIterations = randomIterations
-        self.percTranslate = percTranslate
-        self.maxAlpha = maxAlpha
-        self.sideRatioMax = sideRatioMax
-        self.maxResizePerc = maxResizePerc
-
-    def createSPlotFields(self, idField: QgsField):
-        """
-        Generates a 'QgsFields' object containing fields for simulation plot attributes.
-
-        This function creates a set of fields used to store simulation plot metadata, specifically designed for associating
-        plots with unique forest stand IDs. The fields include identifiers essential for organizing and identifying
-        simulation plots within a forest management or research dataset.
-
-        Parameters:
-            idField (QgsField): The field containing the unique ID for each simulation plot.
-
-        Returns:
-            QgsFields: A 'QgsFields' object with the defined field structure for use in simulation plot layers.
-        """
-        outputFields = QgsFields()
-        outputFields.append(idField)
-        outputFields.append(QgsField("a", QVariant.Double, "double", 6, 2))
-        outputFields.append(QgsField("b", QVariant.Double, "double", 6, 2))
-        outputFields.append(QgsField("alpha", QVariant.Double, "double", 6, 2))
-        outputFields.append(QgsField("perc", QVariant.Double, "double", 6, 2))
-        outputFields.append(QgsField("ishp", QVariant.Double, "double", 6, 2))
-        return outputFields
-
-    def createSPlotShapeFile(self, outputFN: str, outputFields: QgsFields, crs):
-        """
-        Creates a new ESRI Shapefile for storing simulation plot geometries.
-
-        This function generates a vector file specifically formatted as an ESRI Shapefile to store simulation plot geometries.
-        The output file is initialized with a defined structure of fields and a specified Coordinate Reference System (CRS),
-        making it suitable for GIS analysis and visualization.
-
-        Parameters:
-            outputFN (str):           The file path and name for the output vector file to be created.
-            outputFields (QgsFields): A 'QgsFields' object defining the structure of fields to include in the output file,
-                                      typically for storing simulation plot metadata.
-            crs (QgsCoordinateReferenceSystem): The CRS in which to save the output file, ensuring spatial accuracy and consistency.
-
-        Returns:
-            QgsVectorFileWriter: A 'QgsVectorFileWriter' instance associated with the newly created Shapefile, enabling
-                                 further data insertion and manipulation.
-        """
-        svo = QgsVectorFileWriter.SaveVectorOptions()
-        svo.driverName = "ESRI Shapefile"
-        return QgsVectorFileWriter.create(
-            outputFN,
-            outputFields,
-            Qgis.WkbType.Polygon,
-            crs,
-            QgsCoordinateTransformContext(),
-            svo,
-            QgsFeatureSink.SinkFlags(),
-            None,
-            None,
-        )
-
-    def createSPlot(self, polygon: QgsGeometry, plotFactory):
-        """
-        Generates a simulation plot using the geometry of an input polygon.
-
-        This function creates a simulation plot by utilizing the specified 'plotFactory' object, which contains
-        the logic to generate plot geometries based on the input polygon. It calls the 'createPlot' method
-        of the provided simulation plot object, ensuring that the generated plot aligns with the spatial properties
-        of the input polygon geometry.
-
-        Parameters:
-            polygon (QgsGeometry): The input polygon geometry that defines the area and shape used for generating
-                                   the simulation plot.
-            plotFactory:           An instance of the simulation plot class (e.g. RectangleByBBox) that contains
-                                   the 'createPlot' method, responsible for creating the plot geometry.
-
-        Returns:
-            QgsGeometry: The generated geometry of the simulation plot.
-        """
-        splot = plotFactory.createPlot(polygon)
-        sarea = polygon.intersection(splot.geom).area()
-        return (splot, sarea)
-
-    def createTranslatedPlot(self, polygon: QgsGeometry, plotFactory):
-        """
-        Generates a randomly translated simulation plot to maximize overlap with an input polygon.
-
-        This function creates a simulation plot based on the provided polygon geometry. It then iteratively translates
-        the plot within a specified percentage ('percTranslate') to maximize the area of overlap between the plot and
-        the input polygon.
-
-        Parameters:
-            polygon (QgsGeometry): The input polygon geometry that serves as the reference for generating
-                                   and aligning the simulation plot.
-            plotFactory:           An instance of the simulation plot class that provides the 'createPlot' and 'randomTranslate'
-                                   methods to generate and translate the plot geometry.
-
-        Returns:
-            SimulationPlot: The randomly translated simulation plot with the maximum overlap area with the input polygon.
-        """
-        splot = plotFactory.createPlot(polygon)
-        sarea = polygon.intersection(splot.geom).area()
-        for i in range(self.randomIterations):
-            nplot = splot.randomTranslate(self.percTranslate)
-            narea = polygon.intersection(nplot.geom).area()
-            if sarea < narea:
-                sarea = narea
-                splot = nplot
-        return (splot, sarea)
-
-    def createRotatedSPlot(self, polygon: QgsGeometry, plotFactory):
-        """
-        Generates a randomly rotated simulation plot to maximize overlap with an input polygon.
-
-        This function creates an initial simulation plot based on the provided polygon geometry. It then iteratively
-        rotates the plot within a specified maximum angle ('maxAlpha') to maximize the area of overlap between the plot
-        and the input polygon.
-
-        Parameters:
-            polygon (QgsGeometry): The input polygon geometry that serves as the reference for generating and aligning
-                                   the simulation plot.
-            plotFactory:           An instance of the simulation plot class that provides the 'createPlot' and 'randomRotate'
-                                   methods to generate and rotate the plot geometry.
-
-        Returns:
-            SimulationPlot: The randomly rotated simulation plot with the maximum overlap area with the input polygon.
-        """
-        splot = plotFactory.createPlot(polygon)
-        sarea = polygon.intersection(splot.geom).area()
-        for i in range(self.randomIterations):
-            nplot = splot.randomRotate(self.maxAlpha)
-            narea = polygon.intersection(nplot.geom).area()
-            if sarea < narea:
-                sarea = narea
-                splot = nplot
-        return (splot, sarea)
-
-    def createResizedSPlot(self, polygon: QgsGeometry, plotFactory):
-        """
-        Generates a resized simulation plot by applying random size adjustments to maximize overlap with an input polygon.
-
-        This function initializes a simulation plot based on the provided polygon geometry and iteratively applies random
-        reshaping transformations. After each reshaping, the overlap area between the resized plot and the input polygon
-        is calculated, with the plot configuration that yields the maximum overlap being retained as the final output.
-
-        Parameters:
-            polygon (QgsGeometry): The input polygon geometry used as a reference for generating and optimizing the simulation plot.
-            plotFactory:           An instance of a simulation plot class providing the 'randomResize' method for performing resize transformation.
-
-        Returns:
-            SimulationPlot: The resized simulation plot with the highest achieved overlap area relative to the input polygon.
-        """
-        splot = plotFactory.createPlot(polygon)
-        sarea = polygon.intersection(splot.geom).area()
-        for i in range(self.randomIterations):
-            nplot = splot.randomResize(self.maxResizePerc)
-            narea = polygon.intersection(nplot.geom).area()
-            if sarea < narea:
-                sarea = narea
-                splot = nplot
-        return (splot, sarea)
-
-    def createOptimizedSPlot(self, polygon: QgsGeometry, plotFactory):
-        """
-        Generates an optimized simulation plot by applying random transformations to maximize overlap with an input polygon.
-
-        This function creates an initial simulation plot based on the given polygon geometry and iteratively applies random
-        reshaping, translation, and rotation transformations to the plot. Each transformation sequence is evaluated for its
-        overlap area with the input polygon, and the plot configuration yielding the maximum overlap area is retained.
-
-        Parameters:
-            polygon (QgsGeometry): The input polygon geometry used as a reference for generating and optimizing the simulation plot.
-            plotFactory:           An instance of a simulation plot class that provides 'createPlot', 'randomResize',
-                                   'randomTranslate', and 'randomRotate' methods to perform the transformations.
-
-        Returns:
-            SimulationPlot: The optimized simulation plot with the highest overlap area with the input polygon.
-        """
-        splot = plotFactory.createPlot(polygon)
-        sarea = polygon.intersection(splot.geom).area()
-        for i in range(self.randomIterations):
-            nplot = splot.randomResize(self.maxResizePerc)
-            nplot = nplot.randomTranslate(self.percTranslate)
-            nplot = nplot.randomRotate(self.maxAlpha)
-            narea = polygon.intersection(nplot.geom).area()
-            if sarea < narea:
-                sarea = narea
-                splot = nplot
-        return (splot, sarea)
-
-    def createBestSPlot(self, polygon: QgsGeometry, plotFactory):
-        """
-        Generates the most optimal simulation plot that maximizes overlap with the input polygon.
-
-        This function iterates through various shapes (square, circle, rectangle, and ellipse) and different
-        positioning methods (aligned with the bounding box, centered on the centroid, or centered on the mean coordinates)
-        to generate a simulation plot. For each combination, it applies random spatial transformations to achieve maximum
-        overlap area with the input polygon. The resulting plot with the highest overlap is returned.
-
-        Parameters:
-            polygon (QgsGeometry): The input polygon geometry used as a reference for generating and optimizing the simulation plot.
-            plotFactory:           An instance of a simulation plot class that provides methods such as 'createPlot',
-                                   'randomResize', 'randomTranslate', and 'randomRotate' for performing transformations.
-
-        Returns:
-            The optimized simulation plot that achieves the maximum overlap area with the input polygon.
-        """
-        bplot, barea = self.createOptimizedSPlot(polygon, SquareByBBox())
-        splot, sarea = self.createOptimizedSPlot(polygon, SquareByCentroid())
-        if barea < sarea:
-            bplot = splot
-            barea = sarea
-        splot, sarea = self.createOptimizedSPlot(polygon, SquareByMeanXY())
-        if barea < sarea:
-            bplot = splot
-            barea = sarea
-
-        splot, sarea = self.createOptimizedSPlot(polygon, CircleByBBox())
-        if barea < sarea:
-            bplot = splot
-            barea = sarea
-        splot, sarea = self.createOptimizedSPlot(polygon, CircleByCentroid())
-        if barea < sarea:
-            bplot = splot
-            barea = sarea
-        splot, sarea = self.createOptimizedSPlot(polygon, CircleByMeanXY())
-        if barea < sarea:
-            bplot = splot
-            barea = sarea
-
-        splot, sarea = self.createOptimizedSPlot(polygon, RectangleByBBox())
-        if barea < sarea:
-            bplot = splot
-            barea = sarea
-        splot, sarea = self.createOptimizedSPlot(polygon, RectangleByCentroid())
-        if barea < sarea:
-            bplot = splot
-            barea = sarea
-        splot, sarea = self.createOptimizedSPlot(polygon, RectangleByMeanXY())
-        if barea < sarea:
-            bplot = splot
-            barea = sarea
-
-        splot, sarea = self.createOptimizedSPlot(polygon, EllipseByBBox())
-        if barea < sarea:
-            bplot = splot
-            barea = sarea
-        splot, sarea = self.createOptimizedSPlot(polygon, EllipseByCentroid())
-        if barea < sarea:
-            bplot = splot
-            barea = sarea
-        splot, sarea = self.createOptimizedSPlot(polygon, EllipseByMeanXY())
-        if barea < sarea:
-            bplot = splot
-            barea = sarea
-
-        return (bplot, barea)
-
-    def createPlots(
-        self,
-        inputFN: str,
-        idFieldName: str,
-        outputFN: str,
-        plotFactory: PolygonPlot,
-        createFn,
-        progressDlg: GProgressDialog,
-    ):
-        """
-        Generates and saves simulation plots for each polygon feature in an input vector file, saving them to an output vector file.
-
-        This function reads polygon geometries from an input vector file, uses the specified simulation plot factory and creation
-        function to generate individual simulation plots, and writes these plots to an output vector file. The output includes
-        calculated attributes, such as area ratio, shape index, and rotation angle for each plot.
-
-        Parameters:
-            inputFN (str):       Path to the input vector file containing polygon features.
-            idFieldName (str):   Field name for the polygon ID in the input file.
-            outputFN (str):      Path to the output vector file for saving the generated simulation plots.
-            plotFactory (SimulationPlotFactory): Instance of the plot factory used to generate plot geometries.
-            createFn (function): Function reference to create simulation plots based on polygons.
-            progressDlg (GProgressDialog): Optional parameter for displaying a progress dialog during the process.
-
-        Raises:
-            ValueError: If the input layer does not contain polygon geometries or if there is an issue saving a plot to the output layer.
-            Exception: If feature cannot be saved to the output layer.
-            Exception: If process was canceled by the user.
-
-        Process:
-            1. Initializes random seed and loads the input vector layer.
-            2. Ensures that the input layer geometry type is polygon.
-            3. Sets up output fields and creates the output vector file with specified fields and CRS.
-            4. Iterates through each feature in the input layer, generating a simulation plot with 'createFn'.
-            5. Calculates plot-specific metrics, including overlap percentage and shape index.
-            6. Saves each plot with its attributes to the output vector layer.
-
-        Returns:
-            None: The function writes output directly to the specified file path.
-
-        Output Attributes:
-            - Polygon ID.
-            - Simulation plot dimensions ('a', 'b'), rotation angle ('alpha'), and overlap area percentage with the original polygon.
-            - Shape index computed from the perimeter-to-area ratio of the input polygon.
-
-        Usage:
-            This function is ideal for creating detailed simulation plots for each polygon in the input data, storing all relevant
-            geometry and metrics in a new output file.
-        """
-        random.seed()
-        inputLayer = QgsVectorLayer(inputFN, "input polygons", "ogr")
-        if inputLayer.geometryType() != Qgis.GeometryType.Polygon:
-            GenSimPlotUtilities.raiseValueError(f"Geometry must be POLYGON ({inputFN}).", progressDlg)
-        inputIDField = inputLayer.fields().field(idFieldName)
-        outputFields = self.createSPlotFields(QgsField(inputIDField))
-        outputLayer = self.createSPlotShapeFile(
-            outputFN, outputFields, inputLayer.crs()
-        )
-        n = inputLayer.featureCount()
-        GenSimPlotUtilities.startProgress(
-            progressDlg, f"Generating simulation plots to {outputFN} ...", n
-        )
-        for fid in range(0, n):
-            inputFeature = inputLayer.getFeature(fid)
-            polygon = inputFeature.geometry().asGeometryCollection()[0]
-            garea = polygon.area()
-            ishp = polygon.length() / math.sqrt(garea)
-            splot, sarea = createFn(polygon, plotFactory)
-            outputFeature = QgsFeature(outputFields)
-            outputFeature.setAttributes(
-                [
-                    inputFeature[idFieldName],
-                    splot.a,
-                    splot.b,
-                    splot.alpha,
-                    100.0 * sarea / garea,
-                    ishp,
-                ]
-            )
-            outputFeature.setGeometry(splot.geom)
-            if not outputLayer.addFeature(outputFeature):
-                GenSimPlotUtilities.raiseException("Cannnot save feature.", progressDlg)
-            GenSimPlotUtilities.incrementProgress(progressDlg)
-
-
-    def generateFixedPlots(
-        self, 
-        inputFN: str, 
-        idFieldName: str, 
-        outputFN: str, 
-        plotFactory: PolygonPlot,
-        progressDlg: GProgressDialog,
-    ):
-        """
-        Generates fixed simulation plots for each polygon feature in the input vector file and saves them to an output vector file.
-
-        This function iterates over each polygon in the input vector file, creating a fixed simulation plot based on a predefined
-        configuration provided by the 'plotFactory'. Each generated plot is saved to an output vector file, complete with attributes
-        linking back to the original polygon and containing simulation-specific details.
-
-        Parameters:
-            inputFN (str):     Path to the input vector file containing polygon geometries.
-            idFieldName (str): Field name for the polygon ID in the input vector file.
-            outputFN (str):    Path to the output vector file where the generated simulation plots will be saved.
-            plotFactory (PolygonPlot): Instance of simulation plot class responsible for generating the plot geometries.
-            progressDlg (GProgressDialog): Optional parameter for displaying a progress dialog during the process.
-
-        Details:
-            - This function uses 'self.createPlots', a generalized method for plot creation, along with a specific plot-creation
-              instance of the simulation plot class.
-            - A fixed simulation plot is generated for each polygon feature in the input vector file and saved to the output vector file.
-            - The output file includes attributes for the original polygon ID and additional information related to the generated plot.
-
-        Returns:
-            None: The function directly writes the generated simulation plots to the specified output file.
-
-        Usage:
-            'generateFixedPlots' is suitable when a consistent, non-randomized plot shape is needed for each polygon in the input data.
-        """
-        self.createPlots(
-            inputFN, 
-            idFieldName, 
-            outputFN, 
-            plotFactory, 
-            self.createSPlot, 
-            progressDlg
-        )
-
-
-    def generateTranslatedPlots(
-        self,
-        inputFN: str, 
-        idFieldName: str, 
-        outputFN: str, 
-        plotFactory: PolygonPlot,
-        progressDlg: GProgressDialog,
-    ):
-        """
-        Generates simulation plots by applying random translations to each polygon feature in the input vector file
-        and saves the results to an output vector file.
-
-        This function processes each polygon in the input vector file, creating simulation plots with randomized
-        translations based on the specified parameters in the 'plotFactory'. The translated plots are saved to an
-        output vector file.
-
-        Parameters:
-            inputFN (str):     Path to the input vector file containing polygon features.
-            idFieldName (str): Field name for the polygon ID in the input vector file.
-            outputFN (str):    Path to the output vector file for saving the generated translated simulation plots.
-            plotFactory (PolygonPlot): An instance of the simulation plot class responsible for creating the plot geometry and managing translations.
-            progressDlg (GProgressDialog): Optional parameter for displaying a progress dialog during the process.
-
-        Details:
-            - For each polygon feature in the input vector file, a new plot is created with random translations.
-            - This function leverages 'self.createPlots', a generalized plot-creation method, with 'self.createTranslatedPlot'
-              as the creation function to apply translation to each simulation plot.
-            - The output vector file records attributes that associate each plot with its original polygon ID, alongside details
-              specific to the translation.
-
-        Returns:
-            None: This function directly saves the output to the specified file path.
-
-        Usage:
-           'generateTranslatedPlots' is ideal for scenarios requiring spatial variation in plot positioning with alignment
-            along coordinate axes, such as ecological or spatial sampling simulations where greater overlap improves representativeness.
-        """
-        self.createPlots(
-            inputFN,
-            idFieldName,
-            outputFN,
-            plotFactory,
-            self.createTranslatedPlot,
-            progressDlg,
-        )
-
-    
-    def generateResizedPlots(
-        self, 
-        inputFN: str, 
-        idFieldName: str, 
-        outputFN: str, 
-        plotFactory: PolygonPlot,
-        progressDlg: GProgressDialog,
-    ):
-        """
-        Generates simulation plots with randomized size adjustments for each polygon feature in the input vector file, saving them to an output file.
-
-        This function reads polygon geometries from the specified input vector file, applies random resizing transformations to create simulation 
-        plots with variable dimensions. It uses the given 'plotFactory' instance and the 'createResizedSPlot' method to control the resizing process
-        and save the plots to the specified output file.
-
-        Parameters:
-            inputFN (str): Path to the input vector file containing polygon features.
-            idFieldName (str): Name of the field representing a unique identifier for each polygon in the input file.
-            outputFN (str): Path to the output vector file where the resized simulation plots will be saved.
-            plotFactory (PolygonPlot): An instance of the plot class responsible for generating and resizing plot geometries.
-            progressDlg (GProgressDialog): Instance of a progress dialog to display updates throughout the resizing operation.
-
-        Details:
-            - Processes each polygon feature in the input vector file to create a resized simulation plot using random size variations.
-            - Calls 'self.createPlots', a generalized method for plot generation, and 'self.createResizedSPlot' for applying size adjustments 
-              that maintain area constraints and improve spatial alignment within each polygon.
-            - Attributes in the output vector file link each resized plot to its original polygon ID and include additional plot-specific data.
-
-        Raises:
-            ValueError: If the input layer's geometry is not a polygon or if there is an error saving a plot to the output layer.
-
-        Returns:
-            None: The function directly writes the resized simulation plots to the specified output file.
-
-        Usage:
-            'generateResizedPlots' is suitable for tasks requiring simulation plots with variable sizes for enhanced spatial alignment 
-            and coverage. It is ideal for scenarios where adaptive plot sizes are necessary to improve overlap with source polygons 
-            for detailed spatial analysis.
-        """
-        self.createPlots(
-            inputFN,
-            idFieldName,
-            outputFN,
-            plotFactory,
-            self.createResizedSPlot,
-            progressDlg,
-        )
-
-
-    def generateRotatedPlots(
-        self, 
-        inputFN: str, 
-        idFieldName: str, 
-        outputFN: str, 
-        plotFactory: PolygonPlot,
-        progressDlg: GProgressDialog,
-    ):
-        """
-        Generates randomly rotated simulation plots for each polygon feature in the input vector file and saves them to an output vector file.
-
-        This function processes polygons from an input vector file, applies random rotational transformations to create simulation plots
-        using the specified 'plotFactory' instance and the 'createRotatedSPlot' function, and saves each generated plot to the specified
-        output file.
-
-        Parameters:
-            inputFN (str):     Path to the input vector file containing polygon features.
-            idFieldName (str): Field name representing the polygon ID in the input file.
-            outputFN (str):    Path to the output vector file where rotated simulation plots will be saved.
-            plotFactory (PolygonPlot): An instance of the simulation plot class responsible for generating plot geometries.
-            progressDlg (GProgressDialog): Optional parameter for displaying a progress dialog during the process.
-
-        Details:
-            - Each polygon feature in the input vector file is processed to create a randomly rotated simulation plot.
-            - Uses 'self.createPlots', a generalized plot-creation method, with 'self.createRotatedSPlot' to apply
-              random rotations to each plot.
-            - The output vector file records attributes that associate each plot with its original polygon ID, alongside details
-              specific to the rotation.
-
-        Raises:
-            ValueError: Raised if the input layer geometry is not a polygon or if there is an error saving a plot to the output layer.
-
-        Returns:
-            None: This function directly writes output to the specified file path.
-
-        Usage:
-            'generateRotatedPlots' is ideal for applications requiring rotated simulation plots, such as spatial sampling or ecological
-            studies, where randomly rotated plots can improve the spatial overlap and alignment with the original polygon.
-        """
-        self.createPlots(
-            inputFN,
-            idFieldName,
-            outputFN,
-            plotFactory,
-            self.createRotatedSPlot,
-            progressDlg,
-        )
-
-
-    def generateOptimizedPlots(
-        self, 
-        inputFN: str, 
-        idFieldName: str, 
-        outputFN: str, 
-        plotFactory: PolygonPlot,
-        progressDlg: GProgressDialog,
-    ):
-        """
-        Generates optimized simulation plots for each polygon feature in the input vector file and saves them to an output vector file.
-
-        This function processes polygons from an input vector file and applies a series of transformation - such as random
-        translations, rotations, and reshaping - using the 'plotFactory' instance and the 'createOptimizedSPlot' function
-        to maximize spatial overlap with the input polygons. The resulting plots are saved to the specified output file.
-
-        Parameters:
-            inputFN (str):     Path to the input vector file containing polygon features.
-            idFieldName (str): Field name representing the polygon ID in the input file.
-            outputFN (str):    Path to the output vector file where the optimized simulation plots will be saved.
-            plotFactory (PolygonPlot): An instance of the simulation plot class responsible for generating plot geometries.
-            progressDlg (GProgressDialog): Optional parameter for displaying a progress dialog during the process.
-
-        Details:
-            - Utilizes 'self.createPlots', a generalized plot-creation method, with 'self.createOptimizedSPlot' to apply iterative
-              transformations aimed at maximizing area overlap with the original polygon.
-            - Each plot undergoes randomized adjustments in position, rotation, and size to achieve optimal alignment
-              with the input polygons.
-
-        Raises:
-            ValueError: Raised if the input layer geometry is not a polygon or if a plot cannot be saved to the output layer.
-
-        Returns:
-            None: The function directly writes the output to the specified file path.
-
-        Usage:
-            'generateOptimizedPlots' is particularly useful for spatial simulations or sampling studies where high overlap
-            between simulation plots and source polygons is essential, providing a tailored fit to complex polygon geometries.
-        """
-        self.createPlots(
-            inputFN,
-            idFieldName,
-            outputFN,
-            plotFactory,
-            self.createOptimizedSPlot,
-            progressDlg,
-        )
-
-
-    def generatePlots(
-        self, 
-        inputFN: str, 
-        idFieldName: str, 
-        outputFN: str, 
-        plotFactory: PolygonPlot,
-        plotPlacement: str,
-        progressDlg: GProgressDialog,):
-        """
-        Generates simulation plots for each polygon feature in the input vector file and saves them to an output vector file,
-        based on the specified placement strategy.
-
-        This function provides a high-level interface for generating simulation plots with various spatial configurations,
-        including fixed, translated, rotated, and optimized placements. Depending on the 'plotPlacement' parameter, the function
-        directs to specific plot-generation methods that apply unique transformations to the simulation plots, leveraging the
-        'plotFactory' to create the geometry and attributes.
-
-        Parameters:
-            inputFN (str):       Path to the input vector file containing polygon features.
-            idFieldName (str):   Field name representing the polygon ID in the input file.
-            outputFN (str):      Path to the output vector file to save the generated simulation plots.
-            plotFactory (SimulationPlotFactory): An instance of the simulation plot class responsible for generating plot geometries.
-            plotPlacement (str): Specifies the placement strategy for the plots. Options include:
-                                 - "fixed": Generates plots with a fixed position.
-                                 - "resized": Randomly alters plot size while preserving area.
-                                 - "rotated": Applies random rotations to plot orientation.
-                                 - "translated": Applies random translations to plot positions.
-                                 - "optimized": Iteratively adjusts placement to maximize plot overlap with the polygon.
-            progressDlg (GProgressDialog): Optional parameter for displaying a progress dialog during the process.
-
-        Raises:
-            ValueError: Raised if 'plotPlacement' is not one of the accepted options.
-
-        Returns:
-            None: The function directly saves the generated simulation plots to the specified output file.
-
-        Usage:
-            'generatePlots' is suitable for scenarios where multiple spatial configuration options are required, allowing users to
-            select between fixed, translated, rotated, resized, and optimized placements based on analysis needs. This function simplifies
-            the plot generation process by selecting the appropriate method based on the 'plotPlacement' parameter.
-        """
-        if plotPlacement == "fixed":
-            self.generateFixedPlots(inputFN, idFieldName, outputFN, plotFactory, progressDlg)
-        elif plotPlacement == "translated":
-            self.generateTranslatedPlots(inputFN, idFieldName, outputFN, plotFactory, progressDlg)
-        elif plotPlacement == "rotated":
-            self.generateRotatedPlots(inputFN, idFieldName, outputFN, plotFactory, progressDlg)
-        elif plotPlacement == "resized":
-            self.generateResizedPlots(inputFN, idFieldName, outputFN, plotFactory, progressDlg)
-        elif plotPlacement == "optimized":
-            self.generateOptimizedPlots(inputFN, idFieldName, outputFN, plotFactory, progressDlg)
-        else:
-            GenSimPlotUtilities.raiseValueError(
-                f"Invalid plot placement option ({plotPlacement}).", 
-                progressDlg,
-            )
-
-
-    def generateSquarePlots(
-        self, inputFN, idFieldName, outputFN, plotPosition, plotPlacement, progressDlg
-    ):
-        """
-        Generates square simulation plots based on input polygon geometries, with configurable positioning and placement options.
-
-        This function reads polygon geometries from an input vector file and creates square simulation plots according to
-        specified positioning and placement strategies. Positioning options (such as aligning with the bounding box, centroid,
-        or mean coordinates) determine where the square plot is centered within each polygon. The placement strategy
-        applies additional transformations, such as fixed, rotated, translated, or optimized placements,
-        to control plot orientation and spatial adjustments.
-
-        Parameters:
-            inputFN (str):       Path to the input vector file containing polygon features.
-            idFieldName (str):   Field name representing the polygon ID in the input file.
-            outputFN (str):      Path to the output vector file to save the generated square plots.
-            plotPosition (str):  Specifies how to position the square plot within each polygon. Options include:
-                                 - "bounding box": Aligns the square with the bounding box of the polygon.
-                                 - "centroid": Centers the square at the polygon's centroid.
-                                 - "mean coordinates": Centers the square at the mean x and y coordinates of the polygon.
-            plotPlacement (str): Specifies the placement strategy for the square plots. Options include:
-                                 - "fixed": Generates plots with a fixed position.
-                                 - "resized": Randomly alters plot size while preserving area; does not affect square plots.
-                                 - "rotated": Applies random rotations to plot orientation.
-                                 - "translated": Applies random translations to plot positions.
-                                 - "optimized": Iteratively adjusts placement to maximize plot overlap with the polygon.
-            progressDlg (GProgressDialog): Optional parameter for displaying a progress dialog during the process.
-
-        Raises:
-            ValueError: If 'plotPosition' is not one of the accepted options.
-
-        Returns:
-            None: The function directly writes the generated plots to the specified output vector file.
-
-        Usage:
-            'generateSquarePlots' is ideal for creating square-shaped simulation plots where specific alignment with polygon
-            features is required, such as aligning with bounding boxes or centering on mean coordinates. Combined with
-            the 'plotPlacement' options, this function offers flexibility for ecological sampling or spatial analyses where
-            varying alignment and positioning are necessary.
-        """
-        if plotPosition == "bounding box":
-            self.generatePlots(
-                inputFN, idFieldName, outputFN, SquareByBBox(), plotPlacement, progressDlg
-            )
-        elif plotPosition == "centroid":
-            self.generatePlots(
-                inputFN, idFieldName, outputFN, SquareByCentroid(), plotPlacement, progressDlg
-            )
-        elif plotPosition == "mean coordinates":
-            self.generatePlots(
-                inputFN, idFieldName, outputFN, SquareByMeanXY(), plotPlacement, progressDlg
-            )
-        else:
-            GenSimPlotUtilities.raiseValueError(
-                f"Invalid plot position option ({plotPosition}).",
-                progressDlg,
-            )
-
-
-    def generateCirclePlots(
-        self, inputFN, idFieldName, outputFN, plotPosition, plotPlacement, progressDlg
-    ):
-        """
-        Generates circular simulation plots based on input polygon geometries, configured by specified position and placement criteria.
-
-        This function reads polygon geometries from an input vector file and generates circular simulation plots according to
-        the desired positioning within each polygon and placement strategy. The 'plotPosition' parameter determines the center
-        point of the circle, while the 'plotPlacement' parameter defines spatial transformations like fixed positioning,
-        random rotation, translation, or optimized placement for enhanced overlap with the polygon.
-
-        Parameters:
-            inputFN (str):       Path to the input vector file containing polygon features.
-            idFieldName (str):   Field name representing the polygon ID in the input file.
-            outputFN (str):      Path to the output vector file to store the generated circular plots.
-            plotPosition (str):  Specifies the positioning approach for centering the circle within each polygon. Options include:
-                                 - "bounding box": Aligns the circle with the bounding box of the polygon.
-                                 - "centroid": Centers the circle at the polygon's centroid.
-                                 - "mean coordinates": Centers the circle at the mean x and y coordinates of the polygon.
-            plotPlacement (str): Specifies the placement strategy for the circle plots, offering additional spatial adjustments:
-                                 - "fixed": Generates plots with a fixed position.
-                                 - "resized": Randomly alters plot size while preserving area; does not affect circular plots.
-                                 - "rotated": Applies random rotations to plot orientation.
-                                 - "translated": Applies random translations to plot positions.
-                                 - "optimized": Iteratively adjusts placement to maximize plot overlap with the polygon.
-            progressDlg (GProgressDialog): Optional parameter for displaying a progress dialog during the process.
-            
-        Raises:
-            ValueError: If 'plotPosition' is not one of the accepted options.
-
-        Returns:
-            None: The function directly writes the generated circular plots to the specified output vector file.
-
-        Usage:
-            'generateCirclePlots' is useful for creating circular simulation plots where specific alignment within polygon
-            features is needed. It is particularly beneficial in spatial analyses and sampling applications where consistent
-            positioning combined with flexible spatial adjustments enhances data representativeness.
-        """
-        if plotPosition == "bounding box":
-            self.generatePlots(
-                inputFN, idFieldName, outputFN, CircleByBBox(), plotPlacement, progressDlg
-            )
-        elif plotPosition == "centroid":
-            self.generatePlots(
-                inputFN, idFieldName, outputFN, CircleByCentroid(), plotPlacement, progressDlg
-            )
-        elif plotPosition == "mean coordinates":
-            self.generatePlots(
-                inputFN, idFieldName, outputFN, CircleByMeanXY(), plotPlacement, progressDlg
-            )
-        else:
-            GenSimPlotUtilities.raiseValueError(
-                f"Invalid plot position option ({plotPosition}).",
-                progressDlg,
-            )
-
-
-    def generateRectanglePlots(
-        self, inputFN, idFieldName, outputFN, plotPosition, plotPlacement, progressDlg
-    ):
-        """
-        Generates rectangular simulation plots based on input polygon geometries, configured by specified positioning and placement criteria.
-
-        This function reads polygons from an input vector file and creates rectangular simulation plots for each polygon feature.
-        Positioning criteria determine where the rectangle is placed within the polygon, while placement strategies apply spatial
-        transformations, such as fixed placement, reshaping, rotations, translations, and optimized positioning.
-
-        Parameters:
-            inputFN (str):       Path to the input vector file containing polygon features.
-            idFieldName (str):   Field name representing the polygon ID in the input file.
-            outputFN (str):      Path to the output vector file to store the generated rectangular plots.
-            plotPosition (str):  Specifies the alignment method for positioning the rectangle within each polygon. Options include:
-                                 - "bounding box": Aligns the rectangle to the polygon's bounding box dimensions.
-                                 - "centroid": Centers the rectangle on the polygon's centroid.
-                                 - "mean coordinates": Centers the rectangle at the mean x and y coordinates of the polygon.
-            plotPlacement (str): Specifies the placement strategy for the rectangle plots, providing spatial flexibility:
-                                 - "fixed": Generates plots with a fixed position within the polygon.
-                                 - "resized": Randomly alters plot size while preserving area.
-                                 - "rotated": Applies random rotations to adjust plot orientation.
-                                 - "translated": Applies random translations to adjust plot positioning.
-                                 - "optimized": Iteratively optimizes placement to maximize plot overlap with the polygon.
-            progressDlg (GProgressDialog): Optional parameter for displaying a progress dialog during the process.
-
-        Raises:
-            ValueError: If 'plotPosition' is not one of the accepted options.
-
-        Returns:
-            None: The function directly writes the generated rectangular plots to the specified output vector file.
-
-        Usage:
-            'generateRectanglePlots' is ideal for applications requiring rectangular plots with specific spatial alignment within
-            polygon features, such as habitat sampling or environmental monitoring tasks.
-        """
-        if plotPosition == "bounding box":
-            self.generatePlots(
-                inputFN, idFieldName, outputFN, RectangleByBBox(), plotPlacement, progressDlg
-            )
-        elif plotPosition == "centroid":
-            self.generatePlots(
-                inputFN, idFieldName, outputFN, RectangleByCentroid(), plotPlacement, progressDlg
-            )
-        elif plotPosition == "mean coordinates":
-            self.generatePlots(
-                inputFN, idFieldName, outputFN, RectangleByMeanXY(), plotPlacement, progressDlg
-            )
-        else:
-            GenSimPlotUtilities.raiseValueError(
-                f"Invalid plot position option ({plotPosition}).",
-                progressDlg,
-            )
-
-
-    def generateEllipsePlots(
-        self, inputFN, idFieldName, outputFN, plotPosition, plotPlacement, progressDlg
-    ):
-        """
-        Generates elliptical simulation plots for each polygon feature in the input vector file, based on the specified
-        plot positioning and placement options, and saves them to an output vector file.
-
-        This function reads polygons from the input vector file, generates elliptical plots according to the selected
-        position criteria (bounding box, centroid, or mean coordinates), and applies the specified placement (fixed, resized, rotated,
-        translated, or optimized). Each generated plot is saved to an output file with attributes that identify the original polygon
-        and store relevant simulation details.
-
-        Parameters:
-            inputFN (str):       Path to the input vector file containing polygon features.
-            idFieldName (str):   Field name in the input file for identifying each polygon.
-            outputFN (str):      Path to the output vector file for storing the generated elliptical plots.
-            plotPosition (str):  Specifies the positioning of the plot within each polygon; options include:
-                                 - "bounding box": Aligns the ellipse with the polygon's bounding box.
-                                 - "centroid": Centers the ellipse on the polygon's centroid.
-                                 - "mean coordinates": Positions the ellipse at the mean x and y coordinates of the polygon.
-            plotPlacement (str): Specifies how the plot is placed within the polygon:
-                                 - "fixed": Generates plots with a fixed position within the polygon.
-                                 - "resized": Randomly alters plot size while preserving area.
-                                 - "rotated": Applies random rotations to adjust plot orientation.
-                                 - "translated": Applies random translations to adjust plot positioning.
-                                 - "optimized": Iteratively optimizes placement to maximize plot overlap with the polygon.
-            progressDlg (GProgressDialog): Optional parameter for displaying a progress dialog during the process.
-
-        Raises:
-            ValueError: If an invalid plot position is specified.
-
-        Usage:
-            generateEllipsePlots' is suitable for creating elliptical simulation plots that align with specific polygon
-            attributes, such as bounding box dimensions or centroid location. This function is valuable for applications
-            like spatial analysis or ecological studies where elliptical plot shapes are necessary to represent area coverage
-            consistently across varying polygon features.
-        """
-        if plotPosition == "bounding box":
-            self.generatePlots(
-                inputFN, idFieldName, outputFN, EllipseByBBox(), plotPlacement, progressDlg
-            )
-        elif plotPosition == "centroid":
-            self.generatePlots(
-                inputFN, idFieldName, outputFN, EllipseByCentroid(), plotPlacement, progressDlg
-            )
-        elif plotPosition == "mean coordinates":
-            self.generatePlots(
-                inputFN, idFieldName, outputFN, EllipseByMeanXY(), plotPlacement, progressDlg
-            )
-        else:
-            GenSimPlotUtilities.raiseValueError(
-                f"Invalid plot position option ({plotPosition}).",
-                progressDlg,
-            )
-
-
-    def generateBestPlots(
-        self,
-        inputFN: str,
-        idFieldName: str,
-        outputFN: str,
-        progressDlg: GProgressDialog,
-    ):
-        """
-        Generates simulation plots for each polygon feature in the input vector file, maximizing overlap
-        with the original polygon, and saves them to an output vector file.
-
-        This function reads polygon features from an input vector file, applies an optimization process to create
-        simulation plots that maximize spatial overlap with each original polygon feature, and saves the results
-        to an output file. The output includes each plot with relevant attributes and ID associations for
-        tracking and analysis.
-
-        Parameters:
-            inputFN (str):     Path to the input vector file containing polygon features.
-            idFieldName (str): Field name representing the polygon ID in the input file.
-            outputFN (str):    Path to the output vector file where the simulation plots will be stored.
-            progressDlg (GProgressDialog): A dialog window to display the progress of the plot generation process.
-
-        Returns:
-            None: The function directly writes the generated simulation plots to the specified output file.
-
-        Usage:
-            Use 'generateBestPlots' in scenarios that demand maximum spatial representativeness, where optimal alignment
-            and coverage of each simulation plot with its corresponding polygon are essential. This function is ideal for
-            applications in spatial analysis, ecological modeling, or sampling simulations that benefit from enhanced
-            plot-polygon overlap.
-        """
-        self.createPlots(
-            inputFN,
-            idFieldName,
-            outputFN,
-            None,
-            self.createBestSPlot,
-            progressDlg,
-        )
-
-
-
-#############################################################################
-#   POINTS ON SIMULATION PLOTS
-#############################################################################
-
-class PointsGenerator:
-    """
-    Generates a grid of points over the bounding rectangle of each simulation plot.
-
-    This class provides functionality for generating a regularly spaced grid of points within the rectangular bounds
-    of simulation plots. Each generated point can optionally be clipped to fit within the simulation plot's boundaries.
-    The class supports varying grid densities by adjusting the number of points along the shorter side of the bounding rectangle,
-    and aligns the grid according to the plot's rotation.
-
-    Attributes:
-        bufPerc (float):        A percentage defining the buffer size for clipping points within the plot boundary.
-        bufQCirclePoints (int): Number of points used to define circular buffers when clipping points to plot boundaries.
-    """
-
-    bufPerc = 0.005
-    bufQCirclePoints = 6
-
-    def createSPointsFields(self, idField: QgsField):
-        """
-        Creates the QgsFields structure for storing simulation plot points.
-
-        This method sets up a field schema for the output vector file containing points. Each point has an ID
-        and positional attributes (row and column) within the grid.
-
-        Parameters:
-            idField (QgsField): The field representing the simulation plot ID.
-
-        Returns:
-            QgsFields: A list of fields to be included in the output vector file for storing simulation plot points.
-        """
-        outputFields = QgsFields()
-        outputFields.append(idField)
-        outputFields.append(QgsField("row", QVariant.Int, "int", 4))
-        outputFields.append(QgsField("column", QVariant.Int, "int", 4))
-        return outputFields
-
-    def createSPointsShapeFile(self, outputFN, outputFields, crs):
-        """
-        Creates an output shapefile to store simulation plot points.
-
-        This method initializes an output vector file for storing point geometries representing simulation plot points.
-        The file is structured according to the specified fields and CRS.
-
-        Parameters:
-            outputFN (str):           Path to the output vector file.
-            outputFields (QgsFields): The fields to include in the output file.
-            crs (QgsCoordinateReferenceSystem): The coordinate reference system for the output file.
-
-        Returns:
-            QgsVectorFileWriter: A writer object for the newly created vector file.
-
-
-        Usage:
-            This method is used to create a new vector file for storing simulation plot points. It is typically called before
-            generating and writing points to the output file.
-        """
-        svo = QgsVectorFileWriter.SaveVectorOptions()
-        svo.driverName = "ESRI Shapefile"
-        return QgsVectorFileWriter.create(
-            outputFN,
-            outputFields,
-            Qgis.WkbType.Point,
-            crs,
-            QgsCoordinateTransformContext(),
-            svo,
-            QgsFeatureSink.SinkFlags(),
-            None,
-            None,
-        )
-
-    def generatePointsX(
-        self,
-        polygon: QgsMultiPolygon,
-        inputID: str,
-        alpha: float,
-        a: float,
-        b: float,
-        nPoints: int,
-        outputLayer: QgsVectorFileWriter,
-        outputFields: QgsFields,
-        clipPoints: bool,
-    ):
-        """
-        Generates a grid of points within a simulation plot when the x-side is shorter than the y-side.
-
-        Creates a grid where points are aligned along the shorter side (a <= b), ensuring the specified number of points
-        along the shorter side of the rectangle. Points are optionally clipped to fit within the plot boundaries and
-        rotated to align with the plot's orientation.
-
-        Parameters:
-            polygon (QgsMultiPolygon): Input polygon geometry representing the simulation plot.
-            inputID (str):             Simulation plot ID.
-            alpha (float):             Rotation angle of the plot.
-            a (float):                 Length of the long side of the plot.
-            b (float):                 Length of the short side of the plot.
-            nPoints (int):             Number of points along the long side.
-            outputLayer (QgsVectorFileWriter): The output layer for storing generated points.
-            outputFields (QgsFields):  Field schema for the output vector file.
-            clipPoints (bool):         Flag to clip points within plot boundaries.
-
-        Returns:
-            None: The method writes the generated points to the output vector file.
-        """
-        cen = polygon.centroid().asPoint()
-        x0 = cen.x() - a / 2.0
-        y0 = cen.y() - b / 2.0
-        x1 = cen.x() + a / 2.0
-        y1 = cen.y() + b / 2.0
-        dx = a / (nPoints - 1)
-        row = 0
-        y = y1
-        if clipPoints:
-            pbuf = polygon.buffer(self.bufPerc * a, self.bufQCirclePoints)
-        while (y0 - dx / 2) <= y:
-            x = x0
-            for col in range(nPoints):
-                g = QgsGeometry.fromPointXY(QgsPointXY(x, y))
-                g.rotate(alpha, cen)
-                if (not clipPoints) or g.within(pbuf):
-                    outputFeature = QgsFeature(outputFields)
-                    outputFeature.setAttributes([inputID, row + 1, col + 1])
-                    outputFeature.setGeometry(g)
-                    outputLayer.addFeature(outputFeature)
-                x = x + dx
-            y = y - dx
-            row += 1
-
-    def generatePointsY(
-        self,
-        polygon: QgsMultiPolygon,
-        inputID: str,
-        alpha: float,
-        a: float,
-        b: float,
-        nPoints: int,
-        outputLayer: QgsVectorFileWriter,
-        outputFields: QgsFields,
-        clipPoints: bool,
-    ):
-        """
-        Generates a grid of points within a simulation plot when the y-side is shorter than the x-side.
-
-        Creates a grid where points are aligned along the shorter side (a > b), ensuring the specified number of points
-        along the shorter side of the rectangle. Points are optionally clipped to fit within the plot boundaries and
-        rotated to align with the plot's orientation.
-
-        Parameters:
-            polygon (QgsMultiPolygon): Input polygon geometry representing the simulation plot.
-            inputID (str):             Simulation plot ID.
-            alpha (float):             Rotation angle of the plot.
-            a (float):                 Length of the long side of the plot.
-            b (float):                 Length of the short side of the plot.
-            nPoints (int):             Number of points along the short side.
-            outputLayer (QgsVectorFileWriter): The output layer for storing generated points.
-            outputFields (QgsFields):  Field schema for the output vector file.
-            clipPoints (bool):         Flag to clip points within plot boundaries.
-
-        Returns:
-            None: The method writes the generated points to the output vector file.
-        """
-        cen = polygon.centroid().asPoint()
-        x0 = cen.x() - a / 2.0
-        y0 = cen.y() - b / 2.0
-        x1 = cen.x() + a / 2.0
-        y1 = cen.y() + b / 2.0
-        dy = b / (nPoints - 1)
-        col = 0
-        x = x0
-        if clipPoints:
-            pbuf = polygon.buffer(self.bufPerc * a, self.bufQCirclePoints)
-        while x < (x1 + dy / 2):
-            y = y1
-            for row in range(nPoints):
-                g = QgsGeometry.fromPointXY(QgsPointXY(x, y))
-                g.rotate(alpha, cen)
-                if (not clipPoints) or g.within(pbuf):
-                    outputFeature = QgsFeature(outputFields)
-                    outputFeature.setAttributes([inputID, row + 1, col + 1])
-                    outputFeature.setGeometry(g)
-                    outputLayer.addFeature(outputFeature)
-                y = y - dy
-            x = x + dy
-            col += 1
-
-    def generatePoints(
-        self,
-        inputFN: str,
-        idFieldName: str,
-        outputFN: str,
-        nPoints: int,
-        clipPoints: bool,
-        progressDlg: GProgressDialog,
-    ):
-        """
-        Generates a complete grid of points for each simulation plot's bounding rectangle.
-
-        This method reads input polygon geometries, determines the optimal grid orientation, and generates a
-        grid of points that follow the plot's position and rotation. Points are optionally clipped to remain
-        within each plot's boundaries. The grid density is specified by the number of points along the shorter
-        side of each plot.
-
-        Parameters:
-            inputFN (str):     Path to the input file containing simulation plot polygons.
-            idFieldName (str): Field name representing the plot ID in the input file.
-            outputFN (str):    Path to the output vector file for storing generated points.
-            nPoints (int):     Number of points along the shorter side of the rectangle.
-            clipPoints (bool): Flag to indicate whether points should be clipped to the plot boundary.
-            progressDlg (GProgressDialog): A dialog to display the progress of the operation.
-
-        Raises:
-            ValueError: If the input layer's geometry is not of polygon type.
-
-        Returns:
-            None: Directly writes the generated points to the output vector file.
-        """
-        inputLayer = QgsVectorLayer(inputFN, "forest stands", "ogr")
-        if inputLayer.geometryType() != Qgis.GeometryType.Polygon:
-            GenSimPlotUtilities.raiseValueError(f"Geometry must be POLYGON ({inputFN}).", progressDlg)
-        inputIDField = inputLayer.fields().field(idFieldName)
-        outputFields = self.createSPointsFields(QgsField(inputIDField))
-        outputLayer = self.createSPointsShapeFile(
-            outputFN, outputFields, inputLayer.crs()
-        )
-        n = inputLayer.featureCount()
-        GenSimPlotUtilities.startProgress(
-            progressDlg, f"Generating simulation plot points to {outputFN} ...", n
-        )
-        for fid in range(0, n):
-            inputFeature = inputLayer.getFeature(fid)
-            # polygon = inputFeature.geometry()
-            polygon = inputFeature.geometry().asGeometryCollection()[0]
-            a = inputFeature["a"]
-            b = inputFeature["b"]
-            alpha = inputFeature["alpha"]
-            inputID = inputFeature[idFieldName]
-            if b < a:
-                self.generatePointsY(
-                    polygon,
-                    inputID,
-                    alpha,
-                    a,
-                    b,
-                    nPoints,
-                    outputLayer,
-                    outputFields,
-                    clipPoints,
-                )
-            else:
-                self.generatePointsX(
-                    polygon,
-                    inputID,
-                    alpha,
-                    a,
-                    b,
-                    nPoints,
-                    outputLayer,
-                    outputFields,
-                    clipPoints,
-                )
-            GenSimPlotUtilities.incrementProgress(progressDlg)
-
-
-
-#############################################################################
-#   ENVIRONMENTAL VARIABLES
-#############################################################################
-
-class SimulationPlotVariables(PointsGenerator):
-    """
-    A class to assign environmental variables to simulation plots by extracting data from raster layers.
-
-    This class provides methods to extract environmental variable values from raster layers, either at the centroid
-    of each simulation plot or at multiple points within each plot. The extracted values are stored in new fields
-    in the simulation plot's attribute table for further spatial analysis or visualization.
-
-    Attributes:
-        maxFieldNameLength (int): The maximum allowable length for field names in the simulation plot attribute table.
-
-    Methods:
-        valueFromCentroid(spFN: str, spDataFieldName: str, rasterFN: str):
-            Extracts environmental variable values at the centroid of each simulation plot and saves them in a specified field.
-
-        valueFromPoints(spFN: str, spIDField: str, pointsFN: str, pointsDataField: str, rasterFN: str):
-            Extracts environmental variable values for multiple points on each simulation plot, calculates summary statistics
-            (minimum, maximum, mean), and saves them in the simulation plot attribute table.
-    """
-
-    maxFieldNamePrefixLength = 5
-    maxValueFieldNameLength = 10
-
-    def valueFromCentroid(
-        self,
-        shpFN: str,
-        shpValueFieldName: str,
-        rasterFN: str,
-        progressDlg: GProgressDialog,
-    ):
-        """
-        Extracts environmental variable values at the centroid of each simulation plot.
-
-        Reads simulation plot polygons from an input vector file, retrieves the environmental variable values at the centroid
-        of each plot from a raster layer, and saves the values in a specified field within the simulation plot attribute table.
-
-        Parameters:
-            shpFN (str):             Path to the input vector file containing simulation plot polygons.
-            shpValueFieldName (str): Field name for storing the extracted environmental variable values.
-            rasterFN (str):          Path to the input raster file containing environmental data.
-            progressDlg (GProgressDialog): A dialog to display the progress of the operation.
-
-        Raises:
-            ValueError: If the input layer's geometry is not of type polygon.
-            ValueError: If the input raster is invalid.
-            Exception: If the process was canceled by the user.
-
-        Returns:
-            None: The function directly updates the attribute table with extracted values.
-
-        Usage:
-            Ideal for scenarios where environmental data from raster layers is represented at the centroid of each simulation plot,
-            such as in studies focusing on spatially explicit ecological factors within plot geometries.
-
-        """
-        dataLayer = QgsRasterLayer(rasterFN, "data")
-        rdata = dataLayer.dataProvider()
-        if not QgsRasterLayer.isValidRasterFileName(rasterFN):
-            GenSimPlotUtilities.raiseValueError(f"The input raster is invalid ({rasterFN}).", progressDlg)
-        spLayer = QgsVectorLayer(shpFN, "plots", "ogr")
-        if spLayer.geometryType() != Qgis.GeometryType.Polygon:
-            GenSimPlotUtilities.raiseValueError("Geometry must be POLYGON ({shpFN}).", progressDlg)
-        if spLayer.fields().indexFromName(shpValueFieldName) < 0:
-            # add data field to plots layer
-            if self.maxValueFieldNameLength < len(shpValueFieldName):
-                shpValueFieldName = shpValueFieldName[0 : self.maxValueFieldNameLength]
-            if spLayer.fields().indexFromName(shpValueFieldName) < 0:
-                spLayer.dataProvider().addAttributes(
-                    [
-                        QgsField(shpValueFieldName, QVariant.Double),
-                    ]
-                )
-            spLayer.updateFields()
-        n = spLayer.featureCount()
-        GenSimPlotUtilities.startProgress(
-            progressDlg, f"Extracting centroid values for plots from {shpFN} ...", n
-        )
-        spLayer.startEditing()
-        for fid in range(0, n):
-            inputSP = spLayer.getFeature(fid)
-            cen = inputSP.geometry().centroid()
-            val = rdata.identify(
-                cen.asPoint(), QgsRaster.IdentifyFormatValue
-            ).results()[1]
-            if val is not None:
-                inputSP[shpValueFieldName] = val
-                spLayer.updateFeature(inputSP)
-            GenSimPlotUtilities.incrementProgress(progressDlg)
-        spLayer.commitChanges()
-
-    def valueFromPoints(
-        self,
-        spFN: str,
-        spIDField: str,
-        pointsFN: str,
-        valueFieldName: str,
-        rasterFN: str,
-        progressDlg: GProgressDialog,
-    ):
-        """
-        Extracts environmental variable values for multiple points on each simulation plot and calculates statistics.
-
-        Reads polygons and points from vector files, extracts environmental values at each point location from a raster layer,
-        and calculates summary statistics (minimum, maximum, and mean) for each simulation plot. The computed statistics are
-        stored as new fields in the simulation plot attribute table.
-
-        Parameters:
-            spFN (str):           Path to the input vector file containing simulation plot polygons.
-            spIDField (str):      Field name identifying each simulation plot.
-            pointsFN (str):       Path to the input vector file containing points within simulation plots.
-            valueFieldName (str): Field name for storing extracted environmental variable values in the points layer.
-            rasterFN (str):       Path to the input raster file containing environmental data.
-            progressDlg (GProgressDialog): A dialog to display the progress of the operation.
-
-        Raises:
-            ValueError: If the points layer's geometry is not of type point.
-
-        Returns:
-            None: The function directly updates both the points and simulation plot attribute tables with extracted values
-            and calculated statistics.
-
-        Usage:
-            'valueFromPoints' is ideal for applications needing detailed environmental data representation across multiple
-            points in each simulation plot, such as spatial analyses that consider within-plot variability in ecological studies.
-
-        """
-        if self.maxFieldNamePrefixLength < len(valueFieldName):
-            valueFieldName = valueFieldName[0 : self.maxFieldNamePrefixLength]
-        spMinFieldName = valueFieldName + "_min"
-        spMaxFieldName = valueFieldName + "_max"
-        spMeanFieldName = valueFieldName + "_mean"
-        dataLayer = QgsRasterLayer(rasterFN, "data")
-        rdata = dataLayer.dataProvider()
-        if not QgsRasterLayer.isValidRasterFileName(rasterFN):
-            GenSimPlotUtilities.raiseValueError(f"The input raster is invalid ({rasterFN}).", progressDlg)
-        pointsLayer = QgsVectorLayer(pointsFN, "points", "ogr")
-        if pointsLayer.geometryType() != Qgis.GeometryType.Point:
-            GenSimPlotUtilities.raiseValueError(f"Geometry must be POINT ({pointsFN}).", progressDlg)
-        if pointsLayer.fields().indexFromName(valueFieldName) < 0:
-            # add data field to points layer
-            pointsLayer.dataProvider().addAttributes(
-                [
-                    QgsField(valueFieldName, QVariant.Double),
-                ]
-            )
-            pointsLayer.updateFields()
-        n = pointsLayer.featureCount()
-        GenSimPlotUtilities.startProgress(
-            progressDlg, f"Extracting point values for plots from {spFN} ...", n
-        )
-        spDict = dict()
-        pointsLayer.startEditing()
-        for fid in range(0, n):
-            inputPoint = pointsLayer.getFeature(fid)
-            geom = inputPoint.geometry()
-            spId = inputPoint[spIDField]
-            val = rdata.identify(
-                geom.asPoint(), QgsRaster.IdentifyFormatValue
-            ).results()[1]
-            if val is not None:
-                inputPoint[valueFieldName] = val
-                pointsLayer.updateFeature(inputPoint)
-                if spId in spDict:
-                    valmin = min(val, spDict[spId]["min"])
-                    valmax = max(val, spDict[spId]["max"])
-                    valsum = val + spDict[spId]["sum"]
-                    valn = spDict[spId]["n"] + 1
-                    spDict[spId] = {
-                        "min": valmin,
-                        "max": valmax,
-                        "sum": valsum,
-                        "n": valn,
-                    }
-                else:
-                    spDict[spId] = {"min": val, "max": val, "sum": val, "n": 1}
-            if (fid % 5000) == 0:
-                # partial commit
-                pointsLayer.commitChanges(stopEditing=False)
-            GenSimPlotUtilities.incrementProgress(progressDlg)
-        pointsLayer.commitChanges()
-        # calculate the mean of point data
-        for spId in spDict:
-            spDict[spId]["mean"] = spDict[spId]["sum"] / spDict[spId]["n"]
-        # update simulation plots
-        spLayer = QgsVectorLayer(spFN, "plots", "ogr")
-        if spMinFieldName is not None:
-            if spLayer.fields().indexFromName(spMinFieldName) < 0:
-                spLayer.dataProvider().addAttributes(
-                    [
-                        QgsField(spMinFieldName, QVariant.Double),
-                    ]
-                )
-        if spMaxFieldName is not None:
-            if spLayer.fields().indexFromName(spMaxFieldName) < 0:
-                spLayer.dataProvider().addAttributes(
-                    [
-                        QgsField(spMaxFieldName, QVariant.Double),
-                    ]
-                )
-        if spMeanFieldName is not None:
-            if spLayer.fields().indexFromName(spMeanFieldName) < 0:
-                spLayer.dataProvider().addAttributes(
-                    [
-                        QgsField(spMeanFieldName, QVariant.Double),
-                    ]
-                )
-        spLayer.updateFields()
-        n = spLayer.featureCount()
-        spLayer.startEditing()
-        for fid in range(0, n):
-            inputSP = spLayer.getFeature(fid)
-            spId = inputSP[spIDField]
-            if spId in spDict:
-                if spMinFieldName is not None:
-                    inputSP[spMinFieldName] = spDict[spId]["min"]
-                if spMaxFieldName is not None:
-                    inputSP[spMaxFieldName] = spDict[spId]["max"]
-                if spMeanFieldName is not None:
-                    inputSP[spMeanFieldName] = spDict[spId]["mean"]
-                spLayer.updateFeature(inputSP)
-            GenSimPlotUtilities.incrementProgress(progressDlg)
-        spLayer.commitChanges()
+# -*- coding: utf-8 -*-
+"""
+Package:   GenSimPlot
+File:      GenSimPlotLib.py
+Version:   2.1
+Author:    Milan Koren
+Year:      2024
+URL:       https://github.com/milan-koren/GenSimPlot
+License:   EUPL v1.2 (European Union Public License), https://eupl.eu/
+
+The implementation of various classes for creating different types of simulation plots, 
+such as squares, circles, rectangles, and ellipses based on different criteria.
+"""
+
+from cmath import rect
+from functools import lru_cache
+import math
+import os
+import random
+import numpy as np
+from qgis.core import *
+from PyQt5.QtCore import QVariant
+from osgeo import gdal
+
+from GenSimPlotUtilities import GProgressDialog
+from GenSimPlotUtilities import GBackgroundTask
+from GenSimPlotUtilities import GenSimPlotUtilities
+
+
+#############################################################################
+#   SIMULATION PLOTS
+#############################################################################
+
+class PolygonPlot:
+    """
+    The PolygonPlot class provides foundational functionality for creating and manipulating
+    various types of simulation plots based on polygons.
+
+    This class includes methods to set up the centroid, bounding box, and mean coordinates of a polygon,
+    and supports generating different simulation plot geometries, including squares, circles, rectangles, and ellipses.
+
+    Subclasses of PolygonPlot implement specific behaviors for creating each type of simulation plot
+    through the following virtual methods:
+        - createPlot(self, polygon: QgsGeometry): Initializes the plot based on the input polygon geometry.
+        - createGeometry(self): Defines the geometry of the simulation plot.
+        - clone(self): Creates a copy of the current plot instance.
+        - resize(self, perc: float) Adjusts the size of the plot by a specified percentage.
+
+    Attributes:
+        sideRatioMax (float):        The maximum allowable ratio between the long and short sides of the bounding rectangle.
+        ellipseNumPoints (int):      The number of points used to approximate an ellipse.
+        originalPosition (QgsPoint): The initial position of the simulation plot.
+        polygonArea (float):         The area of the polygon associated with the plot.
+        polygonPerimeter (float):    The perimeter of the associated polygon.
+        translatedPosition (QgsPoint): The current position of the simulation plot after translation.
+        a (float):                   The length of the plot's long side.
+        b (float):                   The length of the plot's short side.
+        geom (QgsGeometry):          The geometry of the current simulation plot.
+        tx (float):                  The translation distance in the x-direction.
+        ty (float):                  The translation distance in the y-direction.
+        alpha (float):               The rotation angle of the plot in degrees.
+    """
+
+    sideRatioMax = 4.0
+    ellipseNumPoints = 100
+
+    _metricsPolygon = None
+    _metricsCache = None
+
+    @staticmethod
+    def polygonMetrics(polygon: QgsGeometry):
+        """
+        Returns the cached metrics dictionary of a polygon.
+
+        The area and perimeter are computed once per polygon and shared by all
+        plot factories processing the same feature; position anchors are added
+        lazily by the setup methods. The cache holds the metrics of the most
+        recently seen polygon, matching the feature-by-feature processing of
+        the generators.
+
+        Parameters:
+            polygon (QgsGeometry): The polygon to calculate metrics for.
+
+        Returns:
+            dict: The metrics of the polygon.
+        """
+        if PolygonPlot._metricsPolygon is not polygon:
+            PolygonPlot._metricsPolygon = polygon
+            PolygonPlot._metricsCache = {
+                "area": polygon.area(),
+                "perimeter": polygon.length(),
+            }
+        return PolygonPlot._metricsCache
+
+    @staticmethod
+    def seedPolygonMetrics(polygon: QgsGeometry, metrics: dict):
+        """
+        Installs previously computed metrics for a polygon into the cache.
+
+        Generators that keep metrics across repeated runs over the same input
+        seed the cache with the stored dictionary, so the lazily added anchors
+        from earlier runs are reused instead of being recomputed for the newly
+        read geometry object.
+
+        Parameters:
+            polygon (QgsGeometry): The polygon the metrics belong to.
+            metrics (dict):        The metrics dictionary of the polygon.
+        """
+        PolygonPlot._metricsPolygon = polygon
+        PolygonPlot._metricsCache = metrics
+
+    def __init__(self):
+        self.gname = "geometry"
+        self.gposition = "unknown"
+        self.originalPosition = QgsPoint(0.0, 0.0)
+        self.polygonArea = 0.0
+        self.polygonPerimeter = 0.0
+        self.translatedPosition = QgsPoint(0.0, 0.0)
+        self.a = 0.0
+        self.b = 0.0
+        self.geom = None
+        self.tx = 0.0
+        self.ty = 0.0
+        self.alpha = 0.0
+
+    def setupCentroid(self, polygon: QgsGeometry):
+        """
+        Set the initial position of simulation plot to the centroid of the polygon.
+
+        Parameters:
+            polygon (QgsGeometry): The polygon for which the centroid is calculated.
+        """
+        metrics = self.polygonMetrics(polygon)
+        if "centroid" not in metrics:
+            metrics["centroid"] = polygon.centroid().asPoint()
+        self.originalPosition = metrics["centroid"]
+        self.polygonArea = metrics["area"]
+        self.polygonPerimeter = metrics["perimeter"]
+        self.translatedPosition = QgsPointXY(self.originalPosition)
+
+    def setupBBox(self, polygon: QgsGeometry):
+        """
+        Set up the initial position of plot to centroid of the bounding box of the polygon.
+
+        Parameters:
+            polygon (QgsGeometry): The polygon for which the bounding box is calculated.
+        """
+        metrics = self.polygonMetrics(polygon)
+        if "bboxCenter" not in metrics:
+            metrics["bboxCenter"] = polygon.boundingBox().center()
+        self.originalPosition = metrics["bboxCenter"]
+        self.polygonArea = metrics["area"]
+        self.polygonPerimeter = metrics["perimeter"]
+        self.translatedPosition = QgsPointXY(self.originalPosition)
+
+    def setupMeanXY(self, polygon: QgsGeometry):
+        """
+        Set up the initial position of plot to the mean coordinates of the polygon.
+
+        Parameters:
+            polygon (QgsGeometry): The polygon for which the mean coordinates are calculated.
+        """
+        metrics = self.polygonMetrics(polygon)
+        if "meanXY" not in metrics:
+            metrics["meanXY"] = self.meanXY(polygon)
+        self.originalPosition = metrics["meanXY"]
+        self.polygonArea = metrics["area"]
+        self.polygonPerimeter = metrics["perimeter"]
+        self.translatedPosition = QgsPointXY(self.originalPosition)
+
+    def setupSquare(self):
+        """
+        Calculates the side length of a square simulation plot that has an area equal to the given polygon.
+        This function ensures the simulation plot has equal long and short sides, resulting in a square plot.
+        """
+        self.a = math.sqrt(self.polygonArea)
+        self.b = self.a
+
+    def createSquare(self):
+        """
+        Creates a square simulation plot with predefined side length.
+        """
+        cx = self.originalPosition.x()
+        cy = self.originalPosition.y()
+        a2 = self.a / 2
+        self.geom = QgsGeometry.fromRect(
+            QgsRectangle(cx - a2, cy - a2, cx + a2, cy + a2)
+        )
+
+    def setupCircle(self):
+        """
+        Calculates the radius of a circular simulation plot with an area equal to the specified polygon.
+        Set up the long and short sides of the simulation plot to be equal.
+        """
+        r = math.sqrt(self.polygonArea / math.pi)
+        self.a = 2 * r
+        self.b = self.a
+
+    def createCircle(self):
+        """
+        Creates a circular simulation plot with predefined diameter and center.
+        """
+        c = QgsPoint(self.originalPosition.x(), self.originalPosition.y())
+        r = self.a / 2.0
+        self.geom = QgsGeometry(QgsCircle(c, r, 0.0).toPolygon())
+
+    def setupRectangle(self):
+        """
+        Calculates the dimensions of a rectangular simulation plot with an area equal to that of the specified polygon.
+        Determines the length of both the longer and shorter sides to achieve the specified area.
+        """
+        d = math.sqrt(
+            max(self.polygonPerimeter * self.polygonPerimeter - 16 * self.polygonArea, 0.0)
+        )
+        cap = self.sideRatioMax if self.sideRatioMax is not None else math.inf
+        # (p+d)/4 * (p-d)/4 == polygonArea, so the capped side keeps the area exact
+        self.b = max((self.polygonPerimeter - d) / 4, math.sqrt(self.polygonArea / cap))
+        self.a = self.polygonArea / self.b
+
+    def createRectangle(self):
+        """
+        Creates a rectangular simulation plot with predefined dimensions.
+        """
+        cx = self.originalPosition.x()
+        cy = self.originalPosition.y()
+        a2 = self.a / 2
+        b2 = self.b / 2
+        self.geom = QgsGeometry.fromRect(
+            QgsRectangle(cx - a2, cy - b2, cx + a2, cy + b2)
+        )
+
+    def setupEllipse(self):
+        """
+        Calculates the major and minor axis of the ellipse simulation plot of equal area of polygon.
+        """
+        d = math.sqrt(
+            max(self.polygonPerimeter * self.polygonPerimeter - 16 * self.polygonArea, 0.0)
+        )
+        cap = self.sideRatioMax if self.sideRatioMax is not None else math.inf
+        r = min((self.polygonPerimeter + d) / (self.polygonPerimeter - d), cap)
+        a = math.sqrt(r * self.polygonArea / math.pi)
+        self.a = 2 * a
+        self.b = 2 * a / r
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def unitEllipseXY(numPoints: int):
+        """
+        Returns the cached unit-circle coordinates used to approximate ellipses.
+
+        Parameters:
+            numPoints (int): The number of points used to approximate the ellipse.
+
+        Returns:
+            tuple: Closed arrays of the x and y coordinates on the unit circle.
+        """
+        angles = np.linspace(0.0, 2.0 * math.pi, numPoints, endpoint=False)
+        xs = np.cos(angles)
+        ys = np.sin(angles)
+        return (np.append(xs, xs[0]), np.append(ys, ys[0]))
+
+    def createEllipse(self):
+        """
+        Creates an elliptical simulation plot with predefined major and minor axes.
+        """
+        cx = self.originalPosition.x()
+        cy = self.originalPosition.y()
+        unitX, unitY = self.unitEllipseXY(self.ellipseNumPoints)
+        xs = cx + (self.a / 2) * unitX
+        ys = cy + (self.b / 2) * unitY
+        self.geom = QgsGeometry(QgsPolygon(QgsLineString(xs.tolist(), ys.tolist())))
+
+    def setupFromPlot(self, plot):
+        """
+        Sets the parameters of the simulation plot based on an existing plot.
+        """
+        self.originalPosition = QgsPointXY(plot.originalPosition)
+        self.polygonArea = plot.polygonArea
+        self.polygonPerimeter = plot.polygonPerimeter
+        self.translatedPosition = QgsPointXY(plot.translatedPosition)
+        self.a = plot.a
+        self.b = plot.b
+        self.geom = QgsGeometry(plot.geom)
+        self.tx = plot.tx
+        self.ty = plot.ty
+        self.alpha = plot.alpha
+
+    def applyTranslate(self, dx, dy):
+        """
+        Translates the simulation plot geometry in place.
+
+        Parameters:
+            dx (float): The distance to move the plot along the x-axis.
+            dy (float): The distance to move the plot along the y-axis.
+        """
+        self.geom.translate(dx, dy)
+        self.translatedPosition = QgsPointXY(
+            self.translatedPosition.x() + dx, self.translatedPosition.y() + dy
+        )
+        self.tx += dx
+        self.ty += dy
+
+    def translate(self, dx, dy):
+        """
+        Translates the simulation plot by a given distance along the x and y axes.
+
+        Parameters:
+            dx (float): The distance to move the plot along the x-axix.
+            dy (float): The distance to move the plot along the y-axis.
+
+        Returns:
+            A new simulation plot with the translated geometry.
+        """
+        nplot = self.clone()
+        nplot.applyTranslate(dx, dy)
+        return nplot
+
+    def applyRotate(self, angle):
+        """
+        Rotates the simulation plot geometry in place.
+
+        Parameters:
+            angle (float): The angle of rotation in degrees.
+        """
+        self.geom.rotate(angle, self.translatedPosition)
+        self.alpha += angle
+
+    def rotate(self, angle):
+        """
+        Rotates the simulation plot by a specified angle.
+
+        Parameters:
+            angle (float): The angle of rotation in degrees.
+
+        Returns:
+            A new simulation plot with the rotated geometry.
+        """
+        nplot = self.clone()
+        nplot.applyRotate(angle)
+        return nplot
+
+    def randomTranslate(self, maxPerc):
+        """
+        Randomly translates the simulation plot within a specified percentage of its longest side length.
+
+        The plot is shifted by a random distance along both the x and y axes, where the maximum shift is
+        determined as a percentage of the plot's longest side.
+
+        Parameters:
+            maxPerc (float): The maximum percentage of the longest side length to translate the plot.
+
+        Returns:
+            A new simulation plot with the translated geometry.
+        """
+        dx = self.a * math.sin(math.radians(self.alpha)) + self.b * math.cos(
+            math.radians(self.alpha)
+        )
+        dy = self.a * math.cos(math.radians(self.alpha)) + self.b * math.sin(
+            math.radians(self.alpha)
+        )
+        tx = maxPerc * dx * (2.0 * random.random() - 1.0)
+        ty = maxPerc * dy * (2.0 * random.random() - 1.0)
+        return self.translate(tx, ty)
+
+    def randomRotate(self, maxAngle):
+        """
+        Randomly rotates the simulation plot within a specified angle range.
+
+        Parameters:
+            maxAngle (float): The maximum angle, in degrees, by which the plot can be randomly rotated.
+
+        Returns:
+            A new simulation plot with rotated geometry.
+        """
+        angle = maxAngle * (2.0 * random.random() - 1.0)
+        return self.rotate(angle)
+
+    def resizeRectangle(self, perc):
+        """
+        Resizes the simulation plot by a given percentage.
+
+        Parameters:
+            perc (float): the percentage to scale the simulation plot by.
+        """
+        a = self.a * (1 + perc)
+        b = self.b / (1 + perc)
+        if a < b:
+            c = b
+            b = a
+            a = c
+        if self.sideRatioMax is not None:
+            if a / b <= self.sideRatioMax:
+                self.a = a
+                self.b = b
+
+    def resize(self, perc: float):
+        """
+        Resizes the simulation plot by a specified percentage.
+
+        Parameters:
+            perc (float): The percentage by which to resize the simulation plot.
+
+        Returns:
+            A new instance of the simulation plot with the adjusted geometry.
+        """
+        plot = self.clone()
+        plot.resizeRectangle(perc)
+        plot.createGeometry()
+        plot.geom.translate(plot.tx, plot.ty)
+        plot.geom.rotate(plot.alpha, plot.translatedPosition)
+        return plot
+
+    def randomResize(self, maxResizePerc: float):
+        """
+        Randomly resizes the simulation plot by a specified maximum percentage.
+
+        Parameters:
+            maxResizePerc (float): The maximum percentage variation to apply when randomly resizing the plot.
+
+        Returns:
+            A new instance of the simulation plot with randomly adjusted geometry.
+        """
+        perc = maxResizePerc * (2.0 * random.random() - 1.0)
+        return self.resize(perc)
+
+    def randomTransform(
+        self,
+        maxResizePerc: float,
+        maxTranslatePerc: float,
+        maxAngle: float,
+        deltas=None,
+    ):
+        """
+        Applies a random resize, translation, and rotation to the simulation plot in one step.
+
+        The plot is cloned once by the resize and the translation and rotation are
+        applied to the clone in place, instead of creating an intermediate copy
+        per transformation.
+
+        Parameters:
+            maxResizePerc (float):    The maximum percentage variation to apply when resizing the plot.
+            maxTranslatePerc (float): The maximum percentage of the longest side length to translate the plot.
+            maxAngle (float):         The maximum angle, in degrees, by which the plot can be rotated.
+            deltas:                   Optional sequence of four uniform deltas in [-1, 1] driving the resize,
+                                      translation, and rotation; drawn from the random module when omitted.
+
+        Returns:
+            A new simulation plot with randomly adjusted geometry.
+        """
+        if deltas is None:
+            deltas = (
+                2.0 * random.random() - 1.0,
+                2.0 * random.random() - 1.0,
+                2.0 * random.random() - 1.0,
+                2.0 * random.random() - 1.0,
+            )
+        nplot = self.resize(maxResizePerc * deltas[0])
+        dx = nplot.a * math.sin(math.radians(nplot.alpha)) + nplot.b * math.cos(
+            math.radians(nplot.alpha)
+        )
+        dy = nplot.a * math.cos(math.radians(nplot.alpha)) + nplot.b * math.sin(
+            math.radians(nplot.alpha)
+        )
+        nplot.applyTranslate(
+            maxTranslatePerc * dx * deltas[1], maxTranslatePerc * dy * deltas[2]
+        )
+        nplot.applyRotate(maxAngle * deltas[3])
+        return nplot
+
+    def meanXY(self, polygon: QgsGeometry):
+        """
+        Calculate the mean coordinates of a polygon.
+
+        Parameters:
+            polygon (QgsGeometry): The polygon geometry for which the mean coordinates are calculated.
+
+        Returns:
+            QgsPoint: A point with the mean x and y coordinates of the polygon.
+        """
+        xy = np.fromiter(
+            (c for p in polygon.vertices() for c in (p.x(), p.y())),
+            dtype=np.float64,
+        ).reshape(-1, 2)
+        if 0 < len(xy):
+            return QgsPointXY(xy[:, 0].mean(), xy[:, 1].mean())
+        else:
+            return None
+
+
+class SquareByCentroid(PolygonPlot):
+    """
+    This class represents a square simulation plot based on the centroid of a polygon.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.gname = "square"
+        self.gposition = "centroid"
+
+    def createPlot(self, polygon: QgsGeometry):
+        plot = SquareByCentroid()
+        plot.setupCentroid(polygon)
+        plot.setupSquare()
+        plot.createSquare()
+        return plot
+
+    def createGeometry(self):
+        plot.createSquare()
+
+    def clone(self):
+        plot = SquareByCentroid()
+        plot.setupFromPlot(self)
+        return plot
+
+    def resize(self, perc: float):
+        return self.clone()
+
+
+class SquareByBBox(PolygonPlot):
+    """
+    This class represents a square simulation plot based on the bounding box of a polygon.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.gname = "square"
+        self.gposition = "bbox"
+
+    def createPlot(self, polygon: QgsGeometry):
+        plot = SquareByBBox()
+        plot.setupBBox(polygon)
+        plot.setupSquare()
+        plot.createSquare()
+        return plot
+
+    def createGeometry(self):
+        plot.createSquare()
+
+    def clone(self):
+        plot = SquareByBBox()
+        plot.setupFromPlot(self)
+        return plot
+
+    def resize(self, perc: float):
+        return self.clone()
+
+
+class SquareByMeanXY(PolygonPlot):
+    """
+    This class represents a square simulation plot based on the mean coordinates of a polygon.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.gname = "square"
+        self.gposition = "meanxy"
+
+    def createPlot(self, polygon: QgsGeometry):
+        plot = SquareByMeanXY()
+        plot.setupMeanXY(polygon)
+        plot.setupSquare()
+        plot.createSquare()
+        return plot
+
+    def createGeometry(self):
+        plot.createSquare()
+
+    def clone(self):
+        plot = SquareByMeanXY()
+        plot.setupFromPlot(self)
+        return plot
+
+    def resize(self, perc: float):
+        return self.clone()
+
+
+class CircleByCentroid(PolygonPlot):
+    """
+    This class represents a circular simulation plot based on the centroid of a polygon.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.gname = "circle"
+        self.gposition = "centroid"
+
+    def createPlot(self, polygon: QgsGeometry):
+        plot = CircleByCentroid()
+        plot.setupCentroid(polygon)
+        plot.setupCircle()
+        plot.createCircle()
+        return plot
+
+    def createGeometry(self):
+        plot.createCircle()
+
+    def clone(self):
+        plot = CircleByCentroid()
+        plot.setupFromPlot(self)
+        return plot
+
+    def resize(self, perc: float):
+        return self.clone()
+
+    def applyRotate(self, angle):
+        pass
+
+
+class CircleByBBox(PolygonPlot):
+    """
+    This class represents a circular simulation plot based on the bounding box.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.gname = "circle"
+        self.gposition = "bbox"
+
+    def createPlot(self, polygon: QgsGeometry):
+        plot = CircleByBBox()
+        plot.setupBBox(polygon)
+        plot.setupCircle()
+        plot.createCircle()
+        return plot
+
+    def createGeometry(self):
+        plot.createCircle()
+
+    def clone(self):
+        plot = CircleByBBox()
+        plot.setupFromPlot(self)
+        return plot
+
+    def resize(self, perc: float):
+        return self.clone()
+
+    def applyRotate(self, angle):
+        pass
+
+
+class CircleByMeanXY(PolygonPlot):
+    """
+    This class represents a circular simulation plot based on the mean coordinates of a polygon.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.gname = "circle"
+        self.gposition = "meanxy"
+
+    def createPlot(self, polygon: QgsGeometry):
+        plot = CircleByMeanXY()
+        plot.setupMeanXY(polygon)
+        plot.setupCircle()
+        plot.createCircle()
+        return plot
+
+    def createGeometry(self):
+        plot.createCircle()
+
+    def clone(self):
+        plot = CircleByMeanXY()
+        plot.setupFromPlot(self)
+        return plot
+
+    def resize(self, perc: float):
+        return self.clone()
+
+    def applyRotate(self, angle):
+        pass
+
+
+class RectangleByCentroid(PolygonPlot):
+    """
+    This class represents a rectangular simulation plot based on the centroid of a polygon.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.gname = "rectangle"
+        self.gposition = "centroid"
+
+    def createPlot(self, polygon: QgsGeometry):
+        plot = RectangleByCentroid()
+        plot.setupCentroid(polygon)
+        plot.setupRectangle()
+        plot.createRectangle()
+        return plot
+
+    def createGeometry(self):
+        self.createRectangle()
+
+    def clone(self):
+        plot = RectangleByCentroid()
+        plot.setupFromPlot(self)
+        return plot
+
+
+class RectangleByBBox(PolygonPlot):
+    """
+    This class represents a rectangular simulation plot based on the bounding box.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.gname = "rectangle"
+        self.gposition = "bbox"
+
+    def createPlot(self, polygon: QgsGeometry):
+        plot = RectangleByBBox()
+        plot.setupBBox(polygon)
+        plot.setupRectangle()
+        plot.createRectangle()
+        return plot
+
+    def createGeometry(self):
+        self.createRectangle()
+
+    def clone(self):
+        plot = RectangleByBBox()
+        plot.setupFromPlot(self)
+        return plot
+
+
+class RectangleByMeanXY(PolygonPlot):
+    """
+    This class represents a rectangular simulation plot based on the mean coordinates.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.gname = "rectangle"
+        self.gposition = "meanxy"
+
+    def createPlot(self, polygon: QgsGeometry):
+        plot = RectangleByMeanXY()
+        plot.setupMeanXY(polygon)
+        plot.setupRectangle()
+        plot.createRectangle()
+        return plot
+
+    def createGeometry(self):
+        self.createRectangle()
+
+    def clone(self):
+        plot = RectangleByMeanXY()
+        plot.setupFromPlot(self)
+        return plot
+
+
+class EllipseByCentroid(PolygonPlot):
+    """
+    This class represents an elliptical simulation plot based on the centroid of a polygon.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.gname = "ellipse"
+        self.gposition = "centroid"
+
+    def createPlot(self, polygon: QgsGeometry):
+        plot = EllipseByCentroid()
+        plot.setupCentroid(polygon)
+        plot.setupEllipse()
+        plot.createEllipse()
+        return plot
+
+    def createGeometry(self):
+        self.createEllipse()
+
+    def clone(self):
+        plot = EllipseByCentroid()
+        plot.setupFromPlot(self)
+        return plot
+
+
+class EllipseByBBox(PolygonPlot):
+    """
+    This class represents an elliptical simulation plot based on the bounding box.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.gname = "ellipse"
+        self.gposition = "bbox"
+
+    def createPlot(self, polygon: QgsGeometry):
+        plot = EllipseByBBox()
+        plot.setupBBox(polygon)
+        plot.setupEllipse()
+        plot.createEllipse()
+        return plot
+
+    def createGeometry(self):
+        self.createEllipse()
+
+    def clone(self):
+        plot = EllipseByBBox()
+        plot.setupFromPlot(self)
+        return plot
+
+
+class EllipseByMeanXY(PolygonPlot):
+    """
+    This class represents an elliptical simulation plot based on the mean coordinates.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.gname = "ellipse"
+        self.gposition = "meanxy"
+
+    def createPlot(self, polygon: QgsGeometry):
+        plot = EllipseByMeanXY()
+        plot.setupMeanXY(polygon)
+        plot.setupEllipse()
+        plot.createEllipse()
+        return plot
+
+    def createGeometry(self):
+        self.createEllipse()
+
+    def clone(self):
+        plot = EllipseByMeanXY()
+        plot.setupFromPlot(self)
+        return plot
+
+
+
+#############################################################################
+#   PLOT GENERATOR
+#############################################################################
+
+def ringArrayXY(geom: QgsGeometry):
+    """
+    Extracts the exterior ring of a polygon geometry into an (N, 2) NumPy array.
+
+    Parameters:
+        geom (QgsGeometry): The polygon geometry to extract coordinates from.
+
+    Returns:
+        numpy.ndarray: The ring coordinates as a float64 array of shape (N, 2).
+    """
+    return np.array([(p.x(), p.y()) for p in geom.asPolygon()[0]], dtype=np.float64)
+
+
+def pointsInRing(ringXY, pointsX, pointsY):
+    """
+    Tests which points lie inside a closed polygon ring.
+
+    Implements even-odd ray casting vectorized over the points: the short
+    edge loop toggles the whole candidate arrays at once, so the test costs
+    one NumPy pass per edge instead of one geometry-engine call per point.
+    Points outside the ring's bounding box are rejected with four
+    comparisons before any edge is visited, so the edge loop only sees the
+    remaining candidates.
+
+    Parameters:
+        ringXY (np.ndarray): The closed ring coordinates as an (N, 2) array.
+        pointsX (np.ndarray): The x coordinates of the tested points.
+        pointsY (np.ndarray): The y coordinates of the tested points.
+
+    Returns:
+        np.ndarray: A boolean array of the points' shape, True inside the ring.
+    """
+    xmin, ymin = ringXY.min(axis=0)
+    xmax, ymax = ringXY.max(axis=0)
+    candidates = (
+        (xmin <= pointsX) & (pointsX <= xmax) & (ymin <= pointsY) & (pointsY <= ymax)
+    )
+    inside = np.zeros(pointsX.shape, dtype=bool)
+    if not candidates.any():
+        return inside
+    candX = pointsX[candidates]
+    candY = pointsY[candidates]
+    candInside = np.zeros(candX.shape, dtype=bool)
+    for i in range(len(ringXY) - 1):
+        x1, y1 = ringXY[i]
+        x2, y2 = ringXY[i + 1]
+        crossing = (y1 > candY) != (y2 > candY)
+        if crossing.any():
+            xin = x1 + (candY[crossing] - y1) * (x2 - x1) / (y2 - y1)
+            candInside[crossing] ^= candX[crossing] < xin
+    inside[candidates] = candInside
+    return inside
+
+
+def vectorDriverName(outputFN: str):
+    """
+    Selects the OGR driver for an output vector file from its suffix.
+
+    GeoPackage and FlatGeobuf outputs write in large transactions and are
+    considerably faster than shapefiles for bulk loads; files without a
+    recognized suffix keep the ESRI Shapefile driver.
+
+    Parameters:
+        outputFN (str): Path to the output vector file.
+
+    Returns:
+        str: The OGR driver name.
+    """
+    suffix = outputFN.rpartition(".")[2].lower()
+    return {"gpkg": "GPKG", "fgb": "FlatGeobuf"}.get(suffix, "ESRI Shapefile")
+
+
+def splitLayerFileName(outputFN: str):
+    """
+    Splits an output path in the QGIS layer URI convention into file and layer.
+
+    A path such as "plots.gpkg|layername=square_cen" addresses one layer of a
+    multi-layer file; a plain path addresses the whole file and yields None
+    for the layer name.
+
+    Parameters:
+        outputFN (str): The output path, optionally with a "|layername=" part.
+
+    Returns:
+        tuple: The file name and the layer name or None.
+    """
+    fileFN, sep, layerPart = outputFN.partition("|layername=")
+    if sep:
+        return (fileFN, layerPart)
+    return (outputFN, None)
+
+
+def createVectorFile(outputFN: str, outputFields: QgsFields, wkbType, crs):
+    """
+    Creates an output vector file or a layer of a multi-layer file.
+
+    The driver is selected from the file suffix. When the output path carries
+    a "|layername=" part and the file already exists, only that layer is
+    created or overwritten, so several outputs can share one GeoPackage
+    instead of producing a separate file with sidecars per output.
+
+    Parameters:
+        outputFN (str):           The output path, optionally with a "|layername=" part.
+        outputFields (QgsFields): The structure of fields to include in the output file.
+        wkbType:                  The geometry type of the output layer.
+        crs (QgsCoordinateReferenceSystem): The CRS in which to save the output file.
+
+    Returns:
+        QgsVectorFileWriter: A writer object for the newly created layer.
+    """
+    fileFN, layerName = splitLayerFileName(outputFN)
+    svo = QgsVectorFileWriter.SaveVectorOptions()
+    svo.driverName = vectorDriverName(fileFN)
+    if layerName is not None:
+        svo.layerName = layerName
+        if os.path.isfile(fileFN):
+            svo.actionOnExistingFile = QgsVectorFileWriter.CreateOrOverwriteLayer
+    return QgsVectorFileWriter.create(
+        fileFN,
+        outputFields,
+        wkbType,
+        crs,
+        QgsCoordinateTransformContext(),
+        svo,
+        QgsFeatureSink.SinkFlags(),
+        None,
+        None,
+    )
+
+
+def firstPartGeometry(geom: QgsGeometry):
+    """
+    Returns the first part of a geometry as a single-part QgsGeometry.
+
+    Single-part geometries are returned as-is; multipart geometries clone only
+    their first part instead of materializing the whole geometry collection.
+
+    Parameters:
+        geom (QgsGeometry): The geometry to take the first part from.
+
+    Returns:
+        QgsGeometry: The first part of the geometry.
+    """
+    if geom.isMultipart():
+        return QgsGeometry(next(geom.parts()).clone())
+    return geom
+
+
+def convexClipRingArea(clipXY, polyXY):
+    """
+    Calculates the area of a polygon ring clipped by a convex ring.
+
+    The subject ring is clipped against each edge of the convex ring in turn
+    (Sutherland-Hodgman) and the area of the result is evaluated with the
+    shoelace formula, without building an intersection geometry.
+
+    Parameters:
+        clipXY (ndarray): Closed convex clip ring as an (N, 2) coordinate array.
+        polyXY (ndarray): Closed subject ring as an (M, 2) coordinate array.
+
+    Returns:
+        float: The area of the clipped subject ring.
+    """
+    cx = clipXY[:, 0]
+    cy = clipXY[:, 1]
+    sign = 1.0 if np.sum(cx[:-1] * cy[1:] - cx[1:] * cy[:-1]) > 0.0 else -1.0
+    pts = polyXY[:-1]
+    for k in range(len(clipXY) - 1):
+        ax, ay = clipXY[k]
+        ex = clipXY[k + 1, 0] - ax
+        ey = clipXY[k + 1, 1] - ay
+        d = sign * (ex * (pts[:, 1] - ay) - ey * (pts[:, 0] - ax))
+        inside = d >= 0.0
+        if inside.all():
+            continue
+        if not inside.any():
+            return 0.0
+        nextPts = np.roll(pts, -1, axis=0)
+        nextD = np.roll(d, -1)
+        nextInside = nextD >= 0.0
+        crossing = inside != nextInside
+        counts = crossing.astype(np.int64) + nextInside.astype(np.int64)
+        last = np.cumsum(counts)
+        first = last - counts
+        t = d[crossing] / (d[crossing] - nextD[crossing])
+        clipped = np.empty((last[-1], 2), dtype=np.float64)
+        clipped[first[crossing]] = pts[crossing] + t[:, None] * (
+            nextPts[crossing] - pts[crossing]
+        )
+        clipped[last[nextInside] - 1] = nextPts[nextInside]
+        pts = clipped
+    x = pts[:, 0]
+    y = pts[:, 1]
+    return 0.5 * abs(np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y))
+
+
+def geometryFromRingXY(xy):
+    """
+    Builds a polygon geometry from an (N, 2) array of exterior ring coordinates.
+
+    Parameters:
+        xy (numpy.ndarray): The ring coordinates as an array of shape (N, 2).
+
+    Returns:
+        QgsGeometry: The polygon geometry with the given exterior ring.
+    """
+    return QgsGeometry.fromPolygonXY([[QgsPointXY(x, y) for x, y in xy]])
+
+
+
+_vectorLayerCache = dict()
+
+
+def _layerFileSignature(fn: str):
+    """
+    Returns the modification time and size of a vector layer's file.
+
+    Parameters:
+        fn (str): File name of the vector layer, optionally with a layer name suffix.
+
+    Returns:
+        tuple: The (st_mtime_ns, st_size) pair, or None if the file does not exist.
+    """
+    fileFN = splitLayerFileName(fn)[0]
+    try:
+        st = os.stat(fileFN)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def vectorLayer(fn: str, name: str):
+    """
+    Returns a cached vector layer for the given file.
+
+    Tuning runs and scripts open the same source file many times in a row;
+    the cache keeps one open QgsVectorLayer per file name, so repeated reads
+    skip the OGR datasource open and the attribute-table scan. Each cached
+    layer remembers the modification time and size of its file, so a rerun
+    in the QGIS console reuses the open layer while the file is unchanged
+    and transparently reopens it — dropping the polygon metrics derived
+    from it — once the file has been rewritten.
+
+    Parameters:
+        fn (str):   File name of the vector layer.
+        name (str): Display name used when the layer has to be opened.
+
+    Returns:
+        QgsVectorLayer: The cached vector layer.
+    """
+    signature = _layerFileSignature(fn)
+    cached = _vectorLayerCache.get(fn)
+    if cached is not None:
+        layer, cachedSignature = cached
+        if cachedSignature == signature and layer.isValid():
+            return layer
+        for key in [k for k in PlotGenerator._polygonMetricsCache if k[0] == fn]:
+            del PlotGenerator._polygonMetricsCache[key]
+    layer = QgsVectorLayer(fn, name, "ogr")
+    _vectorLayerCache[fn] = (layer, signature)
+    return layer
+
+
+def clearVectorLayerCache():
+    """
+    Releases the cached vector layers, closing their datasets.
+    """
+    _vectorLayerCache.clear()
+
+
+class PolygonOverlap:
+    """
+    Computes overlap areas between an input polygon and candidate simulation plots.
+
+    The polygon is prepared once in a GEOS geometry engine, so the repeated overlap
+    queries issued by the random search loops can short-circuit on disjoint or
+    fully contained candidates instead of building an intersection polygon for
+    every trial.
+
+    Attributes:
+        polygon (QgsGeometry): The input polygon the overlap is computed against.
+        bbox (QgsRectangle):   The bounding box of the polygon, used to reject
+                               disjoint candidates before any GEOS call.
+        engine:                The prepared geometry engine of the polygon.
+    """
+
+    def __init__(self, polygon: QgsGeometry):
+        self.polygon = polygon
+        self.bbox = polygon.boundingBox()
+        self.engine = QgsGeometry.createGeometryEngine(polygon.constGet())
+        self.engine.prepareGeometry()
+        metrics = PolygonPlot.polygonMetrics(polygon)
+        if "ringXY" not in metrics:
+            ringXY = None
+            if not polygon.isMultipart():
+                rings = polygon.asPolygon()
+                if len(rings) == 1:
+                    ringXY = np.array(
+                        [(p.x(), p.y()) for p in rings[0]], dtype=np.float64
+                    )
+            metrics["ringXY"] = ringXY
+        self.polyXY = metrics["ringXY"]
+
+    def contains(self, geom: QgsGeometry):
+        """
+        Returns True if the polygon fully contains the given geometry.
+
+        Parameters:
+            geom (QgsGeometry): The geometry to test.
+        """
+        return self.engine.contains(geom.constGet())
+
+    def area(self, geom: QgsGeometry, geomArea: float = None):
+        """
+        Calculates the area of the intersection of the polygon with a geometry.
+
+        Disjoint candidates return 0 and fully contained candidates return their
+        own area, so the full intersection is only built for partial overlaps.
+
+        Parameters:
+            geom (QgsGeometry):    The geometry to intersect with the polygon.
+            geomArea (float):      Optional precomputed area of the geometry; rotation and
+                                   translation preserve the area, so the search loops pass
+                                   it in to avoid recomputing it for contained candidates.
+
+        Returns:
+            float: The area of the intersection.
+        """
+        if not self.bbox.intersects(geom.boundingBox()):
+            return 0.0
+        g = geom.constGet()
+        if not self.engine.intersects(g):
+            return 0.0
+        if self.engine.contains(g):
+            return geomArea if geomArea is not None else geom.area()
+        return self.engine.intersection(g).area()
+
+    def areaOfRing(self, xy, geomArea: float = None):
+        """
+        Calculates the area of the intersection of the polygon with a convex ring.
+
+        Rectangular candidates intersected with a single-ring polygon are clipped
+        directly with convexClipRingArea(), skipping the construction of a
+        candidate geometry and the GEOS intersection. Other candidates fall back
+        to area().
+
+        Parameters:
+            xy (ndarray):     Closed convex candidate ring as an (N, 2) coordinate array.
+            geomArea (float): Optional precomputed area of the candidate ring.
+
+        Returns:
+            float: The area of the intersection.
+        """
+        if self.polyXY is not None and len(xy) == 5:
+            xmin, ymin = xy.min(axis=0)
+            xmax, ymax = xy.max(axis=0)
+            if (
+                xmax < self.bbox.xMinimum()
+                or self.bbox.xMaximum() < xmin
+                or ymax < self.bbox.yMinimum()
+                or self.bbox.yMaximum() < ymin
+            ):
+                return 0.0
+            return convexClipRingArea(xy, self.polyXY)
+        return self.area(geometryFromRingXY(xy), geomArea)
+
+
+class PlotGenerator:
+    """
+    The PlotGenerator class facilitates the generation of simulation plots from input polygon geometries.
+
+    This class provides methods to create various simulation plot shapes, including squares, circles, rectangles,
+    and ellipses, with flexible positioning options based on attributes such as bounding box, centroid, and mean
+    coordinates of the polygon. Additionally, the class supports random transformations - translations, rotations,
+    and reshaping - to maximize overlap with source polygons.
+
+    Attributes:
+        randomIterations (int): Specifies the number of random iterations for each simulation plot generation.
+        percTranslate (float):  Defines the maximum percentage for random translations in the x and y directions.
+        maxAlpha (float):       Sets the maximum allowable rotation angle, in degrees, for random plot rotations.
+        sideRatioMax (float):   Limits the maximum ratio between the long and short sides of a rectangular plot.
+        maxResizePerc (float):  Determines the maximum percentage by which a plot's size can be altered.
+        featureBufferSize (int): The number of generated plots collected before they are written to the output layer.
+        lastRunStatistics (dict): Overlap statistics of the most recent createPlots run, or None before the first run.
+
+    The polygon metrics (area, perimeter, and the lazily added position
+    anchors and ring coordinates) of every processed feature are kept in a
+    class-level cache keyed by input file and feature ID, so the batch runs
+    that generate several variants from the same input compute them once.
+    """
+
+    featureBufferSize = 1024
+    lastRunStatistics = None
+    _polygonMetricsCache = dict()
+
+    def __init__(self):
+        """
+        Initializes the PlotGenerator class with default values for the simulation plot generation parameters.
+        """
+        self.pointsOutput = None
+        self.setup()
+
+    def setup(
+        self,
+        randomIterations: int = 250,
+        percTranslate: float = 0.05,
+        maxAlpha: float = 5.00,
+        sideRatioMax: float = 4.00,
+        maxResizePerc: float = 0.10,
+    ):
+        """
+        Configures the parameters for the simulation plot generation process.
+
+        This method allows customization of the key parameters influencing how simulation plots are generated, including
+        the number of random iterations, maximum translation, rotation angle, aspect ratio limits, and reshaping percentage.
+
+        Parameters:
+            randomIterations (int): The number of random generation attempts to apply when creating each simulation plot.
+                                    Higher values can improve accuracy but may increase computation time. Default is 250.
+            percTranslate (float):  The maximum allowable percentage for random translation in both x and y directions
+                                    relative to plot size. Default is 0.05.
+            maxAlpha (float):       The maximum rotation angle, in degrees, for random plot rotations to enhance positional
+                                    variation. Default is 5.0 degrees.
+            sideRatioMax (float):   The maximum allowable ratio between the longer and shorter sides of a rectangular plot,
+                                    which constrains plot shape. Default is 4.0.
+            maxResizePerc (float):  The maximum percentage by which the plot size can be altered for reshaping, aiding
+                                    flexibility in adapting plot geometry to source data. Default is 0.10.
+        """
+        self.randomIterations = randomIterations
+        self.percTranslate = percTranslate
+        self.maxAlpha = maxAlpha
+        self.sideRatioMax = sideRatioMax
+        self.maxResizePerc = maxResizePerc
+        self.rng = np.random.default_rng()
+
+    @staticmethod
+    def clearPolygonMetricsCache():
+        """
+        Releases the cached polygon metrics of all processed input files.
+        """
+        PlotGenerator._polygonMetricsCache.clear()
+
+    def setupPointsOutput(
+        self,
+        pointsGenerator: "PointsGenerator" = None,
+        pointsFN: str = None,
+        nPoints: int = 5,
+        clipPoints: bool = False,
+    ):
+        """
+        Configures fused point generation for the next plot-generation runs.
+
+        When a points generator is set, createPlots samples the point grid of
+        every plot right after the plot is created and writes both outputs in
+        one pass, so the plot file is not written and immediately read back
+        by a separate generatePoints call. Call without arguments to switch
+        the fused output off.
+
+        Parameters:
+            pointsGenerator (PointsGenerator): The generator writing the plot points, or None to disable.
+            pointsFN (str):    Path to the output vector file for the generated points.
+            nPoints (int):     The number of points along the shorter side of each plot.
+            clipPoints (bool): Whether generated points are clipped to the plot boundary.
+        """
+        if pointsGenerator is None:
+            self.pointsOutput = None
+        else:
+            self.pointsOutput = (pointsGenerator, pointsFN, nPoints, clipPoints)
+
+    def createSPlotFields(self, idField: QgsField):
+        """
+        Generates a 'QgsFields' object containing fields for simulation plot attributes.
+
+        This function creates a set of fields used to store simulation plot metadata, specifically designed for associating
+        plots with unique forest stand IDs. The fields include identifiers essential for organizing and identifying
+        simulation plots within a forest management or research dataset.
+
+        Parameters:
+            idField (QgsField): The field containing the unique ID for each simulation plot.
+
+        Returns:
+            QgsFields: A 'QgsFields' object with the defined field structure for use in simulation plot layers.
+        """
+        outputFields = QgsFields()
+        outputFields.append(idField)
+        outputFields.append(QgsField("a", QVariant.Double, "double", 6, 2))
+        outputFields.append(QgsField("b", QVariant.Double, "double", 6, 2))
+        outputFields.append(QgsField("alpha", QVariant.Double, "double", 6, 2))
+        outputFields.append(QgsField("perc", QVariant.Double, "double", 6, 2))
+        outputFields.append(QgsField("ishp", QVariant.Double, "double", 6, 2))
+        return outputFields
+
+    def createSPlotShapeFile(self, outputFN: str, outputFields: QgsFields, crs):
+        """
+        Creates a new vector file for storing simulation plot geometries.
+
+        This function generates a vector file to store simulation plot geometries, choosing the driver from the
+        output file suffix (GeoPackage, FlatGeobuf, or ESRI Shapefile). The output file is initialized with a defined
+        structure of fields and a specified Coordinate Reference System (CRS), making it suitable for GIS analysis
+        and visualization. A path with a "|layername=" part addresses one layer of a multi-layer file.
+
+        Parameters:
+            outputFN (str):           The file path and name for the output vector file to be created.
+            outputFields (QgsFields): A 'QgsFields' object defining the structure of fields to include in the output file,
+                                      typically for storing simulation plot metadata.
+            crs (QgsCoordinateReferenceSystem): The CRS in which to save the output file, ensuring spatial accuracy and consistency.
+
+        Returns:
+            QgsVectorFileWriter: A 'QgsVectorFileWriter' instance associated with the newly created Shapefile, enabling
+                                 further data insertion and manipulation.
+        """
+        return createVectorFile(outputFN, outputFields, Qgis.WkbType.Polygon, crs)
+
+    def createSPlot(self, polygon: QgsGeometry, plotFactory, overlap: PolygonOverlap):
+        """
+        Generates a simulation plot using the geometry of an input polygon.
+
+        This function creates a simulation plot by utilizing the specified 'plotFactory' object, which contains
+        the logic to generate plot geometries based on the input polygon. It calls the 'createPlot' method
+        of the provided simulation plot object, ensuring that the generated plot aligns with the spatial properties
+        of the input polygon geometry.
+
+        Parameters:
+            polygon (QgsGeometry): The input polygon geometry that defines the area and shape used for generating
+                                   the simulation plot.
+            plotFactory:           An instance of the simulation plot class (e.g. RectangleByBBox) that contains
+                                   the 'createPlot' method, responsible for creating the plot geometry.
+            overlap (PolygonOverlap): The prepared overlap calculator of the input polygon.
+
+        Returns:
+            QgsGeometry: The generated geometry of the simulation plot.
+        """
+        splot = plotFactory.createPlot(polygon)
+        sarea = overlap.area(splot.geom)
+        return (splot, sarea)
+
+    def createTranslatedPlot(self, polygon: QgsGeometry, plotFactory, overlap: PolygonOverlap):
+        """
+        Generates a randomly translated simulation plot to maximize overlap with an input polygon.
+
+        This function creates a simulation plot based on the provided polygon geometry. It then iteratively translates
+        the plot within a specified percentage ('percTranslate') to maximize the area of overlap between the plot and
+        the input polygon.
+
+        Parameters:
+            polygon (QgsGeometry): The input polygon geometry that serves as the reference for generating
+                                   and aligning the simulation plot.
+            plotFactory:           An instance of the simulation plot class that provides the 'createPlot' and 'randomTranslate'
+                                   methods to generate and translate the plot geometry.
+            overlap (PolygonOverlap): The prepared overlap calculator of the input polygon.
+
+        Returns:
+            SimulationPlot: The randomly translated simulation plot with the maximum overlap area with the input polygon.
+        """
+        splot = plotFactory.createPlot(polygon)
+        plotArea = splot.geom.area()
+        sarea = overlap.area(splot.geom, plotArea)
+        if plotArea <= sarea:
+            return (splot, sarea)
+        ring = ringArrayXY(splot.geom)
+        alphaRad = math.radians(splot.alpha)
+        dx = splot.a * math.sin(alphaRad) + splot.b * math.cos(alphaRad)
+        dy = splot.a * math.cos(alphaRad) + splot.b * math.sin(alphaRad)
+        tx = 0.0
+        ty = 0.0
+        deltas = self.rng.uniform(
+            -1.0, 1.0, (self.randomIterations, 2)
+        )
+        for i in range(self.randomIterations):
+            ntx = tx + self.percTranslate * dx * deltas[i, 0]
+            nty = ty + self.percTranslate * dy * deltas[i, 1]
+            narea = overlap.areaOfRing(ring + (ntx, nty), plotArea)
+            if sarea < narea:
+                sarea = narea
+                tx = ntx
+                ty = nty
+        if tx != 0.0 or ty != 0.0:
+            splot = splot.translate(tx, ty)
+        return (splot, sarea)
+
+    def createRotatedSPlot(self, polygon: QgsGeometry, plotFactory, overlap: PolygonOverlap):
+        """
+        Generates a randomly rotated simulation plot to maximize overlap with an input polygon.
+
+        This function creates an initial simulation plot based on the provided polygon geometry. It then iteratively
+        rotates the plot within a specified maximum angle ('maxAlpha') to maximize the area of overlap between the plot
+        and the input polygon.
+
+        Parameters:
+            polygon (QgsGeometry): The input polygon geometry that serves as the reference for generating and aligning
+                                   the simulation plot.
+            plotFactory:           An instance of the simulation plot class that provides the 'createPlot' and 'randomRotate'
+                                   methods to generate and rotate the plot geometry.
+            overlap (PolygonOverlap): The prepared overlap calculator of the input polygon.
+
+        Returns:
+            SimulationPlot: The randomly rotated simulation plot with the maximum overlap area with the input polygon.
+        """
+        splot = plotFactory.createPlot(polygon)
+        plotArea = splot.geom.area()
+        sarea = overlap.area(splot.geom, plotArea)
+        if plotArea <= sarea:
+            return (splot, sarea)
+        cen = splot.translatedPosition
+        ring = ringArrayXY(splot.geom) - (cen.x(), cen.y())
+        alpha = 0.0
+        angles = self.rng.uniform(
+            -self.maxAlpha, self.maxAlpha, self.randomIterations
+        )
+        # trig of all candidate deltas evaluated in one batch; the trig of the
+        # accepted cumulative angle is maintained with the angle-addition formulas
+        rad = np.radians(angles)
+        cosD = np.cos(rad)
+        sinD = np.sin(rad)
+        cosA = 1.0
+        sinA = 0.0
+        for i in range(self.randomIterations):
+            ca = cosA * cosD[i] - sinA * sinD[i]
+            sa = sinA * cosD[i] + cosA * sinD[i]
+            # clockwise rotation about the plot center, matching QgsGeometry.rotate()
+            rotated = ring @ np.array(((ca, -sa), (sa, ca))) + (cen.x(), cen.y())
+            narea = overlap.areaOfRing(rotated, plotArea)
+            if sarea < narea:
+                sarea = narea
+                alpha += angles[i]
+                cosA = ca
+                sinA = sa
+        if alpha != 0.0:
+            splot = splot.rotate(alpha)
+        return (splot, sarea)
+
+    def createResizedSPlot(self, polygon: QgsGeometry, plotFactory, overlap: PolygonOverlap):
+        """
+        Generates a resized simulation plot by applying random size adjustments to maximize overlap with an input polygon.
+
+        This function initializes a simulation plot based on the provided polygon geometry and iteratively applies random
+        reshaping transformations. After each reshaping, the overlap area between the resized plot and the input polygon
+        is calculated, with the plot configuration that yields the maximum overlap being retained as the final output.
+
+        Parameters:
+            polygon (QgsGeometry): The input polygon geometry used as a reference for generating and optimizing the simulation plot.
+            plotFactory:           An instance of a simulation plot class providing the 'randomResize' method for performing resize transformation.
+            overlap (PolygonOverlap): The prepared overlap calculator of the input polygon.
+
+        Returns:
+            SimulationPlot: The resized simulation plot with the highest achieved overlap area relative to the input polygon.
+        """
+        splot = plotFactory.createPlot(polygon)
+        sarea = overlap.area(splot.geom)
+        percs = self.rng.uniform(
+            -self.maxResizePerc, self.maxResizePerc, self.randomIterations
+        )
+        for i in range(self.randomIterations):
+            nplot = splot.resize(percs[i])
+            narea = overlap.area(nplot.geom)
+            if sarea < narea:
+                sarea = narea
+                splot = nplot
+        return (splot, sarea)
+
+    def createOptimizedSPlot(self, polygon: QgsGeometry, plotFactory, overlap: PolygonOverlap):
+        """
+        Generates an optimized simulation plot by applying random transformations to maximize overlap with an input polygon.
+
+        This function creates an initial simulation plot based on the given polygon geometry and iteratively applies random
+        reshaping, translation, and rotation transformations to the plot. Each transformation sequence is evaluated for its
+        overlap area with the input polygon, and the plot configuration yielding the maximum overlap area is retained.
+
+        Parameters:
+            polygon (QgsGeometry): The input polygon geometry used as a reference for generating and optimizing the simulation plot.
+            plotFactory:           An instance of a simulation plot class that provides 'createPlot', 'randomResize',
+                                   'randomTranslate', and 'randomRotate' methods to perform the transformations.
+            overlap (PolygonOverlap): The prepared overlap calculator of the input polygon.
+
+        Returns:
+            SimulationPlot: The optimized simulation plot with the highest overlap area with the input polygon.
+        """
+        splot = plotFactory.createPlot(polygon)
+        sarea = overlap.area(splot.geom)
+        # bind loop invariants locally; the loop runs hundreds of times per feature
+        maxResizePerc = self.maxResizePerc
+        percTranslate = self.percTranslate
+        maxAlpha = self.maxAlpha
+        overlapArea = overlap.area
+        deltas = self.rng.uniform(
+            -1.0, 1.0, (self.randomIterations, 4)
+        )
+        for i in range(self.randomIterations):
+            nplot = splot.randomTransform(
+                maxResizePerc, percTranslate, maxAlpha, deltas[i]
+            )
+            narea = overlapArea(nplot.geom)
+            if sarea < narea:
+                sarea = narea
+                splot = nplot
+        return (splot, sarea)
+
+    def createBestSPlot(self, polygon: QgsGeometry, plotFactory, overlap: PolygonOverlap):
+        """
+        Generates the most optimal simulation plot that maximizes overlap with the input polygon.
+
+        This function iterates through various shapes (square, circle, rectangle, and ellipse) and different
+        positioning methods (aligned with the bounding box, centered on the centroid, or centered on the mean coordinates)
+        to generate a simulation plot. For each combination, it applies random spatial transformations to achieve maximum
+        overlap area with the input polygon. The resulting plot with the highest overlap is returned. All plot
+        shapes share the area of the input polygon, so the sweep stops early once a variant covers the polygon
+        almost completely - no later variant can improve on it.
+
+        Parameters:
+            polygon (QgsGeometry): The input polygon geometry used as a reference for generating and optimizing the simulation plot.
+            plotFactory:           An instance of a simulation plot class that provides methods such as 'createPlot',
+                                   'randomResize', 'randomTranslate', and 'randomRotate' for performing transformations.
+            overlap (PolygonOverlap): The prepared overlap calculator of the input polygon.
+
+        Returns:
+            The optimized simulation plot that achieves the maximum overlap area with the input polygon.
+        """
+        factories = (
+            SquareByBBox(),
+            SquareByCentroid(),
+            SquareByMeanXY(),
+            CircleByBBox(),
+            CircleByCentroid(),
+            CircleByMeanXY(),
+            RectangleByBBox(),
+            RectangleByCentroid(),
+            RectangleByMeanXY(),
+            EllipseByBBox(),
+            EllipseByCentroid(),
+            EllipseByMeanXY(),
+        )
+        maxArea = PolygonPlot.polygonMetrics(polygon)["area"]
+        bplot = None
+        barea = -1.0
+        for factory in factories:
+            splot, sarea = self.createOptimizedSPlot(polygon, factory, overlap)
+            if barea < sarea:
+                bplot = splot
+                barea = sarea
+            if 0.9999 * maxArea <= barea:
+                break
+        return (bplot, barea)
+
+    def createPlots(
+        self,
+        inputFN: str,
+        idFieldName: str,
+        outputFN: str,
+        plotFactory: PolygonPlot,
+        createFn,
+        progressDlg: GProgressDialog,
+    ):
+        """
+        Generates and saves simulation plots for each polygon feature in an input vector file, saving them to an output vector file.
+
+        This function reads polygon geometries from an input vector file, uses the specified simulation plot factory and creation
+        function to generate individual simulation plots, and writes these plots to an output vector file. The output includes
+        calculated attributes, such as area ratio, shape index, and rotation angle for each plot.
+
+        Parameters:
+            inputFN (str):       Path to the input vector file containing polygon features.
+            idFieldName (str):   Field name for the polygon ID in the input file.
+            outputFN (str):      Path to the output vector file for saving the generated simulation plots.
+            plotFactory (SimulationPlotFactory): Instance of the plot factory used to generate plot geometries.
+            createFn (function): Function reference to create simulation plots based on polygons.
+            progressDlg (GProgressDialog): Optional parameter for displaying a progress dialog during the process.
+
+        Raises:
+            ValueError: If the input layer does not contain polygon geometries or if there is an issue saving a plot to the output layer.
+            Exception: If feature cannot be saved to the output layer.
+            Exception: If process was canceled by the user.
+
+        Process:
+            1. Initializes random seed and loads the input vector layer.
+            2. Ensures that the input layer geometry type is polygon.
+            3. Sets up output fields and creates the output vector file with specified fields and CRS.
+            4. Iterates through each feature in the input layer, generating a simulation plot with 'createFn'.
+            5. Calculates plot-specific metrics, including overlap percentage and shape index.
+            6. Saves each plot with its attributes to the output vector layer.
+
+        Returns:
+            None: The function writes output directly to the specified file path.
+
+        Output Attributes:
+            - Polygon ID.
+            - Simulation plot dimensions ('a', 'b'), rotation angle ('alpha'), and overlap area percentage with the original polygon.
+            - Shape index computed from the perimeter-to-area ratio of the input polygon.
+
+        Side Effects:
+            The overlap percentages of the run are summarized into 'self.lastRunStatistics'
+            (count, minimum, maximum, mean, and standard deviation), so callers evaluating
+            the generated plots do not have to read the output file back.
+            When a points output is configured through setupPointsOutput, the point grids
+            of all plots are generated in the same pass and written right after the plot
+            writer is closed, so the two writers never hold the output file at the same time.
+
+        Usage:
+            This function is ideal for creating detailed simulation plots for each polygon in the input data, storing all relevant
+            geometry and metrics in a new output file.
+        """
+        random.seed()
+        inputLayer = vectorLayer(inputFN, "input polygons")
+        if inputLayer.geometryType() != Qgis.GeometryType.Polygon:
+            GenSimPlotUtilities.raiseValueError(f"Geometry must be POLYGON ({inputFN}).", progressDlg)
+        inputIDField = inputLayer.fields().field(idFieldName)
+        outputFields = self.createSPlotFields(QgsField(inputIDField))
+        outputLayer = self.createSPlotShapeFile(
+            outputFN, outputFields, inputLayer.crs()
+        )
+        pointsOutput = self.pointsOutput
+        if pointsOutput is not None:
+            pointsGenerator, pointsFN, nPoints, clipPoints = pointsOutput
+            pointsQueue = []
+        n = inputLayer.featureCount()
+        GenSimPlotUtilities.startProgress(
+            progressDlg, f"Generating simulation plots to {outputFN} ...", n
+        )
+        outputBuffer = []
+        percs = []
+        inputRequest = QgsFeatureRequest()
+        inputRequest.setSubsetOfAttributes([idFieldName], inputLayer.fields())
+        for inputFeature in inputLayer.getFeatures(inputRequest):
+            polygon = firstPartGeometry(inputFeature.geometry())
+            metricsKey = (inputFN, inputFeature.id())
+            metrics = PlotGenerator._polygonMetricsCache.get(metricsKey)
+            if metrics is None:
+                metrics = PolygonPlot.polygonMetrics(polygon)
+                PlotGenerator._polygonMetricsCache[metricsKey] = metrics
+            else:
+                PolygonPlot.seedPolygonMetrics(polygon, metrics)
+            garea = metrics["area"]
+            ishp = metrics["perimeter"] / math.sqrt(garea)
+            overlap = PolygonOverlap(polygon)
+            splot, sarea = createFn(polygon, plotFactory, overlap)
+            perc = 100.0 * sarea / garea
+            percs.append(perc)
+            inputID = inputFeature[idFieldName]
+            outputFeature = QgsFeature(outputFields)
+            outputFeature.setAttributes(
+                [
+                    inputID,
+                    splot.a,
+                    splot.b,
+                    splot.alpha,
+                    perc,
+                    ishp,
+                ]
+            )
+            outputFeature.setGeometry(splot.geom)
+            outputBuffer.append(outputFeature)
+            if pointsOutput is not None:
+                pointsQueue.append(
+                    (splot.geom, inputID, splot.alpha, splot.a, splot.b)
+                )
+            if len(outputBuffer) == self.featureBufferSize:
+                if not outputLayer.addFeatures(outputBuffer):
+                    GenSimPlotUtilities.raiseException("Cannnot save feature.", progressDlg)
+                outputBuffer.clear()
+            GenSimPlotUtilities.incrementProgress(progressDlg)
+        if outputBuffer:
+            if not outputLayer.addFeatures(outputBuffer):
+                GenSimPlotUtilities.raiseException("Cannnot save feature.", progressDlg)
+        if pointsOutput is not None:
+            # both outputs may live in one GeoPackage, which allows a single
+            # writer at a time; close the plot writer before opening the points
+            del outputLayer
+            pointsFields = pointsGenerator.createSPointsFields(QgsField(inputIDField))
+            pointsLayer = pointsGenerator.createSPointsShapeFile(
+                pointsFN, pointsFields, inputLayer.crs()
+            )
+            GenSimPlotUtilities.startProgress(
+                progressDlg, f"Generating points to {pointsFN} ...", len(pointsQueue)
+            )
+            for plotGeom, plotID, alpha, a, b in pointsQueue:
+                if b < a:
+                    pointsGenerator.generatePointsY(
+                        plotGeom, plotID, alpha, a, b,
+                        nPoints, pointsLayer, pointsFields, clipPoints, progressDlg,
+                    )
+                else:
+                    pointsGenerator.generatePointsX(
+                        plotGeom, plotID, alpha, a, b,
+                        nPoints, pointsLayer, pointsFields, clipPoints, progressDlg,
+                    )
+                GenSimPlotUtilities.incrementProgress(progressDlg)
+            del pointsLayer
+        if percs:
+            percArray = np.asarray(percs)
+            self.lastRunStatistics = {
+                "nPolygons": len(percs),
+                "minPerc": float(percArray.min()),
+                "maxPerc": float(percArray.max()),
+                "avgPerc": float(percArray.mean()),
+                "stdDevPerc": float(percArray.std()),
+            }
+        else:
+            self.lastRunStatistics = {
+                "nPolygons": 0,
+                "minPerc": 0.0,
+                "maxPerc": 0.0,
+                "avgPerc": 0.0,
+                "stdDevPerc": 0.0,
+            }
+
+
+    def generateFixedPlots(
+        self, 
+        inputFN: str, 
+        idFieldName: str, 
+        outputFN: str, 
+        plotFactory: PolygonPlot,
+        progressDlg: GProgressDialog,
+    ):
+        """
+        Generates fixed simulation plots for each polygon feature in the input vector file and saves them to an output vector file.
+
+        This function iterates over each polygon in the input vector file, creating a fixed simulation plot based on a predefined
+        configuration provided by the 'plotFactory'. Each generated plot is saved to an output vector file, complete with attributes
+        linking back to the original polygon and containing simulation-specific details.
+
+        Parameters:
+            inputFN (str):     Path to the input vector file containing polygon geometries.
+            idFieldName (str): Field name for the polygon ID in the input vector file.
+            outputFN (str):    Path to the output vector file where the generated simulation plots will be saved.
+            plotFactory (PolygonPlot): Instance of simulation plot class responsible for generating the plot geometries.
+            progressDlg (GProgressDialog): Optional parameter for displaying a progress dialog during the process.
+
+        Details:
+            - This function uses 'self.createPlots', a generalized method for plot creation, along with a specific plot-creation
+              instance of the simulation plot class.
+            - A fixed simulation plot is generated for each polygon feature in the input vector file and saved to the output vector file.
+            - The output file includes attributes for the original polygon ID and additional information related to the generated plot.
+
+        Returns:
+            None: The function directly writes the generated simulation plots to the specified output file.
+
+        Usage:
+            'generateFixedPlots' is suitable when a consistent, non-randomized plot shape is needed for each polygon in the input data.
+        """
+        self.createPlots(
+            inputFN, 
+            idFieldName, 
+            outputFN, 
+            plotFactory, 
+            self.createSPlot, 
+            progressDlg
+        )
+
+
+    def generateTranslatedPlots(
+        self,
+        inputFN: str, 
+        idFieldName: str, 
+        outputFN: str, 
+        plotFactory: PolygonPlot,
+        progressDlg: GProgressDialog,
+    ):
+        """
+        Generates simulation plots by applying random translations to each polygon feature in the input vector file
+        and saves the results to an output vector file.
+
+        This function processes each polygon in the input vector file, creating simulation plots with randomized
+        translations based on the specified parameters in the 'plotFactory'. The translated plots are saved to an
+        output vector file.
+
+        Parameters:
+            inputFN (str):     Path to the input vector file containing polygon features.
+            idFieldName (str): Field name for the polygon ID in the input vector file.
+            outputFN (str):    Path to the output vector file for saving the generated translated simulation plots.
+            plotFactory (PolygonPlot): An instance of the simulation plot class responsible for creating the plot geometry and managing translations.
+            progressDlg (GProgressDialog): Optional parameter for displaying a progress dialog during the process.
+
+        Details:
+            - For each polygon feature in the input vector file, a new plot is created with random translations.
+            - This function leverages 'self.createPlots', a generalized plot-creation method, with 'self.createTranslatedPlot'
+              as the creation function to apply translation to each simulation plot.
+            - The output vector file records attributes that associate each plot with its original polygon ID, alongside details
+              specific to the translation.
+
+        Returns:
+            None: This function directly saves the output to the specified file path.
+
+        Usage:
+           'generateTranslatedPlots' is ideal for scenarios requiring spatial variation in plot positioning with alignment
+            along coordinate axes, such as ecological or spatial sampling simulations where greater overlap improves representativeness.
+        """
+        self.createPlots(
+            inputFN,
+            idFieldName,
+            outputFN,
+            plotFactory,
+            self.createTranslatedPlot,
+            progressDlg,
+        )
+
+    
+    def generateResizedPlots(
+        self, 
+        inputFN: str, 
+        idFieldName: str, 
+        outputFN: str, 
+        plotFactory: PolygonPlot,
+        progressDlg: GProgressDialog,
+    ):
+        """
+        Generates simulation plots with randomized size adjustments for each polygon feature in the input vector file, saving them to an output file.
+
+        This function reads polygon geometries from the specified input vector file, applies random resizing transformations to create simulation 
+        plots with variable dimensions. It uses the given 'plotFactory' instance and the 'createResizedSPlot' method to control the resizing process
+        and save the plots to the specified output file.
+
+        Parameters:
+            inputFN (str): Path to the input vector file containing polygon features.
+            idFieldName (str): Name of the field representing a unique identifier for each polygon in the input file.
+            outputFN (str): Path to the output vector file where the resized simulation plots will be saved.
+            plotFactory (PolygonPlot): An instance of the plot class responsible for generating and resizing plot geometries.
+            progressDlg (GProgressDialog): Instance of a progress dialog to display updates throughout the resizing operation.
+
+        Details:
+            - Processes each polygon feature in the input vector file to create a resized simulation plot using random size variations.
+            - Calls 'self.createPlots', a generalized method for plot generation, and 'self.createResizedSPlot' for applying size adjustments 
+              that maintain area constraints and improve spatial alignment within each polygon.
+            - Attributes in the output vector file link each resized plot to its original polygon ID and include additional plot-specific data.
+
+        Raises:
+            ValueError: If the input layer's geometry is not a polygon or if there is an error saving a plot to the output layer.
+
+        Returns:
+            None: The function directly writes the resized simulation plots to the specified output file.
+
+        Usage:
+            'generateResizedPlots' is suitable for tasks requiring simulation plots with variable sizes for enhanced spatial alignment 
+            and coverage. It is ideal for scenarios where adaptive plot sizes are necessary to improve overlap with source polygons 
+            for detailed spatial analysis.
+        """
+        self.createPlots(
+            inputFN,
+            idFieldName,
+            outputFN,
+            plotFactory,
+            self.createResizedSPlot,
+            progressDlg,
+        )
+
+
+    def generateRotatedPlots(
+        self, 
+        inputFN: str, 
+        idFieldName: str, 
+        outputFN: str, 
+        plotFactory: PolygonPlot,
+        progressDlg: GProgressDialog,
+    ):
+        """
+        Generates randomly rotated simulation plots for each polygon feature in the input vector file and saves them to an output vector file.
+
+        This function processes polygons from an input vector file, applies random rotational transformations to create simulation plots
+        using the specified 'plotFactory' instance and the 'createRotatedSPlot' function, and saves each generated plot to the specified
+        output file.
+
+        Parameters:
+            inputFN (str):     Path to the input vector file containing polygon features.
+            idFieldName (str): Field name representing the polygon ID in the input file.
+            outputFN (str):    Path to the output vector file where rotated simulation plots will be saved.
+            plotFactory (PolygonPlot): An instance of the simulation plot class responsible for generating plot geometries.
+            progressDlg (GProgressDialog): Optional parameter for displaying a progress dialog during the process.
+
+        Details:
+            - Each polygon feature in the input vector file is processed to create a randomly rotated simulation plot.
+            - Uses 'self.createPlots', a generalized plot-creation method, with 'self.createRotatedSPlot' to apply
+              random rotations to each plot.
+            - The output vector file records attributes that associate each plot with its original polygon ID, alongside details
+              specific to the rotation.
+
+        Raises:
+            ValueError: Raised if the input layer geometry is not a polygon or if there is an error saving a plot to the output layer.
+
+        Returns:
+            None: This function directly writes output to the specified file path.
+
+        Usage:
+            'generateRotatedPlots' is ideal for applications requiring rotated simulation plots, such as spatial sampling or ecological
+            studies, where randomly rotated plots can improve the spatial overlap and alignment with the original polygon.
+        """
+        self.createPlots(
+            inputFN,
+            idFieldName,
+            outputFN,
+            plotFactory,
+            self.createRotatedSPlot,
+            progressDlg,
+        )
+
+
+    def generateOptimizedPlots(
+        self, 
+        inputFN: str, 
+        idFieldName: str, 
+        outputFN: str, 
+        plotFactory: PolygonPlot,
+        progressDlg: GProgressDialog,
+    ):
+        """
+        Generates optimized simulation plots for each polygon feature in the input vector file and saves them to an output vector file.
+
+        This function processes polygons from an input vector file and applies a series of transformation - such as random
+        translations, rotations, and reshaping - using the 'plotFactory' instance and the 'createOptimizedSPlot' function
+        to maximize spatial overlap with the input polygons. The resulting plots are saved to the specified output file.
+
+        Parameters:
+            inputFN (str):     Path to the input vector file containing polygon features.
+            idFieldName (str): Field name representing the polygon ID in the input file.
+            outputFN (str):    Path to the output vector file where the optimized simulation plots will be saved.
+            plotFactory (PolygonPlot): An instance of the simulation plot class responsible for generating plot geometries.
+            progressDlg (GProgressDialog): Optional parameter for displaying a progress dialog during the process.
+
+        Details:
+            - Utilizes 'self.createPlots', a generalized plot-creation method, with 'self.createOptimizedSPlot' to apply iterative
+              transformations aimed at maximizing area overlap with the original polygon.
+            - Each plot undergoes randomized adjustments in position, rotation, and size to achieve optimal alignment
+              with the input polygons.
+
+        Raises:
+            ValueError: Raised if the input layer geometry is not a polygon or if a plot cannot be saved to the output layer.
+
+        Returns:
+            None: The function directly writes the output to the specified file path.
+
+        Usage:
+            'generateOptimizedPlots' is particularly useful for spatial simulations or sampling studies where high overlap
+            between simulation plots and source polygons is essential, providing a tailored fit to complex polygon geometries.
+        """
+        self.createPlots(
+            inputFN,
+            idFieldName,
+            outputFN,
+            plotFactory,
+            self.createOptimizedSPlot,
+            progressDlg,
+        )
+
+
+    def generatePlots(
+        self, 
+        inputFN: str, 
+        idFieldName: str, 
+        outputFN: str, 
+        plotFactory: PolygonPlot,
+        plotPlacement: str,
+        progressDlg: GProgressDialog,):
+        """
+        Generates simulation plots for each polygon feature in the input vector file and saves them to an output vector file,
+        based on the specified placement strategy.
+
+        This function provides a high-level interface for generating simulation plots with various spatial configurations,
+        including fixed, translated, rotated, and optimized placements. Depending on the 'plotPlacement' parameter, the function
+        directs to specific plot-generation methods that apply unique transformations to the simulation plots, leveraging the
+        'plotFactory' to create the geometry and attributes.
+
+        Parameters:
+            inputFN (str):       Path to the input vector file containing polygon features.
+            idFieldName (str):   Field name representing the polygon ID in the input file.
+            outputFN (str):      Path to the output vector file to save the generated simulation plots.
+            plotFactory (SimulationPlotFactory): An instance of the simulation plot class responsible for generating plot geometries.
+            plotPlacement (str): Specifies the placement strategy for the plots. Options include:
+                                 - "fixed": Generates plots with a fixed position.
+                                 - "resized": Randomly alters plot size while preserving area.
+                                 - "rotated": Applies random rotations to plot orientation.
+                                 - "translated": Applies random translations to plot positions.
+                                 - "optimized": Iteratively adjusts placement to maximize plot overlap with the polygon.
+            progressDlg (GProgressDialog): Optional parameter for displaying a progress dialog during the process.
+
+        Raises:
+            ValueError: Raised if 'plotPlacement' is not one of the accepted options.
+
+        Returns:
+            None: The function directly saves the generated simulation plots to the specified output file.
+
+        Usage:
+            'generatePlots' is suitable for scenarios where multiple spatial configuration options are required, allowing users to
+            select between fixed, translated, rotated, resized, and optimized placements based on analysis needs. This function simplifies
+            the plot generation process by selecting the appropriate method based on the 'plotPlacement' parameter.
+        """
+        placements = {
+            "fixed": self.generateFixedPlots,
+            "translated": self.generateTranslatedPlots,
+            "rotated": self.generateRotatedPlots,
+            "resized": self.generateResizedPlots,
+            "optimized": self.generateOptimizedPlots,
+        }
+        generateFn = placements.get(plotPlacement)
+        if generateFn is None:
+            GenSimPlotUtilities.raiseValueError(
+                f"Invalid plot placement option ({plotPlacement}).", 
+                progressDlg,
+            )
+        generateFn(inputFN, idFieldName, outputFN, plotFactory, progressDlg)
+
+
+    def generateSquarePlots(
+        self, inputFN, idFieldName, outputFN, plotPosition, plotPlacement, progressDlg
+    ):
+        """
+        Generates square simulation plots based on input polygon geometries, with configurable positioning and placement options.
+
+        This function reads polygon geometries from an input vector file and creates square simulation plots according to
+        specified positioning and placement strategies. Positioning options (such as aligning with the bounding box, centroid,
+        or mean coordinates) determine where the square plot is centered within each polygon. The placement strategy
+        applies additional transformations, such as fixed, rotated, translated, or optimized placements,
+        to control plot orientation and spatial adjustments.
+
+        Parameters:
+            inputFN (str):       Path to the input vector file containing polygon features.
+            idFieldName (str):   Field name representing the polygon ID in the input file.
+            outputFN (str):      Path to the output vector file to save the generated square plots.
+            plotPosition (str):  Specifies how to position the square plot within each polygon. Options include:
+                                 - "bounding box": Aligns the square with the bounding box of the polygon.
+                                 - "centroid": Centers the square at the polygon's centroid.
+                                 - "mean coordinates": Centers the square at the mean x and y coordinates of the polygon.
+            plotPlacement (str): Specifies the placement strategy for the square plots. Options include:
+                                 - "fixed": Generates plots with a fixed position.
+                                 - "resized": Randomly alters plot size while preserving area; does not affect square plots.
+                                 - "rotated": Applies random rotations to plot orientation.
+                                 - "translated": Applies random translations to plot positions.
+                                 - "optimized": Iteratively adjusts placement to maximize plot overlap with the polygon.
+            progressDlg (GProgressDialog): Optional parameter for displaying a progress dialog during the process.
+
+        Raises:
+            ValueError: If 'plotPosition' is not one of the accepted options.
+
+        Returns:
+            None: The function directly writes the generated plots to the specified output vector file.
+
+        Usage:
+            'generateSquarePlots' is ideal for creating square-shaped simulation plots where specific alignment with polygon
+            features is required, such as aligning with bounding boxes or centering on mean coordinates. Combined with
+            the 'plotPlacement' options, this function offers flexibility for ecological sampling or spatial analyses where
+            varying alignment and positioning are necessary.
+        """
+        positions = {
+            "bounding box": SquareByBBox,
+            "centroid": SquareByCentroid,
+            "mean coordinates": SquareByMeanXY,
+        }
+        factoryClass = positions.get(plotPosition)
+        if factoryClass is None:
+            GenSimPlotUtilities.raiseValueError(
+                f"Invalid plot position option ({plotPosition}).",
+                progressDlg,
+            )
+        self.generatePlots(
+            inputFN, idFieldName, outputFN, factoryClass(), plotPlacement, progressDlg
+        )
+
+
+    def generateCirclePlots(
+        self, inputFN, idFieldName, outputFN, plotPosition, plotPlacement, progressDlg
+    ):
+        """
+        Generates circular simulation plots based on input polygon geometries, configured by specified position and placement criteria.
+
+        This function reads polygon geometries from an input vector file and generates circular simulation plots according to
+        the desired positioning within each polygon and placement strategy. The 'plotPosition' parameter determines the center
+        point of the circle, while the 'plotPlacement' parameter defines spatial transformations like fixed positioning,
+        random rotation, translation, or optimized placement for enhanced overlap with the polygon.
+
+        Parameters:
+            inputFN (str):       Path to the input vector file containing polygon features.
+            idFieldName (str):   Field name representing the polygon ID in the input file.
+            outputFN (str):      Path to the output vector file to store the generated circular plots.
+            plotPosition (str):  Specifies the positioning approach for centering the circle within each polygon. Options include:
+                                 - "bounding box": Aligns the circle with the bounding box of the polygon.
+                                 - "centroid": Centers the circle at the polygon's centroid.
+                                 - "mean coordinates": Centers the circle at the mean x and y coordinates of the polygon.
+            plotPlacement (str): Specifies the placement strategy for the circle plots, offering additional spatial adjustments:
+                                 - "fixed": Generates plots with a fixed position.
+                                 - "resized": Randomly alters plot size while preserving area; does not affect circular plots.
+                                 - "rotated": Applies random rotations to plot orientation.
+                                 - "translated": Applies random translations to plot positions.
+                                 - "optimized": Iteratively adjusts placement to maximize plot overlap with the polygon.
+            progressDlg (GProgressDialog): Optional parameter for displaying a progress dialog during the process.
+            
+        Raises:
+            ValueError: If 'plotPosition' is not one of the accepted options.
+
+        Returns:
+            None: The function directly writes the generated circular plots to the specified output vector file.
+
+        Usage:
+            'generateCirclePlots' is useful for creating circular simulation plots where specific alignment within polygon
+            features is needed. It is particularly beneficial in spatial analyses and sampling applications where consistent
+            positioning combined with flexible spatial adjustments enhances data representativeness.
+        """
+        positions = {
+            "bounding box": CircleByBBox,
+            "centroid": CircleByCentroid,
+            "mean coordinates": CircleByMeanXY,
+        }
+        factoryClass = positions.get(plotPosition)
+        if factoryClass is None:
+            GenSimPlotUtilities.raiseValueError(
+                f"Invalid plot position option ({plotPosition}).",
+                progressDlg,
+            )
+        self.generatePlots(
+            inputFN, idFieldName, outputFN, factoryClass(), plotPlacement, progressDlg
+        )
+
+
+    def generateRectanglePlots(
+        self, inputFN, idFieldName, outputFN, plotPosition, plotPlacement, progressDlg
+    ):
+        """
+        Generates rectangular simulation plots based on input polygon geometries, configured by specified positioning and placement criteria.
+
+        This function reads polygons from an input vector file and creates rectangular simulation plots for each polygon feature.
+        Positioning criteria determine where the rectangle is placed within the polygon, while placement strategies apply spatial
+        transformations, such as fixed placement, reshaping, rotations, translations, and optimized positioning.
+
+        Parameters:
+            inputFN (str):       Path to the input vector file containing polygon features.
+            idFieldName (str):   Field name representing the polygon ID in the input file.
+            outputFN (str):      Path to the output vector file to store the generated rectangular plots.
+            plotPosition (str):  Specifies the alignment method for positioning the rectangle within each polygon. Options include:
+                                 - "bounding box": Aligns the rectangle to the polygon's bounding box dimensions.
+                                 - "centroid": Centers the rectangle on the polygon's centroid.
+                                 - "mean coordinates": Centers the rectangle at the mean x and y coordinates of the polygon.
+            plotPlacement (str): Specifies the placement strategy for the rectangle plots, providing spatial flexibility:
+                                 - "fixed": Generates plots with a fixed position within the polygon.
+                                 - "resized": Randomly alters plot size while preserving area.
+                                 - "rotated": Applies random rotations to adjust plot orientation.
+                                 - "translated": Applies random translations to adjust plot positioning.
+                                 - "optimized": Iteratively optimizes placement to maximize plot overlap with the polygon.
+            progressDlg (GProgressDialog): Optional parameter for displaying a progress dialog during the process.
+
+        Raises:
+            ValueError: If 'plotPosition' is not one of the accepted options.
+
+        Returns:
+            None: The function directly writes the generated rectangular plots to the specified output vector file.
+
+        Usage:
+            'generateRectanglePlots' is ideal for applications requiring rectangular plots with specific spatial alignment within
+            polygon features, such as habitat sampling or environmental monitoring tasks.
+        """
+        positions = {
+            "bounding box": RectangleByBBox,
+            "centroid": RectangleByCentroid,
+            "mean coordinates": RectangleByMeanXY,
+        }
+        factoryClass = positions.get(plotPosition)
+        if factoryClass is None:
+            GenSimPlotUtilities.raiseValueError(
+                f"Invalid plot position option ({plotPosition}).",
+                progressDlg,
+            )
+        self.generatePlots(
+            inputFN, idFieldName, outputFN, factoryClass(), plotPlacement, progressDlg
+        )
+
+
+    def generateEllipsePlots(
+        self, inputFN, idFieldName, outputFN, plotPosition, plotPlacement, progressDlg
+    ):
+        """
+        Generates elliptical simulation plots for each polygon feature in the input vector file, based on the specified
+        plot positioning and placement options, and saves them to an output vector file.
+
+        This function reads polygons from the input vector file, generates elliptical plots according to the selected
+        position criteria (bounding box, centroid, or mean coordinates), and applies the specified placement (fixed, resized, rotated,
+        translated, or optimized). Each generated plot is saved to an output file with attributes that identify the original polygon
+        and store relevant simulation details.
+
+        Parameters:
+            inputFN (str):       Path to the input vector file containing polygon features.
+            idFieldName (str):   Field name in the input file for identifying each polygon.
+            outputFN (str):      Path to the output vector file for storing the generated elliptical plots.
+            plotPosition (str):  Specifies the positioning of the plot within each polygon; options include:
+                                 - "bounding box": Aligns the ellipse with the polygon's bounding box.
+                                 - "centroid": Centers the ellipse on the polygon's centroid.
+                                 - "mean coordinates": Positions the ellipse at the mean x and y coordinates of the polygon.
+            plotPlacement (str): Specifies how the plot is placed within the polygon:
+                                 - "fixed": Generates plots with a fixed position within the polygon.
+                                 - "resized": Randomly alters plot size while preserving area.
+                                 - "rotated": Applies random rotations to adjust plot orientation.
+                                 - "translated": Applies random translations to adjust plot positioning.
+                                 - "optimized": Iteratively optimizes placement to maximize plot overlap with the polygon.
+            progressDlg (GProgressDialog): Optional parameter for displaying a progress dialog during the process.
+
+        Raises:
+            ValueError: If an invalid plot position is specified.
+
+        Usage:
+            generateEllipsePlots' is suitable for creating elliptical simulation plots that align with specific polygon
+            attributes, such as bounding box dimensions or centroid location. This function is valuable for applications
+            like spatial analysis or ecological studies where elliptical plot shapes are necessary to represent area coverage
+            consistently across varying polygon features.
+        """
+        positions = {
+            "bounding box": EllipseByBBox,
+            "centroid": EllipseByCentroid,
+            "mean coordinates": EllipseByMeanXY,
+        }
+        factoryClass = positions.get(plotPosition)
+        if factoryClass is None:
+            GenSimPlotUtilities.raiseValueError(
+                f"Invalid plot position option ({plotPosition}).",
+                progressDlg,
+            )
+        self.generatePlots(
+            inputFN, idFieldName, outputFN, factoryClass(), plotPlacement, progressDlg
+        )
+
+
+    def generateBestPlots(
+        self,
+        inputFN: str,
+        idFieldName: str,
+        outputFN: str,
+        progressDlg: GProgressDialog,
+    ):
+        """
+        Generates simulation plots for each polygon feature in the input vector file, maximizing overlap
+        with the original polygon, and saves them to an output vector file.
+
+        This function reads polygon features from an input vector file, applies an optimization process to create
+        simulation plots that maximize spatial overlap with each original polygon feature, and saves the results
+        to an output file. The output includes each plot with relevant attributes and ID associations for
+        tracking and analysis.
+
+        Parameters:
+            inputFN (str):     Path to the input vector file containing polygon features.
+            idFieldName (str): Field name representing the polygon ID in the input file.
+            outputFN (str):    Path to the output vector file where the simulation plots will be stored.
+            progressDlg (GProgressDialog): A dialog window to display the progress of the plot generation process.
+
+        Returns:
+            None: The function directly writes the generated simulation plots to the specified output file.
+
+        Usage:
+            Use 'generateBestPlots' in scenarios that demand maximum spatial representativeness, where optimal alignment
+            and coverage of each simulation plot with its corresponding polygon are essential. This function is ideal for
+            applications in spatial analysis, ecological modeling, or sampling simulations that benefit from enhanced
+            plot-polygon overlap.
+        """
+        self.createPlots(
+            inputFN,
+            idFieldName,
+            outputFN,
+            None,
+            self.createBestSPlot,
+            progressDlg,
+        )
+
+
+
+#############################################################################
+#   POINTS ON SIMULATION PLOTS
+#############################################################################
+
+class PointsGenerator:
+    """
+    Generates a grid of points over the bounding rectangle of each simulation plot.
+
+    This class provides functionality for generating a regularly spaced grid of points within the rectangular bounds
+    of simulation plots. Each generated point can optionally be clipped to fit within the simulation plot's boundaries.
+    The class supports varying grid densities by adjusting the number of points along the shorter side of the bounding rectangle,
+    and aligns the grid according to the plot's rotation.
+
+    Attributes:
+        bufPerc (float):        A percentage defining the buffer size for clipping points within the plot boundary.
+        bufQCirclePoints (int): Number of points used to define circular buffers when clipping points to plot boundaries.
+    """
+
+    bufPerc = 0.005
+    bufQCirclePoints = 6
+
+    def createSPointsFields(self, idField: QgsField):
+        """
+        Creates the QgsFields structure for storing simulation plot points.
+
+        This method sets up a field schema for the output vector file containing points. Each point has an ID
+        and positional attributes (row and column) within the grid.
+
+        Parameters:
+            idField (QgsField): The field representing the simulation plot ID.
+
+        Returns:
+            QgsFields: A list of fields to be included in the output vector file for storing simulation plot points.
+        """
+        outputFields = QgsFields()
+        outputFields.append(idField)
+        outputFields.append(QgsField("row", QVariant.Int, "int", 4))
+        outputFields.append(QgsField("column", QVariant.Int, "int", 4))
+        return outputFields
+
+    def createSPointsShapeFile(self, outputFN, outputFields, crs):
+        """
+        Creates an output shapefile to store simulation plot points.
+
+        This method initializes an output vector file for storing point geometries representing simulation plot points.
+        The file is structured according to the specified fields and CRS.
+
+        Parameters:
+            outputFN (str):           Path to the output vector file, optionally with a "|layername=" part.
+            outputFields (QgsFields): The fields to include in the output file.
+            crs (QgsCoordinateReferenceSystem): The coordinate reference system for the output file.
+
+        Returns:
+            QgsVectorFileWriter: A writer object for the newly created vector file.
+
+
+        Usage:
+            This method is used to create a new vector file for storing simulation plot points. It is typically called before
+            generating and writing points to the output file.
+        """
+        return createVectorFile(outputFN, outputFields, Qgis.WkbType.Point, crs)
+
+    def generatePointsX(
+        self,
+        polygon: QgsMultiPolygon,
+        inputID: str,
+        alpha: float,
+        a: float,
+        b: float,
+        nPoints: int,
+        outputLayer: QgsVectorFileWriter,
+        outputFields: QgsFields,
+        clipPoints: bool,
+        progressDlg: GProgressDialog = None,
+    ):
+        """
+        Generates a grid of points within a simulation plot when the x-side is shorter than the y-side.
+
+        Creates a grid where points are aligned along the shorter side (a <= b), ensuring the specified number of points
+        along the shorter side of the rectangle. Points are optionally clipped to fit within the plot boundaries and
+        rotated to align with the plot's orientation.
+
+        Parameters:
+            polygon (QgsMultiPolygon): Input polygon geometry representing the simulation plot.
+            inputID (str):             Simulation plot ID.
+            alpha (float):             Rotation angle of the plot.
+            a (float):                 Length of the long side of the plot.
+            b (float):                 Length of the short side of the plot.
+            nPoints (int):             Number of points along the long side.
+            outputLayer (QgsVectorFileWriter): The output layer for storing generated points.
+            outputFields (QgsFields):  Field schema for the output vector file.
+            clipPoints (bool):         Flag to clip points within plot boundaries.
+            progressDlg (GProgressDialog): Optional progress dialog reported on a write error.
+
+        Raises:
+            Exception: If the points cannot be saved to the output layer.
+
+        Returns:
+            None: The method writes the generated points to the output vector file.
+        """
+        cen = polygon.centroid().asPoint()
+        cx = cen.x()
+        cy = cen.y()
+        dx = a / (nPoints - 1)
+        nRows = int(math.floor((b + dx / 2.0) / dx)) + 1
+        localX = dx * np.arange(nPoints) - a / 2.0
+        localY = b / 2.0 - dx * np.arange(nRows)
+        gridX, gridY = np.meshgrid(localX, localY)
+        r = math.radians(alpha)
+        ca = math.cos(r)
+        sa = math.sin(r)
+        # clockwise rotation about the plot center, matching QgsGeometry.rotate()
+        pointsX = cx + ca * gridX + sa * gridY
+        pointsY = cy - sa * gridX + ca * gridY
+        if clipPoints:
+            pbuf = polygon.buffer(self.bufPerc * a, self.bufQCirclePoints)
+            insidePlot = pointsInRing(ringArrayXY(pbuf), pointsX, pointsY)
+        outputBuffer = []
+        attrs = [inputID, 0, 0]
+        for row in range(pointsX.shape[0]):
+            attrs[1] = row + 1
+            for col in range(nPoints):
+                if clipPoints and not insidePlot[row, col]:
+                    continue
+                attrs[2] = col + 1
+                outputFeature = QgsFeature(outputFields)
+                outputFeature.setAttributes(attrs)
+                outputFeature.setGeometry(
+                    QgsGeometry.fromPointXY(
+                        QgsPointXY(pointsX[row, col], pointsY[row, col])
+                    )
+                )
+                outputBuffer.append(outputFeature)
+        if outputBuffer:
+            if not outputLayer.addFeatures(outputBuffer):
+                GenSimPlotUtilities.raiseException("Cannnot save feature.", progressDlg)
+
+    def generatePointsY(
+        self,
+        polygon: QgsMultiPolygon,
+        inputID: str,
+        alpha: float,
+        a: float,
+        b: float,
+        nPoints: int,
+        outputLayer: QgsVectorFileWriter,
+        outputFields: QgsFields,
+        clipPoints: bool,
+        progressDlg: GProgressDialog = None,
+    ):
+        """
+        Generates a grid of points within a simulation plot when the y-side is shorter than the x-side.
+
+        Creates a grid where points are aligned along the shorter side (a > b), ensuring the specified number of points
+        along the shorter side of the rectangle. Points are optionally clipped to fit within the plot boundaries and
+        rotated to align with the plot's orientation.
+
+        Parameters:
+            polygon (QgsMultiPolygon): Input polygon geometry representing the simulation plot.
+            inputID (str):             Simulation plot ID.
+            alpha (float):             Rotation angle of the plot.
+            a (float):                 Length of the long side of the plot.
+            b (float):                 Length of the short side of the plot.
+            nPoints (int):             Number of points along the short side.
+            outputLayer (QgsVectorFileWriter): The output layer for storing generated points.
+            outputFields (QgsFields):  Field schema for the output vector file.
+            clipPoints (bool):         Flag to clip points within plot boundaries.
+            progressDlg (GProgressDialog): Optional progress dialog reported on a write error.
+
+        Raises:
+            Exception: If the points cannot be saved to the output layer.
+
+        Returns:
+            None: The method writes the generated points to the output vector file.
+        """
+        cen = polygon.centroid().asPoint()
+        cx = cen.x()
+        cy = cen.y()
+        dy = b / (nPoints - 1)
+        nCols = int(math.floor((a + dy / 2.0) / dy)) + 1
+        localX = dy * np.arange(nCols) - a / 2.0
+        localY = b / 2.0 - dy * np.arange(nPoints)
+        gridX, gridY = np.meshgrid(localX, localY)
+        r = math.radians(alpha)
+        ca = math.cos(r)
+        sa = math.sin(r)
+        # clockwise rotation about the plot center, matching QgsGeometry.rotate()
+        pointsX = cx + ca * gridX + sa * gridY
+        pointsY = cy - sa * gridX + ca * gridY
+        if clipPoints:
+            pbuf = polygon.buffer(self.bufPerc * a, self.bufQCirclePoints)
+            insidePlot = pointsInRing(ringArrayXY(pbuf), pointsX, pointsY)
+        outputBuffer = []
+        attrs = [inputID, 0, 0]
+        for col in range(pointsX.shape[1]):
+            attrs[2] = col + 1
+            for row in range(nPoints):
+                if clipPoints and not insidePlot[row, col]:
+                    continue
+                attrs[1] = row + 1
+                outputFeature = QgsFeature(outputFields)
+                outputFeature.setAttributes(attrs)
+                outputFeature.setGeometry(
+                    QgsGeometry.fromPointXY(
+                        QgsPointXY(pointsX[row, col], pointsY[row, col])
+                    )
+                )
+                outputBuffer.append(outputFeature)
+        if outputBuffer:
+            if not outputLayer.addFeatures(outputBuffer):
+                GenSimPlotUtilities.raiseException("Cannnot save feature.", progressDlg)
+
+    def generatePoints(
+        self,
+        inputFN: str,
+        idFieldName: str,
+        outputFN: str,
+        nPoints: int,
+        clipPoints: bool,
+        progressDlg: GProgressDialog,
+    ):
+        """
+        Generates a complete grid of points for each simulation plot's bounding rectangle.
+
+        This method reads input polygon geometries, determines the optimal grid orientation, and generates a
+        grid of points that follow the plot's position and rotation. Points are optionally clipped to remain
+        within each plot's boundaries. The grid density is specified by the number of points along the shorter
+        side of each plot.
+
+        Parameters:
+            inputFN (str):     Path to the input file containing simulation plot polygons.
+            idFieldName (str): Field name representing the plot ID in the input file.
+            outputFN (str):    Path to the output vector file for storing generated points.
+            nPoints (int):     Number of points along the shorter side of the rectangle.
+            clipPoints (bool): Flag to indicate whether points should be clipped to the plot boundary.
+            progressDlg (GProgressDialog): A dialog to display the progress of the operation.
+
+        Raises:
+            ValueError: If the input layer's geometry is not of polygon type.
+
+        Returns:
+            None: Directly writes the generated points to the output vector file.
+        """
+        inputLayer = QgsVectorLayer(inputFN, "forest stands", "ogr")
+        if inputLayer.geometryType() != Qgis.GeometryType.Polygon:
+            GenSimPlotUtilities.raiseValueError(f"Geometry must be POLYGON ({inputFN}).", progressDlg)
+        inputIDField = inputLayer.fields().field(idFieldName)
+        outputFields = self.createSPointsFields(QgsField(inputIDField))
+        outputLayer = self.createSPointsShapeFile(
+            outputFN, outputFields, inputLayer.crs()
+        )
+        n = inputLayer.featureCount()
+        GenSimPlotUtilities.startProgress(
+            progressDlg, f"Generating simulation plot points to {outputFN} ...", n
+        )
+        inputRequest = QgsFeatureRequest()
+        inputRequest.setSubsetOfAttributes(
+            [idFieldName, "a", "b", "alpha"], inputLayer.fields()
+        )
+        for inputFeature in inputLayer.getFeatures(inputRequest):
+            polygon = inputFeature.geometry().asGeometryCollection()[0]
+            a = inputFeature["a"]
+            b = inputFeature["b"]
+            alpha = inputFeature["alpha"]
+            inputID = inputFeature[idFieldName]
+            if b < a:
+                self.generatePointsY(
+                    polygon,
+                    inputID,
+                    alpha,
+                    a,
+                    b,
+                    nPoints,
+                    outputLayer,
+                    outputFields,
+                    clipPoints,
+                    progressDlg,
+                )
+            else:
+                self.generatePointsX(
+                    polygon,
+                    inputID,
+                    alpha,
+                    a,
+                    b,
+                    nPoints,
+                    outputLayer,
+                    outputFields,
+                    clipPoints,
+                    progressDlg,
+                )
+            GenSimPlotUtilities.incrementProgress(progressDlg)
+
+
+
+#############################################################################
+#   ENVIRONMENTAL VARIABLES
+#############################################################################
+
+@lru_cache(maxsize=128)
+def truncatedFieldName(fieldName: str, maxLength: int):
+    """
+    Truncates a field name to the maximum length supported by the output format.
+
+    Parameters:
+        fieldName (str): The requested field name.
+        maxLength (int): The maximum allowed field name length.
+
+    Returns:
+        str: The field name shortened to maxLength characters.
+    """
+    return fieldName[0:maxLength]
+
+
+@lru_cache(maxsize=128)
+def truncatedStatFieldNames(valueFieldName: str, maxPrefixLength: int):
+    """
+    Derives the statistics field names (minimum, maximum, mean) from a value field name.
+
+    The base name is truncated to the maximum prefix length, so the derived names
+    fit within the field name limits of the output format.
+
+    Parameters:
+        valueFieldName (str): The base name of the environmental variable field.
+        maxPrefixLength (int): The maximum allowed length of the base name.
+
+    Returns:
+        tuple: The truncated base name and the derived minimum, maximum, and mean field names.
+    """
+    prefix = truncatedFieldName(valueFieldName, maxPrefixLength)
+    return (prefix, prefix + "_min", prefix + "_max", prefix + "_mean")
+
+
+class SimulationPlotVariables(PointsGenerator):
+    """
+    A class to assign environmental variables to simulation plots by extracting data from raster layers.
+
+    This class provides methods to extract environmental variable values from raster layers, either at the centroid
+    of each simulation plot or at multiple points within each plot. The extracted values are stored in new fields
+    in the simulation plot's attribute table for further spatial analysis or visualization.
+
+    Attributes:
+        maxFieldNameLength (int): The maximum allowable length for field names in the simulation plot attribute table.
+
+    Methods:
+        valueFromCentroid(spFN: str, spDataFieldName: str, rasterFN: str):
+            Extracts environmental variable values at the centroid of each simulation plot and saves them in a specified field.
+
+        valueFromPoints(spFN: str, spIDField: str, pointsFN: str, pointsDataField: str, rasterFN: str):
+            Extracts environmental variable values for multiple points on each simulation plot, calculates summary statistics
+            (minimum, maximum, mean), and saves them in the simulation plot attribute table.
+    """
+
+    maxFieldNamePrefixLength = 5
+    maxValueFieldNameLength = 10
+    changeBufferSize = 50000
+
+    @staticmethod
+    def vectorLayer(fn: str, name: str):
+        """
+        Returns a cached vector layer for the given file.
+
+        Delegates to the module-level layer cache shared with the plot and
+        point generators.
+
+        Parameters:
+            fn (str):   File name of the vector layer.
+            name (str): Display name used when the layer has to be opened.
+
+        Returns:
+            QgsVectorLayer: The cached vector layer.
+        """
+        return vectorLayer(fn, name)
+
+    @staticmethod
+    def clearLayerCache():
+        """
+        Releases the cached vector layers, closing their datasets.
+        """
+        clearVectorLayerCache()
+
+    rasterBlockDTypes = None
+    _rasterBlockCache = dict()
+
+    def rasterBlock(self, rasterFN: str, progressDlg: GProgressDialog):
+        """
+        Returns the cached bulk-read block of the given raster.
+
+        The batch scripts sample the same raster several times in a row, e.g.
+        once per point layer and once more for the plot centroids; the cache
+        keeps the block of each raster file in memory, so only the first
+        extraction pays for the full raster read. The opened raster layer is
+        kept alive alongside its block for the provider fallback path. Each
+        entry remembers the modification time and size of its file, like the
+        vector layer cache, so a raster regenerated between console runs is
+        re-read instead of being served stale.
+
+        Parameters:
+            rasterFN (str): Path to the input raster file.
+            progressDlg (GProgressDialog): A dialog to display the progress of the operation.
+
+        Raises:
+            ValueError: If the input raster is invalid.
+
+        Returns:
+            tuple: The raster values, the raster extent, and the raster width and height in pixels.
+        """
+        signature = _layerFileSignature(rasterFN)
+        cached = SimulationPlotVariables._rasterBlockCache.get(rasterFN)
+        if cached is not None and cached[0] == signature:
+            return cached[2]
+        dataLayer = QgsRasterLayer(rasterFN, "data")
+        rdata = dataLayer.dataProvider()
+        if not QgsRasterLayer.isValidRasterFileName(rasterFN):
+            GenSimPlotUtilities.raiseValueError(f"The input raster is invalid ({rasterFN}).", progressDlg)
+        blockData = self.readRasterBlock(rdata)
+        SimulationPlotVariables._rasterBlockCache[rasterFN] = (
+            signature,
+            dataLayer,
+            blockData,
+        )
+        return blockData
+
+    @staticmethod
+    def clearRasterBlockCache():
+        """
+        Releases the cached raster blocks, closing their datasets.
+        """
+        SimulationPlotVariables._rasterBlockCache.clear()
+
+    def readRasterBlock(self, rdata):
+        """
+        Reads the full extent of a raster into a NumPy value array.
+
+        One bulk read amortizes the provider dispatch over all sampled points,
+        which is considerably faster than calling identify() per point. The
+        block is exposed as a float64 array with no-data cells replaced by NaN,
+        so sampling is a plain array lookup. Rasters with an unmapped data type
+        keep the QgsRasterBlock and are sampled through its accessors; rasters
+        too large to read in one block fall back to per-point provider sampling.
+
+        Parameters:
+            rdata (QgsRasterDataProvider): The raster data provider to read from.
+
+        Returns:
+            tuple: The raster values, the raster extent, and the raster width and height in pixels.
+        """
+        if SimulationPlotVariables.rasterBlockDTypes is None:
+            SimulationPlotVariables.rasterBlockDTypes = {
+                Qgis.DataType.Byte: np.uint8,
+                Qgis.DataType.UInt16: np.uint16,
+                Qgis.DataType.Int16: np.int16,
+                Qgis.DataType.UInt32: np.uint32,
+                Qgis.DataType.Int32: np.int32,
+                Qgis.DataType.Float32: np.float32,
+                Qgis.DataType.Float64: np.float64,
+            }
+        extent = rdata.extent()
+        width = rdata.xSize()
+        height = rdata.ySize()
+        block = rdata.block(1, extent, width, height)
+        if block is None or not block.isValid():
+            # the raster cannot be materialized in memory; sample the provider directly
+            return (rdata, extent, width, height)
+        dtype = SimulationPlotVariables.rasterBlockDTypes.get(block.dataType())
+        if dtype is None:
+            return (block, extent, width, height)
+        values = np.frombuffer(bytes(block.data()), dtype=dtype).reshape(
+            height, width
+        ).astype(np.float64)
+        if block.hasNoDataValue():
+            values[values == block.noDataValue()] = np.nan
+        return (values, extent, width, height)
+
+    def sampleRasterBlock(self, block, extent, width, height, point):
+        """
+        Samples a raster block at the given point.
+
+        Parameters:
+            block:                 The value array or raster block returned by readRasterBlock.
+            extent (QgsRectangle): The extent covered by the block.
+            width (int):           The block width in pixels.
+            height (int):          The block height in pixels.
+            point (QgsPointXY):    The point to sample.
+
+        Returns:
+            float: The raster value at the point, or None if the point lies outside
+                   the raster extent or on a no-data cell.
+        """
+        if isinstance(block, QgsRasterDataProvider):
+            val, ok = block.sample(QgsPointXY(point), 1)
+            if not ok:
+                return None
+            return val
+        col = int((point.x() - extent.xMinimum()) / (extent.width() / width))
+        row = int((extent.yMaximum() - point.y()) / (extent.height() / height))
+        if col < 0 or width <= col or row < 0 or height <= row:
+            return None
+        if isinstance(block, np.ndarray):
+            val = block[row, col]
+            if math.isnan(val):
+                return None
+            return float(val)
+        if block.isNoData(row, col):
+            return None
+        return block.value(row, col)
+
+    def sampleRasterBlockArray(self, block, extent, width, height, xs, ys):
+        """
+        Samples a raster block at many points in one vectorized operation.
+
+        For rasters materialized as a value array the pixel indices of all
+        points are computed with array arithmetic and read with one fancy
+        index, instead of one Python call per point; the provider and raster
+        block fallbacks sample point by point.
+
+        Parameters:
+            block:                 The value array or raster block returned by readRasterBlock.
+            extent (QgsRectangle): The extent covered by the block.
+            width (int):           The block width in pixels.
+            height (int):          The block height in pixels.
+            xs (np.ndarray):       The x coordinates of the sampled points.
+            ys (np.ndarray):       The y coordinates of the sampled points.
+
+        Returns:
+            np.ndarray: The raster values, with NaN for points outside the raster
+                        extent or on no-data cells.
+        """
+        if isinstance(block, np.ndarray):
+            cols = ((xs - extent.xMinimum()) / (extent.width() / width)).astype(np.int64)
+            rows = ((extent.yMaximum() - ys) / (extent.height() / height)).astype(np.int64)
+            vals = np.full(len(xs), np.nan)
+            valid = (0 <= cols) & (cols < width) & (0 <= rows) & (rows < height)
+            vals[valid] = block[rows[valid], cols[valid]]
+            return vals
+        vals = np.full(len(xs), np.nan)
+        for i in range(len(xs)):
+            val = self.sampleRasterBlock(
+                block, extent, width, height, QgsPointXY(xs[i], ys[i])
+            )
+            if val is not None:
+                vals[i] = val
+        return vals
+
+    def valueFromCentroid(
+        self,
+        shpFN: str,
+        shpValueFieldName: str,
+        rasterFN: str,
+        progressDlg: GProgressDialog,
+    ):
+        """
+        Extracts environmental variable values at the centroid of each simulation plot.
+
+        Reads simulation plot polygons from an input vector file, retrieves the environmental variable values at the centroid
+        of each plot from a raster layer, and saves the values in a specified field within the simulation plot attribute table.
+
+        Parameters:
+            shpFN (str):             Path to the input vector file containing simulation plot polygons.
+            shpValueFieldName (str): Field name for storing the extracted environmental variable values.
+            rasterFN (str):          Path to the input raster file containing environmental data.
+            progressDlg (GProgressDialog): A dialog to display the progress of the operation.
+
+        Raises:
+            ValueError: If the input layer's geometry is not of type polygon.
+            ValueError: If the input raster is invalid.
+            Exception: If the process was canceled by the user.
+
+        Returns:
+            None: The function directly updates the attribute table with extracted values.
+
+        Usage:
+            Ideal for scenarios where environmental data from raster layers is represented at the centroid of each simulation plot,
+            such as in studies focusing on spatially explicit ecological factors within plot geometries.
+
+        """
+        block, rextent, rwidth, rheight = self.rasterBlock(rasterFN, progressDlg)
+        spLayer = self.vectorLayer(shpFN, "plots")
+        if spLayer.geometryType() != Qgis.GeometryType.Polygon:
+            GenSimPlotUtilities.raiseValueError("Geometry must be POLYGON ({shpFN}).", progressDlg)
+        if spLayer.fields().indexFromName(shpValueFieldName) < 0:
+            # add data field to plots layer
+            shpValueFieldName = truncatedFieldName(
+                shpValueFieldName, self.maxValueFieldNameLength
+            )
+            if spLayer.fields().indexFromName(shpValueFieldName) < 0:
+                spLayer.dataProvider().addAttributes(
+                    [
+                        QgsField(shpValueFieldName, QVariant.Double),
+                    ]
+                )
+            spLayer.updateFields()
+        n = spLayer.featureCount()
+        GenSimPlotUtilities.startProgress(
+            progressDlg, f"Extracting centroid values for plots from {shpFN} ...", n
+        )
+        valueFieldIndex = spLayer.fields().indexFromName(shpValueFieldName)
+        spLayer.startEditing()
+        spRequest = QgsFeatureRequest()
+        spRequest.setSubsetOfAttributes([valueFieldIndex])
+        for inputSP in spLayer.getFeatures(spRequest):
+            cen = inputSP.geometry().centroid()
+            val = self.sampleRasterBlock(block, rextent, rwidth, rheight, cen.asPoint())
+            if val is not None:
+                inputSP.setAttribute(valueFieldIndex, val)
+                spLayer.updateFeature(inputSP)
+            GenSimPlotUtilities.incrementProgress(progressDlg)
+        spLayer.commitChanges()
+
+    def valueFromPoints(
+        self,
+        spFN: str,
+        spIDField: str,
+        pointsFN: str,
+        valueFieldName: str,
+        rasterFN: str,
+        progressDlg: GProgressDialog,
+    ):
+        """
+        Extracts environmental variable values for multiple points on each simulation plot and calculates statistics.
+
+        Reads polygons and points from vector files, extracts environmental values at each point location from a raster layer,
+        and calculates summary statistics (minimum, maximum, and mean) for each simulation plot. The computed statistics are
+        stored as new fields in the simulation plot attribute table.
+
+        Parameters:
+            spFN (str):           Path to the input vector file containing simulation plot polygons.
+            spIDField (str):      Field name identifying each simulation plot.
+            pointsFN (str):       Path to the input vector file containing points within simulation plots.
+            valueFieldName (str): Field name for storing extracted environmental variable values in the points layer.
+            rasterFN (str):       Path to the input raster file containing environmental data.
+            progressDlg (GProgressDialog): A dialog to display the progress of the operation.
+
+        Raises:
+            ValueError: If the points layer's geometry is not of type point.
+
+        Returns:
+            None: The function directly updates both the points and simulation plot attribute tables with extracted values
+            and calculated statistics.
+
+        Usage:
+            'valueFromPoints' is ideal for applications needing detailed environmental data representation across multiple
+            points in each simulation plot, such as spatial analyses that consider within-plot variability in ecological studies.
+
+        """
+        self.valueFromPointsMulti(
+            spFN, spIDField, pointsFN, [(valueFieldName, rasterFN)], progressDlg
+        )
+
+    def valueFromPointsMulti(
+        self,
+        spFN: str,
+        spIDField: str,
+        pointsFN: str,
+        valueRasters,
+        progressDlg: GProgressDialog,
+    ):
+        """
+        Extracts values from several rasters for the plot points in a single pass.
+
+        Each raster is opened and bulk-read once, and the points layer is then
+        iterated once, sampling every raster per point before advancing, so
+        extracting elevation and slope together costs one point-layer pass
+        instead of one per raster. The per-plot statistics (minimum, maximum,
+        and mean) of every raster are aggregated and written to the simulation
+        plot attribute table through one change set.
+
+        Parameters:
+            spFN (str):      Path to the input vector file containing simulation plot polygons.
+            spIDField (str): Field name identifying each simulation plot.
+            pointsFN (str):  Path to the input vector file containing points within simulation plots.
+            valueRasters:    The (value field name, raster file name) pairs to extract.
+            progressDlg (GProgressDialog): A dialog to display the progress of the operation.
+
+        Raises:
+            ValueError: If an input raster is invalid or the points layer's geometry is not of type point.
+
+        Returns:
+            None: The function directly updates both the points and simulation plot attribute tables.
+        """
+        rasterBlocks = []
+        for valueFieldName, rasterFN in valueRasters:
+            statFieldNames = truncatedStatFieldNames(
+                valueFieldName, self.maxFieldNamePrefixLength
+            )
+            rasterBlocks.append(
+                (statFieldNames, self.rasterBlock(rasterFN, progressDlg))
+            )
+        pointsLayer = self.vectorLayer(pointsFN, "points")
+        if pointsLayer.geometryType() != Qgis.GeometryType.Point:
+            GenSimPlotUtilities.raiseValueError(f"Geometry must be POINT ({pointsFN}).", progressDlg)
+        for statFieldNames, block in rasterBlocks:
+            if pointsLayer.fields().indexFromName(statFieldNames[0]) < 0:
+                # add data field to points layer
+                pointsLayer.dataProvider().addAttributes(
+                    [
+                        QgsField(statFieldNames[0], QVariant.Double),
+                    ]
+                )
+        pointsLayer.updateFields()
+        n = pointsLayer.featureCount()
+        GenSimPlotUtilities.startProgress(
+            progressDlg, f"Extracting point values for plots from {spFN} ...", n
+        )
+        valueFieldIndexes = [
+            pointsLayer.fields().indexFromName(statFieldNames[0])
+            for statFieldNames, block in rasterBlocks
+        ]
+        spIDIndex = pointsLayer.fields().indexFromName(spIDField)
+        pointsProvider = pointsLayer.dataProvider()
+        pointFids = []
+        pointSpIds = []
+        pointXs = []
+        pointYs = []
+        pointsRequest = QgsFeatureRequest()
+        pointsRequest.setSubsetOfAttributes([spIDIndex])
+        for inputPoint in pointsLayer.getFeatures(pointsRequest):
+            point = inputPoint.geometry().asPoint()
+            pointFids.append(inputPoint.id())
+            pointSpIds.append(inputPoint.attribute(spIDIndex))
+            pointXs.append(point.x())
+            pointYs.append(point.y())
+            GenSimPlotUtilities.incrementProgress(progressDlg)
+        xs = np.array(pointXs)
+        ys = np.array(pointYs)
+        # sample every raster over all points in one vectorized call
+        rasterVals = []
+        changes = dict()
+        for iRaster, (statFieldNames, (block, rextent, rwidth, rheight)) in enumerate(
+            rasterBlocks
+        ):
+            vals = self.sampleRasterBlockArray(block, rextent, rwidth, rheight, xs, ys)
+            rasterVals.append(vals)
+            valueFieldIndex = valueFieldIndexes[iRaster]
+            for i in np.flatnonzero(~np.isnan(vals)):
+                changes.setdefault(pointFids[i], dict())[valueFieldIndex] = float(vals[i])
+        buffer = dict()
+        for fid, attrs in changes.items():
+            buffer[fid] = attrs
+            if len(buffer) == self.changeBufferSize:
+                pointsProvider.changeAttributeValues(buffer)
+                buffer = dict()
+        if buffer:
+            pointsProvider.changeAttributeValues(buffer)
+        # update simulation plots
+        spLayer = self.vectorLayer(spFN, "plots")
+        for statFieldNames, block in rasterBlocks:
+            for statFieldName in statFieldNames[1:]:
+                if statFieldName is not None:
+                    if spLayer.fields().indexFromName(statFieldName) < 0:
+                        spLayer.dataProvider().addAttributes(
+                            [
+                                QgsField(statFieldName, QVariant.Double),
+                            ]
+                        )
+        spLayer.updateFields()
+        spFields = spLayer.fields()
+        # update attributes only; skip geometry and unused columns when reading plots
+        spIDIndex = spFields.indexFromName(spIDField)
+        spRequest = QgsFeatureRequest()
+        spRequest.setFlags(QgsFeatureRequest.NoGeometry)
+        spRequest.setSubsetOfAttributes([spIDIndex])
+        spidToFid = {
+            inputSP.attribute(spIDIndex): inputSP.id()
+            for inputSP in spLayer.getFeatures(spRequest)
+        }
+        spChanges = dict()
+        for iRaster, (statFieldNames, block) in enumerate(rasterBlocks):
+            prefix, spMinFieldName, spMaxFieldName, spMeanFieldName = statFieldNames
+            minFieldIndex = (
+                spFields.indexFromName(spMinFieldName) if spMinFieldName is not None else -1
+            )
+            maxFieldIndex = (
+                spFields.indexFromName(spMaxFieldName) if spMaxFieldName is not None else -1
+            )
+            meanFieldIndex = (
+                spFields.indexFromName(spMeanFieldName) if spMeanFieldName is not None else -1
+            )
+            validVals = ~np.isnan(rasterVals[iRaster])
+            if not validVals.any():
+                continue
+            # aggregate the point values per plot in one vectorized pass
+            ids = np.array(pointSpIds)[validVals]
+            vals = rasterVals[iRaster][validVals]
+            uniqueIds, inverse = np.unique(ids, return_inverse=True)
+            minVals = np.full(len(uniqueIds), np.inf)
+            np.minimum.at(minVals, inverse, vals)
+            maxVals = np.full(len(uniqueIds), -np.inf)
+            np.maximum.at(maxVals, inverse, vals)
+            meanVals = np.bincount(inverse, weights=vals) / np.bincount(inverse)
+            for i in range(len(uniqueIds)):
+                fid = spidToFid.get(uniqueIds[i])
+                if fid is None:
+                    continue
+                attrs = spChanges.setdefault(fid, dict())
+                if 0 <= minFieldIndex:
+                    attrs[minFieldIndex] = float(minVals[i])
+                if 0 <= maxFieldIndex:
+                    attrs[maxFieldIndex] = float(maxVals[i])
+                if 0 <= meanFieldIndex:
+                    attrs[meanFieldIndex] = float(meanVals[i])
+                GenSimPlotUtilities.incrementProgress(progressDlg)
+        if spChanges:
+            spLayer.dataProvider().changeAttributeValues(spChanges)
+
+    def valueFromPointsInBackground(
+        self,
+        spFN: str,
+        spIDField: str,
+        pointsFN: str,
+        valueFieldName: str,
+        rasterFN: str,
+        progressDlg: GProgressDialog,
+    ):
+        """
+        Runs valueFromPoints on a background thread from the global thread pool.
+
+        Progress updates are forwarded to the progress dialog through queued signal
+        connections, so the extraction loop runs without pumping the Qt event loop.
+        The synchronous valueFromPoints remains available for scripted use.
+
+        Parameters:
+            spFN (str):           Path to the input vector file containing simulation plot polygons.
+            spIDField (str):      Field name identifying each simulation plot.
+            pointsFN (str):       Path to the input vector file containing points within simulation plots.
+            valueFieldName (str): Field name for storing extracted environmental variable values in the points layer.
+            rasterFN (str):       Path to the input raster file containing environmental data.
+            progressDlg (GProgressDialog): A dialog updated from the background task.
+
+        Returns:
+            GBackgroundTask: The started background task.
+        """
+        return GBackgroundTask.start(
+            self.valueFromPoints,
+            spFN,
+            spIDField,
+            pointsFN,
+            valueFieldName,
+            rasterFN,
+            progressDlg=progressDlg,
+        )
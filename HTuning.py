@@ -0,0 +1,527 @@
+# -*- coding: utf-8 -*-
+"""
+Package:   GenSimPlot
+File:      HTuning.py
+Version:   2.1
+Author:    Milan Koren
+Year:      2024
+URL:       https://github.com/milan-koren/GenSimPlot
+License:   EUPL v1.2 (European Union Public License), https://eupl.eu/
+
+Random-search tuning of the simulation plot generation hyperparameters.
+Each test draws a random configuration of the generator, creates the plots
+for the test, and appends the overlap statistics of the run to a CSV file.
+"""
+
+import csv
+import os
+import time
+from pathlib import Path
+import numpy as np
+from qgis.core import *
+
+from GenSimPlotLib import PlotGenerator
+from GenSimPlotUtilities import GProgressDialog
+from GenSimPlotUtilities import GenSimPlotUtilities
+
+
+
+def haltonMatrix(nSamples: int, nDims: int):
+    """
+    Generates a low-discrepancy Halton sample matrix.
+
+    Each column holds the radical-inverse sequence of one of the first
+    nDims prime bases, so the rows cover the unit hypercube far more evenly
+    than independent uniform draws of the same size.
+
+    Parameters:
+        nSamples (int): The number of sample points (rows).
+        nDims (int):    The number of dimensions (columns); at most eight.
+
+    Returns:
+        np.ndarray: An (nSamples, nDims) matrix of samples in [0, 1).
+    """
+    primes = (2, 3, 5, 7, 11, 13, 17, 19)
+    samples = np.zeros((nSamples, nDims))
+    indices = np.arange(1, nSamples + 1)
+    for iDim in range(nDims):
+        base = primes[iDim]
+        n = indices.copy()
+        factor = 1.0 / base
+        while n.any():
+            samples[:, iDim] += factor * (n % base)
+            n //= base
+            factor /= base
+    return samples
+
+
+def screeningMatrix(samplesPerAxis: int):
+    """
+    Generates the one-at-a-time screening sample matrix.
+
+    The matrix holds one block of rows per hyperparameter axis. Within a
+    block the probed axis sweeps evenly spaced values across its range while
+    the other three axes stay at their midpoints, so the spread of the
+    results within a block measures how sensitive the tuning statistic is to
+    that axis alone.
+
+    Parameters:
+        samplesPerAxis (int): The number of probe values per axis (rows per block).
+
+    Returns:
+        np.ndarray: A (4 * samplesPerAxis, 4) matrix of samples in (0, 1).
+    """
+    probes = (np.arange(samplesPerAxis) + 0.5) / samplesPerAxis
+    samples = np.full((4 * samplesPerAxis, 4), 0.5)
+    for iDim in range(4):
+        samples[iDim * samplesPerAxis : (iDim + 1) * samplesPerAxis, iDim] = probes
+    return samples
+
+
+class HTuning:
+    """
+    Random-search tuning harness for the plot-generation hyperparameters.
+
+    Each test draws the number of random iterations, the translation percentage,
+    the maximum rotation angle, and the maximum resize percentage from the given
+    ranges, generates the simulation plots with the drawn configuration, and
+    appends the overlap statistics and the test duration to a CSV file for
+    later analysis.
+
+    Attributes:
+        shape (str):     The plot shape to tune ("square", "circle", "rectangle", "ellipse", or "best").
+        position (str):  The plot position option ("bounding box", "centroid", or "mean coordinates").
+        placement (str): The plot placement option ("fixed", "translated", "rotated", "resized", or "optimized").
+    """
+
+    def __init__(self, shape: str, position: str, placement: str):
+        self.shape = shape
+        self.position = position
+        self.placement = placement
+
+    def calculateStatistics(self, shpFN: str, progressDlg: GProgressDialog):
+        """
+        Calculates the overlap statistics of a generated plot layer.
+
+        The "perc" attribute of every plot is pulled into one contiguous NumPy
+        array through a streaming feature iterator that skips geometry parsing
+        and the remaining attribute columns, and the minimum, maximum, mean,
+        and standard deviation are reduced in C instead of a Python
+        accumulator loop. The feature count is known up front, so the array
+        is allocated once at its final size and a mismatch between the
+        reported count and the iterated features is detected.
+
+        Parameters:
+            shpFN (str): Path to the vector file containing generated simulation plots.
+            progressDlg (GProgressDialog): A dialog to display the progress of the operation.
+
+        Returns:
+            dict: The number of plots and the minimum, maximum, mean, and standard
+                  deviation of the overlap percentage.
+
+        Raises:
+            ValueError: If the layer yields fewer or more features than it reports.
+        """
+        inputLayer = QgsVectorLayer(shpFN, "plots", "ogr")
+        n = inputLayer.featureCount()
+        GenSimPlotUtilities.startProgress(
+            progressDlg, f"Calculating statistics from {shpFN} ...", 1
+        )
+        percIndex = inputLayer.fields().indexFromName("perc")
+        request = QgsFeatureRequest()
+        request.setFlags(QgsFeatureRequest.NoGeometry)
+        request.setSubsetOfAttributes([percIndex])
+        percs = np.empty(n, dtype=np.float64)
+        nRead = 0
+        for inputFeature in inputLayer.getFeatures(request):
+            percs[nRead] = inputFeature.attribute(percIndex)
+            nRead += 1
+        if nRead != n:
+            GenSimPlotUtilities.raiseValueError(
+                f"Feature count mismatch in {shpFN} ({nRead} of {n} features read).",
+                progressDlg,
+            )
+        GenSimPlotUtilities.incrementProgress(progressDlg)
+        if len(percs) == 0:
+            return {
+                "nPolygons": 0,
+                "minPerc": 0.0,
+                "maxPerc": 0.0,
+                "avgPerc": 0.0,
+                "stdDevPerc": 0.0,
+            }
+        return {
+            "nPolygons": n,
+            "minPerc": float(percs.min()),
+            "maxPerc": float(percs.max()),
+            "avgPerc": float(percs.mean()),
+            "stdDevPerc": float(percs.std()),
+        }
+
+    def openStatistics(self, statisticsFN: str):
+        """
+        Opens the statistics CSV file for appending.
+
+        The header row is written when the file does not exist yet. The file
+        stays open for the whole tuning run, so appending a row does not pay
+        an open/close round trip per test.
+
+        Parameters:
+            statisticsFN (str): Path to the output CSV file.
+
+        Returns:
+            tuple: The opened text file handle and a csv writer bound to it.
+        """
+        writeHeader = not os.path.isfile(statisticsFN)
+        txtFile = open(statisticsFN, "a", newline="")
+        csvWriter = csv.writer(txtFile, delimiter=";", lineterminator="\n")
+        if writeHeader:
+            csvWriter.writerow(
+                [
+                    "polygons", "n", "shape", "position", "placement",
+                    "iterations", "translate", "alpha", "resize",
+                    "duration", "minperc", "maxperc", "avgperc", "stddevperc",
+                ]
+            )
+        return txtFile, csvWriter
+
+    def appendStatistics(
+        self,
+        csvWriter,
+        polygonShpFN: str,
+        randomIterations: int,
+        percTranslate: float,
+        maxAlpha: float,
+        maxResizePerc: float,
+        duration: float,
+        statistics: dict,
+    ):
+        """
+        Appends the statistics of one tuning test to the opened CSV file.
+
+        Parameters:
+            csvWriter:              The csv writer returned by openStatistics.
+            polygonShpFN (str):     Path to the input polygon vector file.
+            randomIterations (int): The number of random iterations of the test.
+            percTranslate (float):  The translation percentage of the test.
+            maxAlpha (float):       The maximum rotation angle of the test.
+            maxResizePerc (float):  The maximum resize percentage of the test.
+            duration (float):       The duration of the test in seconds.
+            statistics (dict):      The overlap statistics returned by calculateStatistics.
+        """
+        csvWriter.writerow(
+            [
+                polygonShpFN,
+                statistics["nPolygons"],
+                self.shape,
+                self.position,
+                self.placement,
+                randomIterations,
+                percTranslate,
+                maxAlpha,
+                maxResizePerc,
+                duration,
+                statistics["minPerc"],
+                statistics["maxPerc"],
+                statistics["avgPerc"],
+                statistics["stdDevPerc"],
+            ]
+        )
+
+    def run(
+        self,
+        workingFolder: str,
+        polygonShpFN: str,
+        idFieldName: str,
+        outputPlotFNBase: str,
+        statisticsFN: str,
+        numberOfTests: int,
+        minIterations: int,
+        maxIterations: int,
+        minTranslatePerc: float,
+        maxTranslatePerc: float,
+        minAlpha: float,
+        maxAlpha: float,
+        minResizePerc: float,
+        maxResizePerc: float,
+        progressDlg: GProgressDialog,
+        seed: int = None,
+        earlyStopMetric: str = "avgPerc",
+        patience: int = 30,
+        mode: str = "max",
+        screeningBudget: int = 0,
+    ):
+        """
+        Runs the random-search tuning tests.
+
+        For every test a hyperparameter configuration is drawn from the given
+        ranges, the simulation plots are generated for the configured shape,
+        position, and placement, and the overlap statistics of the run are
+        appended to the statistics CSV file.
+
+        The configurations are taken from a randomly shifted Halton sequence
+        instead of independent uniform draws, so a small test budget covers
+        the four-dimensional hyperparameter space without large voids or
+        near-duplicate configurations.
+
+        With a positive screeningBudget the run first probes each
+        hyperparameter axis one at a time while holding the other axes at
+        their midpoints, ranks the axes by the variance they induce in the
+        standard deviation of the overlap percentage, and then spends the
+        remaining budget only on the two most sensitive axes. Usually only a
+        subset of the hyperparameters matters, so the concentrated search
+        extracts more information from the same number of tests.
+
+        Parameters:
+            workingFolder (str):    Folder containing the input polygons; outputs are written there as well.
+                                    A trailing path separator is not required.
+            polygonShpFN (str):     File name of the input polygon vector file.
+            idFieldName (str):      Field name of the polygon ID in the input file.
+            outputPlotFNBase (str): Base file name of the generated plot files; the test number is appended.
+            statisticsFN (str):     File name of the output statistics CSV file.
+            numberOfTests (int):    The number of tuning tests to run.
+            seed (int):             Optional seed of the random generator; pass a value to reproduce a run.
+            earlyStopMetric (str):  The statistic watched by the early stop ("avgPerc" by default).
+            patience (int):         The number of tests without improvement after which the run stops.
+            mode (str):             "max" if a larger watched statistic is better, "min" otherwise.
+            screeningBudget (int):  The number of tests spent on one-at-a-time axis screening
+                                    before the main search; zero disables screening. Screening
+                                    runs at least two probes per axis (eight tests) and is
+                                    skipped when that would not leave any tests for the main
+                                    search.
+            minIterations (int):    The lower bound of the random iterations range.
+            maxIterations (int):    The upper bound of the random iterations range.
+            minTranslatePerc (float): The lower bound of the translation percentage range.
+            maxTranslatePerc (float): The upper bound of the translation percentage range.
+            minAlpha (float):       The lower bound of the maximum rotation angle range.
+            maxAlpha (float):       The upper bound of the maximum rotation angle range.
+            minResizePerc (float):  The lower bound of the resize percentage range.
+            maxResizePerc (float):  The upper bound of the resize percentage range.
+            progressDlg (GProgressDialog): A dialog to display the progress of the operation.
+
+        Raises:
+            ValueError: If the configured shape is not one of the accepted options.
+        """
+        rng = np.random.default_rng(seed)
+        workingPath = Path(workingFolder)
+        polygonFN = str(workingPath / polygonShpFN)
+        statisticsFN = str(workingPath / statisticsFN)
+        plotGenerator = PlotGenerator()
+        statisticsFile, statisticsWriter = self.openStatistics(statisticsFN)
+        firstTest = 0
+        try:
+            samplesPerAxis = max(2, screeningBudget // 4)
+            if 0 < screeningBudget and 4 * samplesPerAxis < numberOfTests:
+                screenSamples = screeningMatrix(samplesPerAxis)
+                screenStatistics = self.runTests(
+                    plotGenerator,
+                    statisticsWriter,
+                    polygonFN,
+                    polygonShpFN,
+                    idFieldName,
+                    workingFolder,
+                    outputPlotFNBase,
+                    *self.scaleConfigurations(
+                        screenSamples,
+                        minIterations, maxIterations,
+                        minTranslatePerc, maxTranslatePerc,
+                        minAlpha, maxAlpha,
+                        minResizePerc, maxResizePerc,
+                    ),
+                    progressDlg,
+                    earlyStopMetric,
+                    len(screenSamples) + 1,
+                    mode,
+                )
+                firstTest = len(screenSamples)
+                stdDevs = np.asarray([s["stdDevPerc"] for s in screenStatistics])
+                axisVariances = stdDevs.reshape(4, samplesPerAxis).var(axis=1)
+                sensitiveAxes = set(np.argsort(axisVariances)[-2:].tolist())
+                numberOfTests -= firstTest
+            else:
+                sensitiveAxes = {0, 1, 2, 3}
+            samples = haltonMatrix(numberOfTests, 4)
+            samples = np.mod(samples + rng.uniform(0.0, 1.0, size=4), 1.0)
+            for iDim in range(4):
+                if iDim not in sensitiveAxes:
+                    samples[:, iDim] = 0.5
+            self.runTests(
+                plotGenerator,
+                statisticsWriter,
+                polygonFN,
+                polygonShpFN,
+                idFieldName,
+                workingFolder,
+                outputPlotFNBase,
+                *self.scaleConfigurations(
+                    samples,
+                    minIterations, maxIterations,
+                    minTranslatePerc, maxTranslatePerc,
+                    minAlpha, maxAlpha,
+                    minResizePerc, maxResizePerc,
+                ),
+                progressDlg,
+                earlyStopMetric,
+                patience,
+                mode,
+                firstTest,
+            )
+        finally:
+            statisticsFile.close()
+
+    @staticmethod
+    def scaleConfigurations(
+        samples: np.ndarray,
+        minIterations: int,
+        maxIterations: int,
+        minTranslatePerc: float,
+        maxTranslatePerc: float,
+        minAlpha: float,
+        maxAlpha: float,
+        minResizePerc: float,
+        maxResizePerc: float,
+    ):
+        """
+        Scales unit-hypercube samples onto the hyperparameter ranges.
+
+        Parameters:
+            samples (np.ndarray): An (n, 4) sample matrix with values in [0, 1).
+            minIterations (int):    The lower bound of the random iterations range.
+            maxIterations (int):    The upper bound of the random iterations range.
+            minTranslatePerc (float): The lower bound of the translation percentage range.
+            maxTranslatePerc (float): The upper bound of the translation percentage range.
+            minAlpha (float):       The lower bound of the maximum rotation angle range.
+            maxAlpha (float):       The upper bound of the maximum rotation angle range.
+            minResizePerc (float):  The lower bound of the resize percentage range.
+            maxResizePerc (float):  The upper bound of the resize percentage range.
+
+        Returns:
+            tuple: The arrays of random iterations, translation percentages,
+                   rotation angles, and resize percentages, one value per test.
+        """
+        randomIterations = (
+            minIterations
+            + np.floor(samples[:, 0] * (maxIterations - minIterations + 1))
+        ).astype(np.int64)
+        randomIterations = np.minimum(randomIterations, maxIterations)
+        percTranslates = minTranslatePerc + (maxTranslatePerc - minTranslatePerc) * samples[:, 1]
+        alphas = minAlpha + (maxAlpha - minAlpha) * samples[:, 2]
+        resizePercs = minResizePerc + (maxResizePerc - minResizePerc) * samples[:, 3]
+        return randomIterations, percTranslates, alphas, resizePercs
+
+    def runTests(
+        self,
+        plotGenerator: PlotGenerator,
+        statisticsWriter,
+        polygonFN: str,
+        polygonShpFN: str,
+        idFieldName: str,
+        workingFolder: str,
+        outputPlotFNBase: str,
+        randomIterations: np.ndarray,
+        percTranslates: np.ndarray,
+        alphas: np.ndarray,
+        resizePercs: np.ndarray,
+        progressDlg: GProgressDialog,
+        earlyStopMetric: str = "avgPerc",
+        patience: int = 30,
+        mode: str = "max",
+        firstTest: int = 0,
+    ):
+        """
+        Executes the tuning tests and appends their statistics to the open file.
+
+        The run stops early when the watched statistic has not improved over
+        the best value seen so far for patience consecutive tests, so a long
+        tuning run does not keep generating plots after the search has
+        plateaued.
+
+        The hyperparameter configurations of all tests are drawn up front, so
+        one test is one row across the four sampled arrays.
+
+        Parameters:
+            plotGenerator (PlotGenerator): The generator running the tests.
+            statisticsWriter:       The csv writer returned by openStatistics.
+            polygonFN (str):        Full path to the input polygon vector file.
+            polygonShpFN (str):     File name of the input polygon vector file.
+            idFieldName (str):      Field name of the polygon ID in the input file.
+            workingFolder (str):    Folder where the generated plot files are written.
+            outputPlotFNBase (str): Base file name of the generated plot files.
+            randomIterations (np.ndarray): The sampled numbers of random iterations, one per test.
+            percTranslates (np.ndarray): The sampled translation percentages, one per test.
+            alphas (np.ndarray):    The sampled maximum rotation angles, one per test.
+            resizePercs (np.ndarray): The sampled maximum resize percentages, one per test.
+            progressDlg (GProgressDialog): A dialog to display the progress of the operation.
+            earlyStopMetric (str):  The statistic watched by the early stop.
+            patience (int):         The number of tests without improvement after which the run stops.
+            mode (str):             "max" if a larger watched statistic is better, "min" otherwise.
+            firstTest (int):        The number of tests already run; offsets the output file numbering.
+
+        Returns:
+            list: The statistics dictionary of every executed test, in test order.
+        """
+        shapes = {
+            "square": plotGenerator.generateSquarePlots,
+            "circle": plotGenerator.generateCirclePlots,
+            "rectangle": plotGenerator.generateRectanglePlots,
+            "ellipse": plotGenerator.generateEllipsePlots,
+        }
+        if self.shape == "best":
+            generatePlots = None
+        elif self.shape in shapes:
+            generatePlots = shapes[self.shape]
+        else:
+            GenSimPlotUtilities.raiseValueError(
+                f"Invalid plot shape option ({self.shape}).",
+                progressDlg,
+            )
+        bestMetric = -np.inf if mode == "max" else np.inf
+        sinceImprove = 0
+        testStatistics = []
+        for iTest in range(len(randomIterations)):
+            iterations = int(randomIterations[iTest])
+            percTranslate = float(percTranslates[iTest])
+            alpha = float(alphas[iTest])
+            resizePerc = float(resizePercs[iTest])
+            plotGenerator.setup(
+                randomIterations=iterations,
+                percTranslate=percTranslate,
+                maxAlpha=alpha,
+                maxResizePerc=resizePerc,
+            )
+            outputPlotFN = str(
+                Path(workingFolder) / f"{outputPlotFNBase}{firstTest + iTest + 1}.shp"
+            )
+            startTime = time.perf_counter()
+            if generatePlots is not None:
+                generatePlots(
+                    polygonFN, idFieldName, outputPlotFN, self.position, self.placement, progressDlg
+                )
+            else:
+                plotGenerator.generateBestPlots(
+                    polygonFN, idFieldName, outputPlotFN, progressDlg
+                )
+            duration = time.perf_counter() - startTime
+            statistics = plotGenerator.lastRunStatistics
+            if statistics is None:
+                statistics = self.calculateStatistics(outputPlotFN, progressDlg)
+            testStatistics.append(statistics)
+            self.appendStatistics(
+                statisticsWriter,
+                polygonShpFN,
+                iterations,
+                percTranslate,
+                alpha,
+                resizePerc,
+                duration,
+                statistics,
+            )
+            metric = statistics[earlyStopMetric]
+            if (metric > bestMetric) if mode == "max" else (metric < bestMetric):
+                bestMetric = metric
+                sinceImprove = 0
+            else:
+                sinceImprove += 1
+                if patience <= sinceImprove:
+                    break
+        return testStatistics